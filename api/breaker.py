@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+from enum import Enum
+
+import requests
+
+from constants import BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN, BREAKER_THRESHOLD
+from metrics import BREAKER_STATE, BREAKER_TRIPS
+
+
+class BreakerState(Enum):
+    """Circuit Breaker State Enum class, valued as exported in metrics"""
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Request refused without going over the network, as its endpoint's circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for an endpoint. After repeated failures, the circuit opens and requests fail fast instead of
+    hammering a struggling upstream. Once a cooldown elapses, a single half-open probe request decides whether to
+    close the circuit, or to reopen it with the cooldown doubled.
+
+    Arguments:
+        name (str):                 Endpoint name, used as metrics label
+        threshold (int):            Consecutive failures opening the circuit
+        cooldown (float):           Time in seconds the circuit stays open before a probe, after the first trip
+        max_cooldown (float):       Cooldown limit in seconds
+
+    Attributes:
+        state (BreakerState):       Circuit state
+        failures (int):             Consecutive failures while closed
+        trips (int):                Consecutive times the circuit opened, i.e. without a successful probe
+        opened_at (float):          Monotonic time the circuit last opened
+    """
+
+    def __init__(self,
+                 name: str,
+                 threshold: int = BREAKER_THRESHOLD,
+                 cooldown: float = BREAKER_COOLDOWN,
+                 max_cooldown: float = BREAKER_MAX_COOLDOWN):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def retry_in(self) -> float:
+        """
+        Time until the next probe is allowed
+        @return: Delay in seconds
+        """
+        cooldown = min(self.cooldown * 2 ** max(self.trips - 1, 0), self.max_cooldown)
+        return max(self.opened_at + cooldown - time.monotonic(), 0)
+
+    def allow(self) -> bool:
+        """
+        Determine if a request may be sent. Once the cooldown elapsed, the first request is let through as probe.
+        @return: True if the request may be sent
+        """
+        with self.lock:
+            if self.state is BreakerState.CLOSED:
+                return True
+            if self.state is BreakerState.OPEN and self.retry_in == 0:
+                logging.debug(f'Probing {self.name}')
+                self.transition(BreakerState.HALF_OPEN)
+                return True
+            return False  # Open, or a probe is already in flight
+
+    def succeeded(self):
+        with self.lock:
+            if self.state is not BreakerState.CLOSED:
+                logging.warning(f'Circuit to {self.name} closed')
+            self.failures = self.trips = 0
+            self.transition(BreakerState.CLOSED)
+
+    def cancelled(self):
+        """
+        Request given up without an outcome (e.g. out of time before being sent), a pending probe is allowed again
+        """
+        with self.lock:
+            if self.state is BreakerState.HALF_OPEN:
+                self.transition(BreakerState.OPEN)  # Cooldown already elapsed
+
+    def failed(self):
+        with self.lock:
+            self.failures += 1
+            if self.state is BreakerState.HALF_OPEN or self.failures >= self.threshold:
+                self.trips += 1
+                self.opened_at = time.monotonic()
+                self.transition(BreakerState.OPEN)
+                BREAKER_TRIPS.inc(endpoint=self.name)
+                logging.warning(f'Circuit to {self.name} opened, retrying in {self.retry_in:.0f}s')
+
+    def transition(self, state: BreakerState):
+        self.state = state
+        BREAKER_STATE.set(state.value, endpoint=self.name)
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from constants import CACHE_DIR, CACHE_MAX_SIZE
+
+
+@dataclass
+class CacheEntry:
+    """Data class to represent a cached HTTP response"""
+    url: str
+    body: str
+    etag: str = None
+    last_modified: str = None
+    fetched: float = 0.0
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched
+
+    def json(self) -> dict:
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache keyed by URL, bounded in size by evicting the least recently used entries.
+    The directory is created on the first write, as the process may have dropped privileges by then. If it can't be
+    written to, responses simply aren't cached.
+
+    Arguments:
+        directory (str):        Cache directory
+        max_size (int):         Maximum total size of cached files in bytes
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_size: int = CACHE_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+
+    def path(self, url: str) -> str:
+        """
+        Get path to the cache file of a given URL
+        @param url: Request URL
+        @return: Path to cache file
+        """
+        return os.path.join(self.directory, f'{hashlib.sha1(url.encode()).hexdigest()}.json')
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Read cached response for URL, if any
+        @param url: Request URL
+        @return: Cache entry
+        """
+        path = self.path(url)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'r') as file:
+                entry = CacheEntry(**json.load(file))
+            os.utime(path)  # Mark as recently used
+            return entry
+        except (OSError, ValueError, TypeError):
+            logging.warning(f'Discarding unreadable cache entry for {url}')
+            self.delete(url)
+            return None
+
+    def put(self, url: str, body: str, etag: str = None, last_modified: str = None) -> CacheEntry:
+        """
+        Store response for URL
+        @param url: Request URL
+        @param body: Response body
+        @param etag: ETag response header
+        @param last_modified: Last-Modified response header
+        @return: Cache entry
+        """
+        entry = CacheEntry(url, body, etag, last_modified, time.time())
+        self.write(entry)
+        self.evict()
+        return entry
+
+    def touch(self, entry: CacheEntry) -> CacheEntry:
+        """
+        Mark entry as fresh after a successful revalidation (i.e. 304 Not Modified)
+        @param entry: Cache entry
+        @return: Cache entry
+        """
+        entry.fetched = time.time()
+        self.write(entry)
+        return entry
+
+    def write(self, entry: CacheEntry):
+        path = self.path(entry.url)
+        tmp_path = f'{path}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'w') as file:
+                json.dump(entry.__dict__, file)
+            os.replace(tmp_path, path)  # Atomic, readers never see a partial file
+        except OSError as e:
+            logging.warning(f'Unable to write cache entry for {entry.url}: {e}')
+
+    def delete(self, url: str):
+        try:
+            os.remove(self.path(url))
+        except OSError:
+            pass
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits within its maximum size
+        """
+        try:
+            names = os.listdir(self.directory)
+        except OSError:  # Never written to
+            return
+        files = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if name.endswith('.json'):
+                try:
+                    stat = os.stat(path)
+                except OSError:  # Removed by a concurrent eviction
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(file[1] for file in files)
+        for _, file_size, path in sorted(files):
+            if size <= self.max_size:
+                break
+            logging.debug(f'Evicting cache entry {path}')
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= file_size
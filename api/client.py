@@ -0,0 +1,246 @@
+import logging
+import random
+import threading
+import time
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from api.breaker import CircuitBreaker, CircuitOpenError
+from api.cache import ResponseCache
+from api.limiter import DeadlineExceeded, Lane, RateLimiter
+from constants import (BASE_URL, HTTP_BACKOFF, HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_RETRY_STATUSES, HTTP_TIMEOUT,
+                       CONSTRUCTOR_STANDINGS_URL, DRIVER_STANDINGS_URL, LAST_GP_RESULTS_URL, QUALIFYING_RESULTS_URL,
+                       SPRINT_URL)
+from metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS, JSON_DECODE_SECONDS, CACHE_HITS
+from version import __version__
+
+
+def endpoint(url: str) -> str:
+    """
+    Get endpoint name from URL, i.e. without the base URL & season. Used as metrics label.
+    @param url: Request URL
+    @return: Endpoint name
+    """
+    path = url.replace(BASE_URL.format(''), '').split('?')[0]
+    return path.partition('/')[2].strip('/') or 'schedule'
+
+
+RESULTS_ENDPOINTS = {endpoint(url.format('current')) for url in (LAST_GP_RESULTS_URL, DRIVER_STANDINGS_URL,
+                                                                 CONSTRUCTOR_STANDINGS_URL, QUALIFYING_RESULTS_URL,
+                                                                 SPRINT_URL)}
+
+
+def lane(url: str) -> Lane:
+    """
+    Get the rate limiter lane of a request, results & standings are served first
+    @param url: Request URL
+    @return: Priority lane
+    """
+    return Lane.RESULTS if endpoint(url) in RESULTS_ENDPOINTS else Lane.BACKGROUND
+
+
+class Client:
+    """
+    HTTP client sharing a single keep-alive connection pool for all API requests.
+    Failed requests (connection errors, 429 & 5xx) are retried with jittered exponential backoff. Endpoints failing
+    repeatedly are shut off by a circuit breaker, so a struggling upstream isn't hammered on every refresh.
+
+    Arguments:
+        cache (api.ResponseCache):      Response cache
+        retries (int):                  Maximum number of retries per request
+        backoff (float):                Backoff base delay in seconds
+        transport (BaseAdapter):        Transport adapter requests are sent through, defaults to the network
+        limiter (api.RateLimiter):      Rate limiter every request waits on, defaults to the API's limits over the
+                                        network and none otherwise
+
+    Attributes:
+        session (requests.Session):     Session holding the connection pool
+        timings (dict):                 Duration of the last request to each URL, in seconds
+        breakers (dict):                Endpoint name -> Circuit breaker
+    """
+
+    def __init__(self,
+                 cache: ResponseCache = None,
+                 retries: int = HTTP_RETRIES,
+                 backoff: float = HTTP_BACKOFF,
+                 transport: BaseAdapter = None,
+                 limiter: RateLimiter = None):
+        self.cache = cache if cache is not None else ResponseCache()
+        self.limiter = limiter if limiter is not None or transport is not None else RateLimiter()
+        self.retries = retries
+        self.backoff = backoff
+        self.timings = {}
+        self.breakers = {}
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json',
+                                     'Accept-Encoding': 'gzip, deflate',
+                                     'User-Agent': f'f1-led-leaderboard/{__version__}'})
+        if transport is None:
+            transport = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('https://', transport)
+        self.session.mount('http://', transport)
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of an endpoint
+        @param name: Endpoint name
+        @return: Circuit breaker
+        """
+        with self.lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name)
+            return self.breakers[name]
+
+    def get(self,
+            url: str,
+            headers: dict = None,
+            timeout: Tuple[float, float] = HTTP_TIMEOUT,
+            deadline: Optional[float] = None) -> requests.Response:
+        """
+        GET request, failing fast while the endpoint's circuit is open
+        @param url: Request URL
+        @param headers: Additional request headers
+        @param timeout: Connect & read timeouts in seconds
+        @param deadline: Monotonic time by which the request, retries included, must be done
+        @return: Response
+        @raise CircuitOpenError: Endpoint's circuit is open
+        @raise DeadlineExceeded: Deadline passed
+        """
+        self.remaining(deadline)
+        breaker = self.breaker(endpoint(url))
+        if not breaker.allow():
+            raise CircuitOpenError(f'Circuit to {breaker.name} open, retrying in {breaker.retry_in:.0f}s')
+        try:
+            response = self.send(url, headers, timeout, deadline)
+        except DeadlineExceeded:
+            breaker.cancelled()  # Out of our own time budget, which says nothing about the endpoint's health
+            raise
+        except Exception:
+            breaker.failed()
+            raise
+        if response.status_code in HTTP_RETRY_STATUSES:
+            breaker.failed()
+        else:
+            breaker.succeeded()
+        return response
+
+    def send(self,
+             url: str,
+             headers: dict = None,
+             timeout: Tuple[float, float] = HTTP_TIMEOUT,
+             deadline: Optional[float] = None) -> requests.Response:
+        """
+        GET request, retried on connection errors and retryable status codes. Timeouts are cut short by the deadline.
+        @param url: Request URL
+        @param headers: Additional request headers
+        @param timeout: Connect & read timeouts in seconds
+        @param deadline: Monotonic time by which the request, retries included, must be done
+        @return: Response
+        """
+        name = endpoint(url)
+        for attempt in range(self.retries + 1):
+            if self.limiter is not None:
+                self.limiter.acquire(lane(url), deadline)
+            remaining = self.remaining(deadline)
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, headers=headers,
+                                            timeout=tuple(min(value, remaining) for value in timeout))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                HTTP_REQUESTS.inc(endpoint=name, status='error')
+                self.remaining(deadline)  # Timed out as the deadline cut the request short
+                if attempt == self.retries:
+                    raise
+                logging.warning(f'Request to {url} failed: {e}')
+                self.sleep(self.delay(attempt), deadline)
+                continue
+            finally:
+                self.timings[url] = time.monotonic() - start
+                HTTP_REQUEST_SECONDS.observe(self.timings[url], endpoint=name)
+
+            HTTP_REQUESTS.inc(endpoint=name, status=str(response.status_code))
+
+            logging.debug(f'GET {url} {response.status_code} ({self.timings[url] * 1000:.0f}ms)')
+            if response.status_code not in HTTP_RETRY_STATUSES or attempt == self.retries:
+                return response
+            logging.warning(f'Request to {url} returned {response.status_code}, retrying')
+            self.sleep(self.delay(attempt, response.headers.get('Retry-After')), deadline)
+
+    @staticmethod
+    def remaining(deadline: Optional[float]) -> float:
+        """
+        Time left until the deadline
+        @param deadline: Monotonic time, None for no deadline
+        @return: Time in seconds
+        @raise DeadlineExceeded: Deadline passed
+        """
+        if deadline is None:
+            return float('inf')
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded('Refresh time budget exhausted')
+        return remaining
+
+    def sleep(self, delay: float, deadline: Optional[float]):
+        if delay >= self.remaining(deadline):
+            raise DeadlineExceeded(f'Refresh time budget exhausted before retrying in {delay:.1f}s')
+        time.sleep(delay)
+
+    def delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Delay before next retry. Honors the server's Retry-After header, otherwise full-jitter exponential backoff.
+        @param attempt: Attempt number, starting at 0
+        @param retry_after: Retry-After response header
+        @return: Delay in seconds
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    def get_json(self,
+                 url: str,
+                 ttl: float = 0,
+                 timeout: Tuple[float, float] = HTTP_TIMEOUT,
+                 deadline: Optional[float] = None) -> dict:
+        """
+        Get JSON response from URL. Cached responses are served while fresh, and revalidated with the server
+        (ETag/If-Modified-Since) once stale.
+        @param url: Request URL
+        @param ttl: Time in seconds a cached response is served without revalidation
+        @param timeout: Connect & read timeouts in seconds
+        @param deadline: Monotonic time by which the request, retries included, must be done
+        @return: JSON response as a dict
+        """
+        name = endpoint(url)
+        entry = self.cache.get(url)
+        if entry is not None and entry.age < ttl:
+            logging.debug(f'Serving {url} from cache')
+            CACHE_HITS.inc(endpoint=name, result='fresh')
+            with JSON_DECODE_SECONDS.time(endpoint=name):
+                return entry.json()
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = self.get(url, headers, timeout, deadline)
+        if response.status_code == 304 and entry is not None:
+            logging.debug(f'{url} not modified')
+            CACHE_HITS.inc(endpoint=name, result='revalidated')
+            with JSON_DECODE_SECONDS.time(endpoint=name):
+                return self.cache.touch(entry).json()
+
+        response.raise_for_status()
+        with JSON_DECODE_SECONDS.time(endpoint=name):
+            body = response.json()  # Decoded before caching, so a truncated payload isn't cached
+        self.cache.put(url, response.text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return body
+
+    def close(self):
+        self.session.close()
@@ -1,12 +1,18 @@
+import copy
 import datetime
 import logging
+import os
+import pickle
 import time
-from dataclasses import dataclass, field
-from typing import List, Optional
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Set
 
 import constants
+from api.client import Client, DeadlineExceeded
+from api.pager import paginate
+from api.request_scope import RequestScope
 from data.circuit import Circuit
 from data.constructor import Constructor
 from data.driver import Driver
@@ -17,14 +23,64 @@ from data.qualifying import Qualifying, QualifyingResultItem, Sprint
 from data.session_status import SessionStatus
 from data.standings import Standings, StandingsItem
 from data.update_status import UpdateStatus
-from utils import race_weekend, get_session_status, is_wcc_champion, is_wdc_champion
+from metrics import PARSE_SECONDS, REFRESH_OVERRUNS, REFRESH_SECONDS, timed
+from utils import get_session_status, is_wcc_champion, is_wdc_champion
+from version import __version__
+
+
+def circuit(race: dict) -> Circuit:
+    """
+    Get the shared circuit of a race
+    @param race: Race from a response
+    @return: Circuit
+    """
+    location = race['Circuit']['Location']
+    return Circuit.get(race['Circuit']['circuitId'], race['Circuit']['circuitName'], location['locality'],
+                       location['country'])
+
+
+def results_signature(response: dict) -> Optional[tuple]:
+    """
+    Signature of race results, changing when a new race's results are published
+    @param response: Results response, complete or probe
+    @return: Season & round
+    """
+    races = response['MRData']['RaceTable']['Races']
+    return (races[0]['season'], races[0]['round']) if races else None
+
+
+def standings_signature(response: dict) -> Optional[tuple]:
+    """
+    Signature of standings, changing when points are awarded (race or sprint)
+    @param response: Standings response, complete or probe
+    @return: Season, round, number of drivers & leader's points
+    """
+    lists = response['MRData']['StandingsTable']['StandingsLists']
+    if not lists:
+        return None
+    return lists[0]['season'], lists[0]['round'], response['MRData']['total'], lists[0]['DriverStandings'][0]['points']
 
 
 @dataclass
 class Data:
     """
-    Data class consisting of all the data to be displayed on matrix
+    Data class consisting of all the data to be displayed on matrix.
+    On update, only the datasets whose upstream data changed, as detected by cheap probes, are refetched & rebuilt.
+    Snapshots persisted after every refresh let the next boot render straight away, then revalidate in the background.
     """
+    # Dataset -> (Endpoint, Probe endpoint, Signature function)
+    PROBES = {'last_gp': (constants.LAST_GP_RESULTS_URL, constants.LAST_GP_PROBE_URL, results_signature),
+              'standings': (constants.DRIVER_STANDINGS_URL, constants.DRIVER_STANDINGS_PROBE_URL, standings_signature)}
+    # Fields the boards are rendered from
+    DISPLAYED = ('constructor_standings', 'driver_standings', 'last_gp', 'next_gp', 'schedule', 'season', 'status')
+    # Fields not persisted in snapshots
+    TRANSIENT = ('client', 'scope', 'restored', 'deadline', 'deferred')
+    # Dataset -> Datasets it is built from
+    DEPENDENCIES = {'last_gp': (),
+                    'standings': (),
+                    'schedule': ('last_gp',),  # Remaining races
+                    'champions': ('standings', 'schedule')}
+
     constructors: dict = field(default_factory=dict)
     drivers: dict = field(default_factory=dict)
     constructor_standings: Standings = None
@@ -35,80 +91,299 @@ class Data:
     season: str = 'current'
     status: UpdateStatus = UpdateStatus.SUCCESS
     last_updated: float = None
+    client: Client = field(default_factory=Client, repr=False, compare=False)
+    scope: RequestScope = field(default_factory=RequestScope, init=False, repr=False, compare=False)
+    signatures: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    restored: bool = field(default=False, init=False, repr=False, compare=False)
+    deadline: float = field(default=None, init=False, repr=False, compare=False)
+    deferred: set = field(default_factory=set, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self.determine_season()
-        self.fetch_constructors()
-        self.fetch_drivers()
-        self.constructor_standings = self.fetch_constructor_standings()
-        self.driver_standings = self.fetch_driver_standings()
-        self.last_gp = self.fetch_last_gp()
-        self.schedule = self.fetch_schedule()
-        self.next_gp = self.fetch_next_gp()
-        self.fetch_qualifying()
-        self.fetch_sprint()
-        self.champions()
+        with self.refresh_cycle():
+            self.determine_season()
+            # Independent endpoints are fetched concurrently, then parsed in dependency order
+            self.prefetch(constants.CONSTRUCTORS_URL,
+                          constants.DRIVER_STANDINGS_URL,
+                          constants.CONSTRUCTOR_STANDINGS_URL,
+                          constants.LAST_GP_RESULTS_URL,
+                          constants.SCHEDULE_URL)
+            self.fetch_constructors()
+            self.fetch_drivers()
+            self.constructor_standings = self.fetch_constructor_standings()
+            self.driver_standings = self.fetch_driver_standings()
+            self.last_gp = self.fetch_last_gp()
+            self.schedule = self.fetch_schedule()
+            self.next_gp = self.fetch_next_gp()
+            with self.deferrable('sessions'):  # Not worth delaying the first boards for
+                self.prefetch(*self.session_urls())
+                self.fetch_qualifying()
+                self.fetch_sprint()
+            self.champions()
+            self.signatures = {dataset: signature(self.get_json(url))
+                               for dataset, (url, _, signature) in self.PROBES.items()}
 
         self.last_updated = time.time()
 
     def update(self):
         """
-        Updates data
+        Updates the datasets whose upstream data changed. Datasets which couldn't be fetched within the refresh cycle's
+        time budget keep their current data, and are deferred to the next refresh.
         """
-        self.constructor_standings = self.fetch_constructor_standings()
-        self.driver_standings = self.fetch_driver_standings()
-        self.last_gp = self.fetch_last_gp()
-        self.schedule = self.fetch_schedule()
-        self.next_gp = self.fetch_next_gp()
-        self.fetch_qualifying()
-        self.fetch_sprint()
+        with self.refresh_cycle():
+            signatures = dict(self.signatures)
+            stale = self.invalidated(self.probe())
+            logging.debug(f'Stale datasets: {", ".join(sorted(stale)) or "none"}')
+
+            urls = []
+            if 'standings' in stale:
+                urls += [constants.CONSTRUCTOR_STANDINGS_URL, constants.DRIVER_STANDINGS_URL]
+            if 'last_gp' in stale:
+                urls.append(constants.LAST_GP_RESULTS_URL)
+            if 'schedule' in stale:
+                urls.append(constants.SCHEDULE_URL)
+            self.prefetch(*urls)
+
+            if 'standings' in stale:
+                with self.deferrable('standings'):
+                    constructor_standings = self.fetch_constructor_standings()
+                    self.driver_standings = self.fetch_driver_standings()
+                    self.constructor_standings = constructor_standings
+            if 'last_gp' in stale:
+                with self.deferrable('last_gp'):
+                    self.last_gp = self.fetch_last_gp()
+            if 'schedule' in stale and 'last_gp' not in self.deferred:
+                with self.deferrable('last_gp'):  # Rebuilt along with the last GP on the next refresh
+                    self.schedule = self.fetch_schedule()  # Re-sliced from the cached schedule
+            elif self.schedule:
+                self.schedule = [self.schedule[0].refreshed(), *self.schedule[1:]]
+            self.next_gp = self.fetch_next_gp()
+            with self.deferrable('sessions'):  # Fetched on the next refresh, as long as their grid is missing
+                self.prefetch(*self.session_urls())
+                self.fetch_qualifying()
+                self.fetch_sprint()
+            if 'champions' in stale:
+                self.champions()
+
+            for dataset in self.deferred.intersection(self.PROBES):
+                self.signatures[dataset] = signatures.get(dataset)  # Detected as changed again
 
         self.last_updated = time.time()
 
+    def probe(self) -> Set[str]:
+        """
+        Probe the upstream data of datasets for changes
+        @return: Datasets whose upstream data changed
+        """
+        self.prefetch(*[probe for _, probe, _ in self.PROBES.values()])
+        changed = set()
+        for dataset, (_, probe, signature) in self.PROBES.items():
+            value = signature(self.get_json(probe))
+            if value != self.signatures.get(dataset):
+                self.signatures[dataset] = value
+                changed.add(dataset)
+        return changed
+
+    def invalidated(self, changed: Set[str]) -> Set[str]:
+        """
+        Datasets to rebuild, i.e. the changed datasets & every dataset built from them
+        @param changed: Datasets whose upstream data changed
+        @return: Stale datasets
+        """
+        stale = set(changed)
+        while True:
+            dependents = {dataset for dataset, dependencies in self.DEPENDENCIES.items()
+                          if stale.intersection(dependencies)} - stale
+            if not dependents:
+                return stale
+            stale |= dependents
+
+    def refreshed(self) -> 'Data':
+        """
+        Build an updated copy of the data, leaving this instance untouched
+        @return: Updated Data snapshot
+        """
+        snapshot = copy.copy(self)
+        snapshot.scope = RequestScope()
+        snapshot.signatures = dict(self.signatures)
+        snapshot.restored = False
+        snapshot.deferred = set()
+        snapshot.status = UpdateStatus.SUCCESS
+        snapshot.update()
+        return snapshot
+
+    def degraded(self, status: UpdateStatus) -> 'Data':
+        """
+        Copy of the data flagged with a failed update's status. The datasets are served as is, growing stale.
+        @param status: Update status
+        @return: Data snapshot
+        """
+        snapshot = copy.copy(self)
+        snapshot.status = status
+        return snapshot
+
+    def same(self, other: 'Data') -> bool:
+        """
+        Determine if another snapshot displays the same datasets, i.e. the boards would be rendered identically
+        @param other: Data snapshot
+        @return: True if the displayed datasets are equal
+        """
+        return all(getattr(self, name) == getattr(other, name) for name in self.DISPLAYED)
+
+    @property
+    def age(self) -> float:
+        """
+        Time since the datasets were last successfully updated
+        @return: Age in seconds
+        """
+        return time.time() - self.last_updated if self.last_updated is not None else 0.0
+
+    def save_snapshot(self, path: str = constants.SNAPSHOT_FILE) -> bool:
+        """
+        Persist the datasets to disk, so the next boot can render them without waiting on the network
+        @param path: Snapshot file
+        @return: True if the snapshot was written
+        """
+        state = {name: value for name, value in vars(self).items() if name not in self.TRANSIENT}
+        tmp_path = f'{path}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(tmp_path, 'wb') as file:
+                pickle.dump((__version__, state), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)  # Atomic, a power cut never leaves a partial snapshot
+        except (OSError, pickle.PicklingError) as e:
+            logging.warning(f'Unable to save data snapshot: {e}')
+            return False
+        return True
+
+    @staticmethod
+    def load_snapshot(path: str = constants.SNAPSHOT_FILE, client: Client = None) -> Optional['Data']:
+        """
+        Restore the datasets persisted by the last successful refresh, without any request.
+        Snapshots saved by another version are discarded, as the data model may have changed.
+        @param path: Snapshot file
+        @param client: API client used by subsequent refreshes
+        @return: Restored Data, to be revalidated, or None
+        """
+        try:
+            with open(path, 'rb') as file:
+                version, state = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # Corrupt or incompatible snapshot
+            logging.warning(f'Unable to load data snapshot: {e}')
+            return None
+        if version != __version__:
+            logging.debug(f'Discarding data snapshot from v{version}')
+            return None
+
+        data = Data.__new__(Data)  # Bypasses __post_init__, i.e. the initial fetch
+        data.__dict__.update(state)
+        data.client = client if client is not None else Client()
+        data.scope = RequestScope()
+        data.restored, data.deadline, data.deferred = True, None, set()
+        return data
+
+    @contextmanager
+    def refresh_cycle(self):
+        """
+        Scope of a refresh cycle, bounded by the refresh time budget. Identical requests within the cycle are only
+        fetched once.
+        """
+        start = time.monotonic()
+        self.deadline = start + constants.REFRESH_BUDGET
+        try:
+            yield
+        finally:
+            REFRESH_SECONDS.observe(time.monotonic() - start)
+            logging.debug(f'Refresh cycle: {self.scope.fetched} requests fetched, {self.scope.saved} coalesced')
+            self.scope.clear()
+            self.deadline = None
+
+    @contextmanager
+    def deferrable(self, dataset: str):
+        """
+        Scope of a dataset's rebuild, deferred to the next refresh if the time budget runs out
+        @param dataset: Dataset name
+        """
+        try:
+            yield
+        except DeadlineExceeded as e:
+            logging.warning(f'Deferring {dataset} to the next refresh: {e}')
+            REFRESH_OVERRUNS.inc(dataset=dataset)
+            self.deferred.add(dataset)
+
+    def prefetch(self, *urls: str):
+        """
+        Concurrently fetch the given endpoints, holding their responses for the remainder of the refresh cycle
+        @param urls: Endpoint URL templates
+        """
+        if urls:
+            with ThreadPoolExecutor(max_workers=constants.HTTP_POOL_SIZE) as executor:
+                for future in [executor.submit(self.get_json, url) for url in urls]:
+                    try:
+                        future.result()
+                    except DeadlineExceeded:
+                        pass  # Responses fetched in time are still used, parsers defer the others
+
+    def get_json(self, url: str) -> dict:
+        """
+        Get JSON response for the season from the given endpoint, with every page of records
+        @param url: Endpoint URL template
+        @return: JSON response as a dict
+        """
+        ttl, timeout = constants.CACHE_TTL.get(url, 0), constants.HTTP_TIMEOUTS.get(url, constants.HTTP_TIMEOUT)
+        url = url.format(self.season)
+        return self.scope.get(url, lambda: paginate(lambda page: self.client.get_json(page, ttl, timeout,
+                                                                                       self.deadline), url))
+
     def determine_season(self):
         """
         Determine which season year to query for
         """
-        response = requests.get(constants.CONSTRUCTOR_STANDINGS_URL.format(self.season)).json()
+        response = self.get_json(constants.CONSTRUCTOR_STANDINGS_URL)
 
         if len(list(response['MRData']['StandingsTable']['StandingsLists'])) < 1:
             # current year season not yet started, roll back to query last season's stats
             self.season = str(datetime.datetime.today().year - 1)
             logging.debug(f'{datetime.datetime.today().year} season data not yet available. Fetching {self.season} results.' )
 
+    @timed(PARSE_SECONDS, dataset='constructors')
     def fetch_constructors(self):
         """
         Fetch list of constructors
         """
         logging.debug('Fetching Constructors List')
 
-        response = requests.get(constants.CONSTRUCTORS_URL.format(self.season)).json()
+        response = self.get_json(constants.CONSTRUCTORS_URL)
         constructors = response['MRData']['ConstructorTable']['Constructors']
 
         for constructor in constructors:
-            self.constructors[constructor['constructorId']] = Constructor(constructor['constructorId'],
-                                                                          constructor['name'],
-                                                                          constructor['nationality'])
+            self.constructors[constructor['constructorId']] = Constructor.get(constructor['constructorId'],
+                                                                              constructor['name'],
+                                                                              constructor['nationality'])
 
+    @timed(PARSE_SECONDS, dataset='drivers')
     def fetch_drivers(self):
         """
         Fetch list of drivers
         """
         logging.debug('Fetching Drivers List')
 
-        response = requests.get(constants.DRIVER_STANDINGS_URL.format(self.season)).json()
+        response = self.get_json(constants.DRIVER_STANDINGS_URL)
         drivers = response['MRData']['StandingsTable']['StandingsLists'][0]['DriverStandings']
 
-        for driver in drivers:
-            self.drivers[driver['Driver']['driverId']] = Driver(driver['Driver']['driverId'],
-                                                                driver['Driver']['givenName'],
-                                                                driver['Driver']['familyName'],
-                                                                driver['Driver']['code'],
-                                                                int(driver['Driver']['permanentNumber']),
-                                                                driver['Driver']['nationality'],
-                                                                self.constructors.get(
-                                                                    driver['Constructors'][0]['constructorId']))
-
+        for standing in drivers:
+            driver = standing['Driver']
+            self.drivers[driver['driverId']] = Driver.get(driver['driverId'],
+                                                          driver['givenName'],
+                                                          driver['familyName'],
+                                                          driver['code'],
+                                                          int(driver['permanentNumber']),
+                                                          driver['nationality'],
+                                                          self.constructors.get(
+                                                              standing['Constructors'][0]['constructorId']))
+
+    @timed(PARSE_SECONDS, dataset='constructor_standings')
     def fetch_constructor_standings(self) -> Standings:
         """
         Fetch current constructor standings
@@ -116,13 +391,14 @@ class Data:
         """
         logging.debug('Fetching Constructor Standings')
 
-        response = requests.get(constants.CONSTRUCTOR_STANDINGS_URL.format(self.season)).json()
+        response = self.get_json(constants.CONSTRUCTOR_STANDINGS_URL)
         constructors = response['MRData']['StandingsTable']['StandingsLists'][0]['ConstructorStandings']
 
         return Standings([StandingsItem(self.constructors.get(constructor['Constructor']['constructorId']),
                                         int(constructor['position']),
                                         float(constructor['points'])) for constructor in constructors])
 
+    @timed(PARSE_SECONDS, dataset='driver_standings')
     def fetch_driver_standings(self) -> Standings:
         """
         Fetch current driver standings
@@ -130,13 +406,14 @@ class Data:
         """
         logging.debug('Fetching Driver Standings')
 
-        response = requests.get(constants.DRIVER_STANDINGS_URL.format(self.season)).json()
+        response = self.get_json(constants.DRIVER_STANDINGS_URL)
         drivers = response['MRData']['StandingsTable']['StandingsLists'][0]['DriverStandings']
 
         return Standings([StandingsItem(self.drivers.get(driver['Driver']['driverId']),
                                         i,
                                         float(driver['points'])) for i, driver in enumerate(drivers, 1)])
 
+    @timed(PARSE_SECONDS, dataset='last_gp')
     def fetch_last_gp(self) -> GPResult:
         """
         Fetch last grand prix's race results
@@ -144,26 +421,20 @@ class Data:
         """
         logging.debug("Fetching Last Grand Prix's data")
 
-        response = requests.get(constants.LAST_GP_RESULTS_URL.format(self.season)).json()
-        gp = response['MRData']['RaceTable']['Races'][0]
-        gp = GrandPrix(int(gp['round']),
-                       gp['raceName'],
-                       Circuit(gp['Circuit']['circuitId'],
-                               gp['Circuit']['circuitName'],
-                               gp['Circuit']['Location']['locality'],
-                               gp['Circuit']['Location']['country']),
-                       gp['date'],
-                       gp['time'])
-
-        results = response['MRData']['RaceTable']['Races'][0]['Results']
-        dr = [DriverResult(self.drivers.get(result['Driver']['driverId']),
-                           int(result['position']),
-                           float(result['points']),
-                           int(result['laps']),
-                           Status(result['status']),
-                           result['Time']['time'] if Status(result['status']) == Status.FINISHED else None,
-                           result['FastestLap']['rank'] == '1' if result.get('FastestLap') is not None else False)
-              for result in results]
+        response = self.get_json(constants.LAST_GP_RESULTS_URL)
+        race = response['MRData']['RaceTable']['Races'][0]
+        gp = GrandPrix(int(race['round']), race['raceName'], circuit(race), race['date'], race['time'])
+
+        dr = []
+        for result in race['Results']:
+            status = Status(result['status'])
+            dr.append(DriverResult(self.drivers.get(result['Driver']['driverId']),
+                                   int(result['position']),
+                                   float(result['points']),
+                                   int(result['laps']),
+                                   status,
+                                   result['Time']['time'] if status is Status.FINISHED else None,
+                                   result.get('FastestLap', {}).get('rank') == '1'))
         return GPResult(gp, dr)
 
     def fetch_next_gp(self) -> Optional[GrandPrix]:
@@ -176,16 +447,34 @@ class Data:
         if self.schedule:
             return self.schedule[0]
 
-    def fetch_qualifying(self):
+    def session_urls(self) -> List[str]:
         """
-        Fetch next grand prix's qualifying data
+        Endpoints of the next grand prix's sessions which have taken place, and whose results were not fetched yet
+        @return: List of endpoint URL templates
         """
+        def awaited(session) -> bool:
+            return session is not None and session.grid is None and \
+                get_session_status(session.dt, session.duration) is SessionStatus.FINISHED
+
+        urls = []
         if self.next_gp is not None:
-            status = get_session_status(self.next_gp.qualifying.dt)
+            if awaited(self.next_gp.qualifying):
+                urls.append(constants.QUALIFYING_RESULTS_URL)
+            if awaited(self.next_gp.sprint):
+                urls.append(constants.SPRINT_URL)
+        return urls
+
+    @timed(PARSE_SECONDS, dataset='qualifying')
+    def fetch_qualifying(self):
+        """
+        Fetch next grand prix's qualifying data, unless already fetched
+        """
+        if self.next_gp is not None and self.next_gp.qualifying.grid is None:
+            status = get_session_status(self.next_gp.qualifying.dt, self.next_gp.qualifying.duration)
             if status is SessionStatus.FINISHED:
                 logging.debug('Fetching Qualifying Results')
 
-                response = requests.get(constants.QUALIFYING_RESULTS_URL.format(self.season)).json()
+                response = self.get_json(constants.QUALIFYING_RESULTS_URL)
 
                 if int(response['MRData']['total']) > 0:  # Qualifying results available
                     results = response['MRData']['RaceTable']['Races'][0]['QualifyingResults']
@@ -196,16 +485,18 @@ class Data:
                                                  result.get('Q3', None)) for result in results]
                     self.next_gp.qualifying.grid = grid
 
+    @timed(PARSE_SECONDS, dataset='sprint')
     def fetch_sprint(self):
         """
-        Fetch next grand prix's sprint data
+        Fetch next grand prix's sprint data, unless already fetched
         """
-        if self.next_gp is not None and self.next_gp.sprint is not None:  # Sprint taking place
-            status = get_session_status(self.next_gp.sprint.dt)
+        if self.next_gp is not None and self.next_gp.sprint is not None and \
+                self.next_gp.sprint.grid is None:  # Sprint taking place
+            status = get_session_status(self.next_gp.sprint.dt, self.next_gp.sprint.duration)
             if status is SessionStatus.FINISHED:
                 logging.debug('Fetching Sprint Results')
 
-                response = requests.get(constants.SPRINT_URL.format(self.season)).json()
+                response = self.get_json(constants.SPRINT_URL)
 
                 if int(response['MRData']['total']) > 0:  # Sprint results available
                     results = response['MRData']['RaceTable']['Races'][0]['SprintResults']
@@ -213,6 +504,7 @@ class Data:
                                                  self.drivers.get(result['Driver']['driverId'])) for result in results]
                     self.next_gp.sprint.grid = grid
 
+    @timed(PARSE_SECONDS, dataset='schedule')
     def fetch_schedule(self) -> List[GrandPrix]:
         """
         Fetch list of remaining grand prix in the current season
@@ -220,16 +512,13 @@ class Data:
         """
         logging.debug('Fetching Grand Prix Schedule')
 
-        response = requests.get(constants.SCHEDULE_URL.format(self.season)).json()
+        response = self.get_json(constants.SCHEDULE_URL)
         schedule = response['MRData']['RaceTable']['Races']
 
         return [
             GrandPrix(int(gp['round']),
                       gp['raceName'],
-                      Circuit(gp['Circuit']['circuitId'],
-                              gp['Circuit']['circuitName'],
-                              gp['Circuit']['Location']['locality'],
-                              gp['Circuit']['Location']['country']),
+                      circuit(gp),
                       gp['date'],
                       gp['time'],
                       Qualifying(gp['Qualifying']['date'],
@@ -242,17 +531,10 @@ class Data:
         """
         Determine if there are champions for WDC & WCC
         """
-        self.driver_standings.items[0].champion = is_wdc_champion(self.schedule, self.driver_standings)
-        self.constructor_standings.items[0].champion = is_wcc_champion(self.schedule, self.constructor_standings)
-
-    def should_update(self) -> bool:
-        """
-        Determines if data should be updated.
-        i.e. If it is a race weekend and 15 minutes have passed since data was last fetched, an update is needed.
-        @return: should_update bool value
-        """
-        if self.next_gp is not None and race_weekend(self.next_gp.dt):
-            current_time = time.time()
-            time_delta = current_time - self.last_updated
-            return time_delta >= constants.UPDATE_RATE
-        return False
+        drivers, constructors = self.driver_standings.items, self.constructor_standings.items
+        self.driver_standings = Standings([replace(drivers[0], champion=is_wdc_champion(self.schedule,
+                                                                                        self.driver_standings)),
+                                           *drivers[1:]])
+        self.constructor_standings = Standings([replace(constructors[0], champion=is_wcc_champion(
+                                                    self.schedule, self.constructor_standings)),
+                                                *constructors[1:]])
@@ -0,0 +1,130 @@
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Optional
+
+import requests
+
+from constants import RATE_LIMIT_BURST, RATE_LIMIT_HOURLY
+from metrics import RATE_LIMIT_BUDGET, RATE_LIMIT_WAIT_SECONDS
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Request not sent (or not retried) as the refresh cycle it belongs to ran out of time"""
+
+
+class Lane(IntEnum):
+    """Rate Limiter Priority Lane Enum class, lower lanes are served first"""
+    RESULTS = 0  # Results & standings, awaited after a session
+    BACKGROUND = 1  # Schedule, constructors, ...
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to `capacity` tokens, refilled continuously at `rate` tokens per second
+
+    Arguments:
+        capacity (float):       Maximum tokens, i.e. burst size
+        rate (float):           Tokens added per second, i.e. sustained rate
+
+    Attributes:
+        tokens (float):         Tokens available
+        updated (float):        Monotonic time of the last refill
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.tokens + (now - self.updated) * self.rate, self.capacity)
+        self.updated = now
+
+    def wait(self, now: float) -> float:
+        """
+        Time until a token is available
+        @param now: Monotonic time
+        @return: Delay in seconds
+        """
+        self.refill(now)
+        return max((1 - self.tokens) / self.rate, 0)
+
+    def take(self):
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter keeping requests within the API's burst & hourly limits, so they are never throttled.
+    Every request takes a token from both buckets. When tokens run out, requests wait their turn by priority lane,
+    then in order of arrival.
+
+    Arguments:
+        burst (float):          Requests per second, which may be sent at once
+        hourly (float):         Requests per hour
+
+    Attributes:
+        buckets (tuple):        Burst & hourly token buckets
+        waiting (list):         Heap of (Lane, Arrival) tickets waiting for a token
+    """
+
+    def __init__(self, burst: float = RATE_LIMIT_BURST, hourly: float = RATE_LIMIT_HOURLY):
+        self.burst = TokenBucket(burst, burst)
+        self.hourly = TokenBucket(hourly, hourly / 3600)
+        self.buckets = (self.burst, self.hourly)
+        self.waiting = []
+        self.arrivals = itertools.count()
+        self.condition = threading.Condition()
+
+    @property
+    def budget(self) -> float:
+        """
+        Requests left in the hourly budget
+        @return: Tokens available
+        """
+        with self.condition:
+            self.hourly.refill(time.monotonic())
+            return self.hourly.tokens
+
+    def acquire(self, lane: Lane = Lane.BACKGROUND, deadline: Optional[float] = None) -> float:
+        """
+        Wait for a token
+        @param lane: Priority lane
+        @param deadline: Monotonic time by which the token must be taken, None for no deadline
+        @return: Time waited in seconds
+        @raise DeadlineExceeded: Token not available before the deadline, none is taken
+        """
+        start = time.monotonic()
+        with self.condition:
+            ticket = (lane, next(self.arrivals))
+            heapq.heappush(self.waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = max(bucket.wait(now) for bucket in self.buckets)
+                    left = float('inf') if deadline is None else deadline - now
+                    if self.waiting[0] != ticket:  # Woken up once the tickets ahead are served
+                        if left <= 0:
+                            raise DeadlineExceeded('Refresh time budget exhausted waiting for the rate limiter')
+                        self.condition.wait(None if deadline is None else left)
+                    elif delay > 0:
+                        if delay >= left:
+                            raise DeadlineExceeded(f'Refresh time budget exhausted before a token in {delay:.1f}s')
+                        self.condition.wait(delay)
+                    else:
+                        break
+                for bucket in self.buckets:
+                    bucket.take()
+            finally:
+                self.waiting.remove(ticket)
+                heapq.heapify(self.waiting)
+                self.condition.notify_all()
+            RATE_LIMIT_BUDGET.set(self.hourly.tokens)
+
+        waited = time.monotonic() - start
+        RATE_LIMIT_WAIT_SECONDS.observe(waited, lane=lane.name.lower())
+        return waited
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from constants import HTTP_POOL_SIZE, PAGE_SIZE
+
+
+def paged(url: str, limit: int, offset: int = 0) -> str:
+    """
+    Get URL of a page
+    @param url: Request URL
+    @param limit: Page size
+    @param offset: Index of the page's first record
+    @return: Page URL
+    """
+    return f"{url}{'&' if '?' in url else '?'}limit={limit}&offset={offset}"
+
+
+def merge(records: list, page: list):
+    """
+    Append a page's records to the records of previous pages. A record split across pages (e.g. a race whose
+    results continue on the next page) is identified by its fields other than lists, and its lists merged in turn.
+    @param records: Records of previous pages, updated in place
+    @param page: Records of the page
+    """
+    for record in page:
+        previous = records[-1] if records else None
+        if isinstance(record, dict) and isinstance(previous, dict) and identity(record) == identity(previous):
+            for key, value in record.items():
+                if isinstance(value, list):
+                    merge(previous.setdefault(key, []), value)
+        else:
+            records.append(record)
+
+
+def identity(record: dict) -> dict:
+    return {key: value for key, value in record.items() if not isinstance(value, list)}
+
+
+def table(response: dict) -> list:
+    """
+    Get the records of a response, i.e. the list held by its table (e.g. MRData.RaceTable.Races)
+    @param response: JSON response
+    @return: Records
+    """
+    name = next(key for key in response['MRData'] if key.endswith('Table'))
+    return next(value for value in response['MRData'][name].values() if isinstance(value, list))
+
+
+def paginate(fetch: Callable[[str], dict], url: str, page_size: int = PAGE_SIZE) -> dict:
+    """
+    Get a complete response from a paginated endpoint. The first page tells the total number of records, the
+    remaining pages are then fetched concurrently and merged in order. URLs with an explicit limit are fetched as is.
+    @param fetch: Function getting a JSON response from a URL
+    @param url: Request URL
+    @param page_size: Maximum number of records per request
+    @return: JSON response holding every record
+    """
+    if 'limit=' in url:
+        return fetch(url)
+
+    response = fetch(paged(url, page_size))
+    offsets = range(page_size, int(response['MRData']['total']), page_size)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE) as executor:
+            pages = executor.map(fetch, [paged(url, page_size, offset) for offset in offsets])
+            records = table(response)
+            for page in pages:
+                merge(records, table(page))
+        response['MRData']['limit'] = response['MRData']['total']
+    return response
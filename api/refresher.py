@@ -0,0 +1,107 @@
+import logging
+import threading
+from typing import Optional, TYPE_CHECKING
+
+import requests
+
+from api.scheduler import Scheduler
+from constants import SNAPSHOT_FILE
+from data.update_status import UpdateStatus
+
+if TYPE_CHECKING:  # Data isn't needed at runtime, snapshots are built by Data.refreshed()
+    from api.data import Data
+
+
+class Refresher(threading.Thread):
+    """
+    Background worker refreshing data outside the render loop, when the scheduler expects new results.
+    Every refresh builds a complete new Data snapshot, which is only handed over to the renderers once ready (and
+    only if it changes what they display), and persisted for the next boot. Data restored from disk is revalidated as soon as the worker starts.
+    When a refresh fails, the last good snapshot keeps being served, flagged with the failure's status.
+
+    Arguments:
+        data (api.Data):            Data instance
+        scheduler (api.Scheduler):  Polling schedule
+        snapshot (str):             Snapshot file, None to disable persistence
+
+    Attributes:
+        latest_data (api.Data):     Most recent snapshot
+        pending (bool):             Most recent snapshot not yet handed over
+    """
+
+    def __init__(self, data: 'Data', scheduler: Scheduler = None, snapshot: Optional[str] = SNAPSHOT_FILE):
+        super().__init__(name='Refresher', daemon=True)
+        self.latest_data = data
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self.snapshot = snapshot
+        self.scheduler.update(data)
+        if data.deferred:  # Ran out of time on boot, fetch the rest soon
+            self.scheduler.failed()
+        self.pending = False
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def run(self):
+        if self.latest_data.restored:  # Warm start, revalidate the snapshot right away
+            self.refresh()
+        while True:
+            delay = self.scheduler.delay()
+            logging.debug(f'Next refresh in {delay:.0f}s')
+            if self.stopped.wait(delay):
+                break
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        Build a new snapshot. On failure, the current snapshot is kept and the refresh retried with backoff.
+        @return: True if a new snapshot was built
+        """
+        self.scheduler.polled()
+        try:
+            snapshot = self.latest_data.refreshed()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            logging.warning(f'Unable to refresh data: {e}')
+            return self.failed(UpdateStatus.NETWORK_ERROR)
+        except Exception:
+            logging.exception('Unable to refresh data')
+            return self.failed(UpdateStatus.API_ERROR)
+
+        self.scheduler.update(snapshot)
+        if snapshot.deferred:  # Ran out of time, fetch the rest soon
+            self.scheduler.failed()
+        with self.lock:
+            if not self.pending and snapshot.same(self.latest_data):  # Boards keep the snapshot they hold
+                self.latest_data.last_updated = snapshot.last_updated
+                self.latest_data.signatures = snapshot.signatures
+            else:
+                self.latest_data, self.pending = snapshot, True
+        if self.snapshot:
+            snapshot.save_snapshot(self.snapshot)
+        return True
+
+    def failed(self, status: UpdateStatus) -> bool:
+        """
+        Keep serving the current snapshot, flagged as stale
+        @param status: Update status
+        @return: False
+        """
+        self.scheduler.failed()
+        with self.lock:
+            logging.warning(f'Serving data last updated {self.latest_data.age:.0f}s ago')
+            if self.latest_data.status is not status:
+                self.latest_data, self.pending = self.latest_data.degraded(status), True
+        return False
+
+    def latest(self) -> Optional['Data']:
+        """
+        Hand over the most recent snapshot, if it has not been handed over yet
+        @return: New Data snapshot, or None
+        """
+        with self.lock:
+            if self.pending:
+                self.pending = False
+                return self.latest_data
+        return None
+
+    def stop(self):
+        self.stopped.set()
@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable
+
+
+class RequestScope:
+    """
+    Coalesce identical requests made within a refresh cycle. The first request for a key is fetched & decoded,
+    concurrent and later requests for the same key share its result until the scope is cleared.
+
+    Attributes:
+        fetched (int):          Requests fetched in the current cycle
+        saved (int):            Requests served from a shared result in the current cycle
+        total_fetched (int):    Requests fetched over all cycles
+        total_saved (int):      Requests served from a shared result over all cycles
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+        self.in_flight = {}
+        self.fetched = 0
+        self.saved = 0
+        self.total_fetched = 0
+        self.total_saved = 0
+
+    def get(self, key: Hashable, fetch: Callable[[], dict]) -> dict:
+        """
+        Get result for key, fetching it only if no identical request has been made in this cycle
+        @param key: Request key (i.e. URL)
+        @param fetch: Function performing the request
+        @return: Result
+        """
+        with self.lock:
+            if key in self.results:
+                self.saved += 1
+                return self.results[key]
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self.in_flight[key] = Future()
+            else:
+                self.saved += 1
+
+        if not owner:  # Wait on the request already in flight
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            with self.lock:
+                del self.in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            self.results[key] = result
+            del self.in_flight[key]
+            self.fetched += 1
+        future.set_result(result)
+        return result
+
+    def clear(self):
+        """
+        End the current cycle, discarding shared results
+        """
+        with self.lock:
+            self.results.clear()
+            self.total_fetched += self.fetched
+            self.total_saved += self.saved
+            self.fetched, self.saved = 0, 0
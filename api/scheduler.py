@@ -0,0 +1,150 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from constants import POLL_INTERVAL, POLL_MAX_INTERVAL, POLL_WINDOW, IDLE_REFRESH_RATE
+
+
+@dataclass
+class Session:
+    """Session of a grand prix, whose results are published some time after it ends"""
+    name: str
+    round: int
+    start: datetime
+    duration: float
+
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(seconds=self.duration)
+
+    def published(self, data) -> bool:
+        """
+        Determine if the session's results are in the data
+        @param data: Data instance
+        @return: True if results are available
+        """
+        if data.last_gp is not None and data.last_gp.gp.round >= self.round:  # Race weekend is over
+            return True
+        if self.name == 'Race' or data.next_gp is None or data.next_gp.round != self.round:
+            return False
+        session = data.next_gp.qualifying if self.name == 'Qualifying' else data.next_gp.sprint
+        return session is not None and session.grid is not None
+
+
+def timeline(data) -> List[Session]:
+    """
+    Build the timeline of the season's remaining sessions
+    @param data: Data instance
+    @return: Sessions, ordered by end time
+    """
+    sessions = []
+    for gp in data.schedule or []:
+        if gp.qualifying is not None:
+            sessions.append(Session('Qualifying', gp.round, gp.qualifying.dt, gp.qualifying.duration))
+        if gp.sprint is not None:
+            sessions.append(Session('Sprint', gp.round, gp.sprint.dt, gp.sprint.duration))
+        sessions.append(Session('Race', gp.round, gp.dt, gp.duration))
+    return sorted(sessions, key=lambda session: session.end)
+
+
+class Scheduler:
+    """
+    Polling schedule built from the season's session timeline. Once a session ends, results are polled for until they
+    are published, backing off exponentially. In between sessions, data is only refreshed at the idle rate.
+    Failed refreshes are retried with the same backoff, whatever the timeline.
+
+    Arguments:
+        interval (float):           Time in seconds from a session's end to the first poll
+        max_interval (float):       Backoff limit in seconds
+        window (float):             Time in seconds after a session's end until its results are no longer awaited
+        idle (float):               Time in seconds between refreshes when no results are awaited
+
+    Attributes:
+        sessions (list):            Sessions whose results have not been published yet
+        attempts (int):             Consecutive polls while results are awaited
+        failures (int):             Consecutive failed refreshes
+        last_poll (datetime):       Time of the last poll
+    """
+
+    def __init__(self,
+                 interval: float = POLL_INTERVAL,
+                 max_interval: float = POLL_MAX_INTERVAL,
+                 window: float = POLL_WINDOW,
+                 idle: float = IDLE_REFRESH_RATE):
+        self.interval = interval
+        self.max_interval = max_interval
+        self.window = window
+        self.idle = idle
+        self.sessions: List[Session] = []
+        self.attempts = 0
+        self.failures = 0
+        self.last_poll: Optional[datetime] = None
+
+    def update(self, data):
+        """
+        Rebuild the timeline from a data snapshot, dropping sessions whose results were published
+        @param data: Data instance
+        """
+        sessions = [session for session in timeline(data) if not session.published(data)]
+        published = [session for session in self.sessions if session not in sessions]
+        if published:
+            logging.debug(f'Results published: {", ".join(f"{s.name} (Round {s.round})" for s in published)}')
+            self.attempts = 0
+        self.sessions = sessions
+        self.failures = 0
+
+    def polled(self, now: datetime = None):
+        """
+        Record a poll. Consecutive polls while results are awaited back off exponentially.
+        @param now: Time of the poll
+        """
+        self.last_poll = now or datetime.now().astimezone()
+        self.attempts = self.attempts + 1 if self.awaited(self.last_poll) else 0
+
+    def failed(self):
+        """
+        Record a failed (or partial) refresh, retried sooner than the timeline would poll
+        """
+        self.failures += 1
+
+    def awaited(self, now: datetime) -> List[Session]:
+        """
+        Sessions which have ended and whose results are awaited
+        @param now: Current time
+        @return: Sessions
+        """
+        return [session for session in self.sessions
+                if session.end <= now < session.end + timedelta(seconds=self.window)]
+
+    def delay(self, now: datetime = None) -> float:
+        """
+        Time until the next poll
+        @param now: Current time
+        @return: Delay in seconds
+        """
+        now = now or datetime.now().astimezone()
+        delay = self.scheduled(now)
+        if self.failures:
+            delay = min(delay, min(self.interval * 2 ** (self.failures - 1), self.max_interval))
+        return delay
+
+    def scheduled(self, now: datetime) -> float:
+        """
+        Time until the next poll planned from the timeline
+        @param now: Current time
+        @return: Delay in seconds
+        """
+        awaited = self.awaited(now)
+        if awaited:
+            due = awaited[0].end + timedelta(seconds=self.interval)
+            if self.last_poll is not None and self.last_poll > awaited[0].end:
+                backoff = min(self.interval * 2 ** self.attempts, self.max_interval)
+                due = max(due, self.last_poll + timedelta(seconds=backoff))
+            return max((due - now).total_seconds(), 0)
+
+        upcoming = [session for session in self.sessions if session.end > now]
+        if upcoming:
+            until = (upcoming[0].end - now).total_seconds() + self.interval
+            return min(until, self.idle)
+        return self.idle
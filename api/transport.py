@@ -0,0 +1,103 @@
+import hashlib
+import os
+import threading
+import time
+from enum import Enum
+from http import HTTPStatus
+from typing import Dict, List, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from api.client import endpoint
+
+FIXTURES_DIR = 'tests/fixtures/ergast'
+
+
+class Fault(Enum):
+    """Failures a ReplayTransport can inject, besides HTTP error status codes"""
+    TIMEOUT = 'Timeout'
+    CONNECTION_ERROR = 'Connection Error'
+    TRUNCATED = 'Truncated'
+
+
+class ReplayTransport(BaseAdapter):
+    """
+    Transport adapter serving recorded API responses instead of going over the network, for hermetic tests &
+    benchmarks. Responses are looked up by endpoint (e.g. `next/qualifying` -> `next_qualifying.json`), and carry an
+    ETag so conditional requests are answered with 304 Not Modified. Latency beyond the read timeout times out.
+
+    Arguments:
+        directory (str):        Recorded responses directory
+        latency (float):        Simulated network latency in seconds, per request
+        faults (dict):          Endpoint ('*' for any) -> Faults or status codes returned by its next requests, in order
+
+    Attributes:
+        requests (list):        URLs requested
+    """
+
+    def __init__(self,
+                 directory: str = FIXTURES_DIR,
+                 latency: float = 0,
+                 faults: Dict[str, List[Union[Fault, int]]] = None):
+        super().__init__()
+        self.directory = directory
+        self.latency = latency
+        self.faults = {name: list(queue) for name, queue in (faults or {}).items()}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, timeout=None, **kwargs) -> requests.Response:
+        name = endpoint(request.url)
+        with self.lock:
+            self.requests.append(request.url)
+            fault = self.next_fault(name)
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read_timeout is not None and self.latency >= read_timeout:
+            time.sleep(read_timeout)
+            raise requests.ReadTimeout(f'Read timed out (read timeout={read_timeout}): {request.url}', request=request)
+        if self.latency:
+            time.sleep(self.latency)
+
+        if fault is Fault.TIMEOUT:
+            raise requests.ReadTimeout(f'Read timed out: {request.url}', request=request)
+        if fault is Fault.CONNECTION_ERROR:
+            raise requests.ConnectionError(f'Connection refused: {request.url}', request=request)
+        if isinstance(fault, int):
+            headers = {'Retry-After': '0'} if fault == 429 else {}
+            return self.response(request, fault, b'', headers)
+
+        path = os.path.join(self.directory, f"{name.replace('/', '_')}.json")
+        if not os.path.isfile(path):
+            return self.response(request, 404, b'')
+        with open(path, 'rb') as file:
+            body = file.read()
+
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if fault is None and request.headers.get('If-None-Match') == etag:
+            return self.response(request, 304, b'', {'ETag': etag})
+        if fault is Fault.TRUNCATED:
+            body = body[:len(body) // 2]
+        return self.response(request, 200, body, {'ETag': etag, 'Content-Type': 'application/json'})
+
+    def next_fault(self, name: str) -> Union[Fault, int, None]:
+        for key in (name, '*'):
+            if self.faults.get(key):
+                return self.faults[key].pop(0)
+        return None
+
+    @staticmethod
+    def response(request: requests.PreparedRequest, status_code: int, body: bytes, headers: dict = None):
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = HTTPStatus(status_code).phrase
+        response.headers = CaseInsensitiveDict(headers or {})
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response._content = body
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,194 @@
+"""
+Headless renderer benchmark. Every board is rendered against recorded API responses on both layouts, with sleeps
+disabled, reporting render time, allocations & peak memory per board, and the pixels pushed when it is redrawn.
+Loading the data is timed through the replay transport, with optional simulated latency, and parsing it on its own
+along with the size of the parsed datasets.
+
+Usage: python3 benchmark.py [--repeat N] [--latency SECONDS] [--output benchmark.json]
+"""
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import List, Tuple
+from unittest import mock
+
+import constants
+from api.cache import ResponseCache
+from api.client import Client
+from api.data import Data
+from api.transport import ReplayTransport
+from matrix.layout import Layout
+from renderer.frame_cache import FrameCache
+from renderer.frame_diff import FrameDiff
+from renderer.renderer import Renderer
+from tests.helpers import BOARDS, HeadlessMatrix, create, load
+from version import __version__
+
+LAYOUTS = ((64, 32), (128, 64))
+
+
+def render(renderer: Renderer) -> float:
+    """
+    Render a board from scratch, i.e. bypassing the frame cache & onto a blank screen
+    @param renderer: Board renderer
+    @return: Render time in seconds
+    """
+    renderer.frame_cache = FrameCache()
+    renderer.player.screen = FrameDiff()
+    start = time.perf_counter()
+    renderer.render()
+    return time.perf_counter() - start
+
+
+def benchmark(board: type, width: int, height: int, data: Data, repeat: int) -> dict:
+    """
+    Benchmark a board on a layout
+    @param board: Renderer class
+    @param width: Layout width
+    @param height: Layout height
+    @param data: Data the board is rendered from
+    @param repeat: Number of timed renders
+    @return: Benchmark results
+    """
+    layout = Layout(width, height)
+    matrix = HeadlessMatrix(width, height)
+    renderer = create(board, matrix, layout, data)
+
+    render(renderer)  # Warm-up, loads images & fonts
+    matrix.pushes = 0
+    timings = [render(renderer) for _ in range(repeat)]
+    frames = matrix.pushes // repeat
+
+    tracemalloc.start()
+    render(renderer)
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pushed = renderer.player.screen.pushed
+    renderer.frame_cache = FrameCache()
+    renderer.render()  # Redrawn identically, as on the next rotation
+    redraw = renderer.player.screen.pushed - pushed
+
+    return {'layout': f'w{width}h{height}',
+            'board': board.__name__,
+            'frames': frames,
+            'min_ms': min(timings) * 1000,
+            'median_ms': statistics.median(timings) * 1000,
+            'mean_ms': statistics.mean(timings) * 1000,
+            'allocated_kib': allocated / 1024,
+            'peak_kib': peak / 1024,
+            'pixels': pushed,
+            'redraw_pixels': redraw}
+
+
+def fetch(repeat: int, latency: float = 0) -> dict:
+    """
+    Benchmark fetching & parsing every endpoint
+    @param repeat: Number of timed loads
+    @param latency: Simulated network latency in seconds, per request
+    @return: Benchmark results
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(latency)
+        timings.append(time.perf_counter() - start)
+    return {'latency_ms': latency * 1000,
+            'min_ms': min(timings) * 1000,
+            'median_ms': statistics.median(timings) * 1000,
+            'mean_ms': statistics.mean(timings) * 1000}
+
+
+def parse(data: Data) -> tuple:
+    data.constructors, data.drivers = {}, {}
+    data.fetch_constructors()
+    data.fetch_drivers()
+    data.last_gp = data.fetch_last_gp()
+    return data.fetch_constructor_standings(), data.fetch_driver_standings(), data.last_gp, data.fetch_schedule()
+
+
+def parsing(repeat: int) -> dict:
+    """
+    Benchmark building the datasets from decoded responses, as done on every refresh
+    @param repeat: Number of timed parses
+    @return: Benchmark results
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data = Data(client=Client(ResponseCache(cache_dir), transport=ReplayTransport()))
+        with data.refresh_cycle():  # Responses held in memory for the cycle
+            data.prefetch(constants.CONSTRUCTORS_URL, constants.DRIVER_STANDINGS_URL,
+                          constants.CONSTRUCTOR_STANDINGS_URL, constants.LAST_GP_RESULTS_URL, constants.SCHEDULE_URL)
+            parse(data)  # Warm-up
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                parse(data)
+                timings.append(time.perf_counter() - start)
+
+            gc.collect()
+            tracemalloc.start()
+            datasets = parse(data)
+            resident = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del datasets
+
+    return {'min_ms': min(timings) * 1000,
+            'median_ms': statistics.median(timings) * 1000,
+            'mean_ms': statistics.mean(timings) * 1000,
+            'resident_kib': resident / 1024}
+
+
+def run(repeat: int, layouts: Tuple[Tuple[int, int], ...] = LAYOUTS, boards: tuple = BOARDS) -> List[dict]:
+    """
+    Benchmark every board on every layout, with sleeps disabled
+    @param repeat: Number of timed renders per board
+    @param layouts: Layout sizes
+    @param boards: Renderer classes
+    @return: Benchmark results
+    """
+    with mock.patch('time.sleep'):
+        data = load()
+        return [benchmark(board, width, height, data, repeat) for width, height in layouts for board in boards]
+
+
+def report(results: List[dict], data: dict, parse_results: dict):
+    print(f"Data: {data['median_ms']:.2f} ms median (min {data['min_ms']:.2f} ms) "
+          f"with {data['latency_ms']:.0f} ms latency per request")
+    print(f"Parse: {parse_results['median_ms']:.2f} ms median (min {parse_results['min_ms']:.2f} ms), "
+          f"{parse_results['resident_kib']:.1f} KiB resident\n")
+    print(f"{'Layout':<8} {'Board':<22} {'Frames':>6} {'Min (ms)':>9} {'Median (ms)':>12} {'Alloc (KiB)':>12} "
+          f"{'Peak (KiB)':>11} {'Pixels':>7} {'Redraw':>7}")
+    for result in results:
+        print(f"{result['layout']:<8} {result['board']:<22} {result['frames']:>6} {result['min_ms']:>9.2f} "
+              f"{result['median_ms']:>12.2f} {result['allocated_kib']:>12.1f} {result['peak_kib']:>11.1f} "
+              f"{result['pixels']:>7} {result['redraw_pixels']:>7}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='F1-LED-Leaderboard benchmark')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed renders per board. (Default: 10)')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Simulated network latency in seconds, per request. (Default: 0)')
+    parser.add_argument('--output', type=str, default='benchmark.json',
+                        help='Path to the JSON results file. (Default: benchmark.json)')
+    args_ = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    data_results = fetch(args_.repeat, args_.latency)
+    parse_results = parsing(args_.repeat)
+    results = run(args_.repeat)
+    report(results, data_results, parse_results)
+    with open(args_.output, 'w') as file:
+        json.dump({'version': __version__,
+                   'python': platform.python_version(),
+                   'machine': platform.machine(),
+                   'repeat': args_.repeat,
+                   'data': data_results,
+                   'parse': parse_results,
+                   'results': results}, file, indent=2)
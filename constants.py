@@ -11,6 +11,10 @@ F1_LOGO = 'assets/img/formula-1_logo.png'
 ERROR_IMAGE = 'assets/img/error.png'
 LIB_FONTS_DIR = 'rpi-rgb-led-matrix/fonts'
 FONTS_DIR = 'assets/fonts'
+CACHE_DIR = 'cache'
+ATLAS_FILE = 'assets/atlas/w{}h{}'  # .json manifest & .rgbx image
+FRAME_CACHE_DIR = 'cache/frames'
+SNAPSHOT_FILE = 'cache/data.pickle'  # Last good Data snapshot, rendered on boot while revalidating
 
 # ERGAST F1 API
 BASE_URL = 'https://api.jolpi.ca/ergast/f1/{}'
@@ -23,14 +27,74 @@ NEXT_GP_URL = f'{BASE_URL}/next'
 QUALIFYING_RESULTS_URL = f'{BASE_URL}/next/qualifying'
 SPRINT_URL = f'{BASE_URL}/next/sprint'
 SCHEDULE_URL = f'{BASE_URL}/'
+LAST_GP_PROBE_URL = f'{LAST_GP_RESULTS_URL}?limit=1'  # Change-detection probes, revalidated on every refresh
+DRIVER_STANDINGS_PROBE_URL = f'{DRIVER_STANDINGS_URL}?limit=1'
+PAGE_SIZE = 100  # Maximum records per request allowed by the API
+
+# HTTP Client
+HTTP_POOL_SIZE = 4  # Keep-alive connections
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.5  # seconds, doubled on every retry
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_TIMEOUT = (3.05, 10)  # seconds (connect, read)
+HTTP_TIMEOUTS = {  # per endpoint, for responses much smaller or larger than usual
+    LAST_GP_PROBE_URL: (3.05, 5),
+    DRIVER_STANDINGS_PROBE_URL: (3.05, 5),
+    SCHEDULE_URL: (3.05, 20)
+}
+REFRESH_BUDGET = 60  # seconds a refresh cycle may take, remaining fetches are deferred to the next one
+COLD_START_RETRY = 30  # seconds between attempts to fetch the data on boot, while the loading screen is shown
+RATE_LIMIT_BURST = 4  # requests per second, API limits
+RATE_LIMIT_HOURLY = 500  # requests per hour
+BREAKER_THRESHOLD = 3  # Consecutive failed requests to an endpoint opening its circuit
+BREAKER_COOLDOWN = 60  # seconds until the first half-open probe, doubled on every failed probe
+BREAKER_MAX_COOLDOWN = 30 * 60  # 30 minutes
+
+# Response Cache
+CACHE_MAX_SIZE = 5 * 1024 * 1024  # 5MB
+CACHE_TTL = {  # seconds a cached response is served without revalidation
+    CONSTRUCTORS_URL: 12 * 60 * 60,  # 12 hours
+    SCHEDULE_URL: 12 * 60 * 60,
+    CONSTRUCTOR_STANDINGS_URL: 60,  # 1 minute, updated along with results
+    DRIVER_STANDINGS_URL: 60,
+    LAST_GP_RESULTS_URL: 60,  # 1 minute, below the poll interval
+    QUALIFYING_RESULTS_URL: 60,
+    SPRINT_URL: 60
+}
+
+# Image Cache
+ATLAS_WIDTH = 1024
+IMAGE_CACHE_SIZE = 64  # Decoded images held in memory
+
+# Frame Cache
+FRAME_CACHE_PERSIST = True  # Keep rendered frames on disk across restarts
+
+# Frame Diff
+DIRTY_RECT_LIMIT = 8  # Dirty rectangles pushed per frame, beyond which a single rectangle bounds all changes
 
 # Date/Time Formatting
 DATE_FORMAT = '%a, %b %d'  # eg. Sun, Nov 14
 TIME_FORMAT = '%H:%M'  # eg. 18:30
 
+# Metrics
+METRICS_EXPORT_RATE = 15.0  # seconds
+
+# Polling
+QUALIFYING_DURATION = 60.0 * 60  # 1 hour, expected session duration
+SPRINT_DURATION = 60.0 * 60
+RACE_DURATION = 2 * 60.0 * 60  # 2 hours
+POLL_INTERVAL = 2 * 60.0  # 2 minutes, first poll after a session ends
+POLL_MAX_INTERVAL = 30 * 60.0  # 30 minutes, backoff limit while results are awaited
+POLL_WINDOW = 12 * 60 * 60.0  # 12 hours after a session, results are no longer awaited
+IDLE_REFRESH_RATE = 24 * 60 * 60.0  # 24 hours, refresh rate when no results are awaited
+
 # Software
-UPDATE_RATE = 30.0 * 60  # 30 minutes
 FAST_SCROLL = 0.2  # seconds
 SLOW_SCROLL = 0.5
 SLIDE_DELAY = 7.5
 DELAY = 3.0
+MARQUEE_SPEED = 0.05  # seconds per pixel
+MARQUEE_PAUSE = 1.5  # seconds a marquee is held still before scrolling
+MARQUEE_GAP = 16  # pixels between the end of a marquee's text and its start
+COUNTDOWN_INTERVAL = 1.0  # seconds between countdown ticks
+COUNTDOWN_WINDOW = 7 * 24 * 60 * 60  # 7 days, time before a session its countdown is shown instead of the date
@@ -1,13 +1,15 @@
 import logging
-import os
 from dataclasses import dataclass, field
 
 from constants import CIRCUIT_LOGO_PATH, TRACK_IMAGE_PATH, COUNTRY_FLAG_PATH
+from data.flyweight import Flyweight, slotted
+from utils import asset_exists
 
 
-@dataclass
-class Circuit:
-    """Data class to represent a circuit"""
+@slotted
+@dataclass(frozen=True)
+class Circuit(Flyweight):
+    """Data class to represent a circuit, shared through Circuit.get"""
     id: str
     name: str
     locality: str
@@ -16,8 +18,8 @@ class Circuit:
     track: str = field(init=False)  # Path to track image
 
     def __post_init__(self):
-        self.logo = self.get_logo(self.id, self.country)
-        self.track = self.get_track(self.id)
+        object.__setattr__(self, 'logo', self.get_logo(self.id, self.country))
+        object.__setattr__(self, 'track', self.get_track(self.id))
 
     @staticmethod
     def get_logo(circuit_id: str, country: str) -> str:
@@ -28,7 +30,7 @@ class Circuit:
         @return: Path to logo image
         """
         img_path = CIRCUIT_LOGO_PATH.format(circuit_id)
-        if os.path.isfile(img_path):
+        if asset_exists(img_path):
             return img_path
         logging.warning(f'No logo image found for {circuit_id}. Setting country flag.')
         return COUNTRY_FLAG_PATH.format(country)
@@ -41,6 +43,6 @@ class Circuit:
         @return: Path to track image
         """
         img_path = TRACK_IMAGE_PATH.format(circuit_id)
-        if os.path.isfile(img_path):
+        if asset_exists(img_path):
             return img_path
         logging.error(f'No track image found for {circuit_id}')
@@ -1,10 +1,10 @@
 import logging
-import os
 from dataclasses import dataclass, field
-from typing import List
+from typing import Tuple
 
 from constants import CONSTRUCTOR_LOGO_PATH
-from utils import Color
+from data.flyweight import Flyweight, slotted
+from utils import Color, asset_exists
 
 # Constructors' Background & Text Colors
 COLORS = {   # [Background, Text]
@@ -22,18 +22,20 @@ COLORS = {   # [Background, Text]
 }
 
 
-@dataclass
-class Constructor:
-    """Data class to represent a constructor (team)"""
+@slotted
+@dataclass(frozen=True)
+class Constructor(Flyweight):
+    """Data class to represent a constructor (team), shared through Constructor.get"""
     id: str
     name: str
     nationality: str
     logo: str = field(init=False)  # Path to logo image
-    colors: List[tuple] = field(init=False)
+    colors: Tuple[tuple, tuple] = field(init=False)
 
     def __post_init__(self):
-        self.name = self.name.replace('F1 Team', '')  # Shorten unnecessary portion
-        self.colors = COLORS[self.id.upper()]
+        object.__setattr__(self, 'name', self.name.replace('F1 Team', ''))  # Shorten unnecessary portion
+        object.__setattr__(self, 'logo', self.get_logo(self.id))
+        object.__setattr__(self, 'colors', tuple(COLORS[self.id.upper()]))
 
     @staticmethod
     def get_logo(constructor_id: str) -> str:
@@ -43,6 +45,6 @@ class Constructor:
         @return: path to logo image
         """
         img_path = CONSTRUCTOR_LOGO_PATH.format(constructor_id)
-        if os.path.isfile(img_path):
+        if asset_exists(img_path):
             return img_path
         logging.error(f'No logo image found for {constructor_id}')
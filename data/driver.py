@@ -1,15 +1,16 @@
 import logging
-import os
 from dataclasses import dataclass, field
 
 from constants import COUNTRY_FLAG_PATH
 from data.constructor import Constructor
-from utils import NATIONALITIES
+from data.flyweight import Flyweight, slotted
+from utils import NATIONALITIES, asset_exists
 
 
-@dataclass
-class Driver:
-    """Data class to represent a driver"""
+@slotted
+@dataclass(frozen=True)
+class Driver(Flyweight):
+    """Data class to represent a driver, shared through Driver.get"""
     id: str
     firstname: str
     lastname: str
@@ -20,7 +21,7 @@ class Driver:
     flag: str = field(init=False)
 
     def __post_init__(self):
-        self.flag = self.get_flag(NATIONALITIES.get(self.nationality))
+        object.__setattr__(self, 'flag', self.get_flag(NATIONALITIES.get(self.nationality)))
 
     @staticmethod
     def get_flag(country: str) -> str:
@@ -30,6 +31,6 @@ class Driver:
         @return: Path to flag image
         """
         img_path = COUNTRY_FLAG_PATH.format(country)
-        if os.path.isfile(img_path):
+        if asset_exists(img_path):
             return img_path
         logging.error(f'No flag image found for {country}')
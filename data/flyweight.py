@@ -0,0 +1,61 @@
+import threading
+from dataclasses import fields
+from typing import Dict, Tuple
+
+
+def slotted(cls: type) -> type:
+    """
+    Rebuild a dataclass with __slots__, dropping the per-instance __dict__.
+    Equivalent to dataclass(slots=True), which requires Python 3.10.
+    @param cls: Dataclass
+    @return: Slotted dataclass
+    """
+    inherited = {slot for base in cls.__mro__[1:] for slot in getattr(base, '__slots__', ())}
+    names = tuple(f.name for f in fields(cls))
+    attrs = dict(cls.__dict__)
+    attrs['__slots__'] = tuple(name for name in names if name not in inherited)
+    for name in names:
+        attrs.pop(name, None)  # Defaults live in __init__, class attributes would conflict with the slots
+    attrs.pop('__dict__', None)
+    attrs.pop('__weakref__', None)
+
+    def __getstate__(self) -> list:
+        return [getattr(self, name) for name in names]
+
+    def __setstate__(self, state: list):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)  # Frozen dataclasses can be unpickled & copied too
+
+    attrs['__getstate__'] = __getstate__
+    attrs['__setstate__'] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, attrs)
+
+
+class Flyweight:
+    """
+    Mixin for immutable entities (circuits, drivers, constructors) shared by every collection referencing them.
+    Instances are interned by their arguments, so each entity is only built (and its assets looked up) once.
+    """
+    __slots__ = ()
+
+    instances: Dict[Tuple, 'Flyweight'] = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def get(cls, *args) -> 'Flyweight':
+        """
+        Get the shared instance built from the given arguments
+        @param args: Constructor arguments
+        @return: Interned instance
+        """
+        key = (cls, *args)
+        instance = Flyweight.instances.get(key)
+        if instance is None:
+            with Flyweight.lock:
+                instance = Flyweight.instances.get(key)
+                if instance is None:
+                    instance = Flyweight.instances[key] = cls(*args)
+        return instance
+
+    def __reduce__(self):
+        return type(self).get, tuple(getattr(self, f.name) for f in fields(self) if f.init)
@@ -3,10 +3,12 @@ from typing import List
 
 from data.driver import Driver
 from data.finishing_status import FinishingStatus
+from data.flyweight import slotted
 from data.grand_prix import GrandPrix
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class DriverResult:
     """Data class to represent a Grand Prix's driver's result"""
     driver: Driver
@@ -18,6 +20,7 @@ class DriverResult:
     fastest_lap: bool
 
 
+@slotted
 @dataclass
 class GPResult:
     """Data class to represent a Grand Prix's results"""
@@ -1,13 +1,17 @@
+import copy
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional, Tuple
 
-from constants import DATE_FORMAT, TIME_FORMAT
+from constants import DATE_FORMAT, TIME_FORMAT, RACE_DURATION
 from data.circuit import Circuit
+from data.flyweight import slotted
 from data.session_status import SessionStatus
 from data.qualifying import Qualifying, Sprint
 from utils import convert_time, get_session_status
 
 
+@slotted
 @dataclass
 class GrandPrix:
     """Data class to represent a Grand Prix"""
@@ -20,10 +24,35 @@ class GrandPrix:
     sprint: Sprint = None
     dt: datetime = field(init=False)
     status: SessionStatus = field(init=False)
+    duration = RACE_DURATION
 
     def __post_init__(self):
         self.name = self.name.replace('Grand Prix', 'GP')  # Abbreviate Grand Prix
         self.dt = convert_time(self.date, self.time)  # From UTC to local timezone
         self.date = self.dt.strftime(DATE_FORMAT)
         self.time = self.dt.strftime(TIME_FORMAT)
-        self.status = get_session_status(self.dt)
+        self.status = get_session_status(self.dt, self.duration)
+
+    def refreshed(self) -> 'GrandPrix':
+        """
+        Copy of the GP with its sessions' statuses brought up to date
+        @return: Refreshed GP
+        """
+        gp = copy.copy(self)
+        gp.qualifying, gp.sprint = copy.copy(self.qualifying), copy.copy(self.sprint)
+        gp.status = get_session_status(gp.dt, gp.duration)
+        for session in (gp.qualifying, gp.sprint):
+            if session is not None:
+                session.status = get_session_status(session.dt, session.duration)
+        return gp
+
+    def next_session(self, now: datetime = None) -> Optional[Tuple[str, datetime]]:
+        """
+        Next session of the GP to start
+        @param now: Current time
+        @return: Session name & start, or None once the race started
+        """
+        now = now or datetime.now().astimezone()
+        sessions = (('Qualifying', self.qualifying), ('Sprint', self.sprint), ('Race', self))
+        upcoming = sorted((session.dt, name) for name, session in sessions if session is not None and session.dt > now)
+        return (upcoming[0][1], upcoming[0][0]) if upcoming else None
@@ -2,12 +2,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List
 
+from constants import QUALIFYING_DURATION, SPRINT_DURATION
 from data.driver import Driver
+from data.flyweight import slotted
 from data.session_status import SessionStatus
 from utils import convert_time, get_session_status
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class QualifyingResultItem:
     position: int
     driver: Driver
@@ -16,6 +19,7 @@ class QualifyingResultItem:
     Q3: str = None
 
 
+@slotted
 @dataclass
 class Qualifying:
     date: str
@@ -23,12 +27,14 @@ class Qualifying:
     dt: datetime = field(init=False)
     status: SessionStatus = SessionStatus.UPCOMING
     grid: List[QualifyingResultItem] = None
+    duration = QUALIFYING_DURATION
 
     def __post_init__(self):
         self.dt = convert_time(self.date, self.time)
-        self.status = get_session_status(self.dt)
+        self.status = get_session_status(self.dt, self.duration)
 
 
+@slotted
 @dataclass
 class Sprint(Qualifying):
-    ...
+    duration = SPRINT_DURATION
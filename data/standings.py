@@ -3,9 +3,11 @@ from typing import List
 
 from data.constructor import Constructor
 from data.driver import Driver
+from data.flyweight import slotted
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class StandingsItem:
     item: Driver or Constructor
     position: int = 1
@@ -13,6 +15,7 @@ class StandingsItem:
     champion: bool = False
 
 
+@slotted
 @dataclass
 class Standings:
     items: List[StandingsItem] = field(default_factory=list)
@@ -1,7 +1,9 @@
 import logging
 import sys
+import time
 from logging.handlers import RotatingFileHandler
 
+import requests
 from PIL import Image, ImageDraw
 try:
     from rgbmatrix import RGBMatrix
@@ -9,9 +11,13 @@ except ModuleNotFoundError: # used for testing
     from RGBMatrixEmulator import RGBMatrix
 
 from api.data import Data
+from constants import COLD_START_RETRY, FRAME_CACHE_DIR, FRAME_CACHE_PERSIST
 from matrix.layout import Layout
+from metrics import registry
 from renderer.loading import Loading
+from renderer.frame_cache import FrameCache
 from renderer.main import MainRenderer
+from renderer.renderer import Renderer
 from utils import led_matrix_options, args
 from version import __version__
 
@@ -19,11 +25,29 @@ from version import __version__
 def main():
     print(f'\U0001F3C1 F1-LED-Leaderboard - v{__version__} ({matrix.width}x{matrix.height})')
     layout = Layout(matrix.width, matrix.height)
+    if FRAME_CACHE_PERSIST:  # Only on the matrix, not when renderers are used by tests or the benchmark
+        Renderer.frame_cache = FrameCache(FRAME_CACHE_DIR)
     Loading(matrix, canvas, draw, layout)
-    data = Data()
+    data = Data.load_snapshot()  # Warm start, revalidated in the background
+    if data is None:
+        data = cold_start()
+        data.save_snapshot()
     MainRenderer(matrix, canvas, draw, layout, data)
 
 
+def cold_start() -> Data:
+    """
+    Fetch the data, retrying until the API can be reached
+    @return: Data instance
+    """
+    while True:
+        try:
+            return Data()
+        except requests.RequestException as e:  # Unreachable, timed out, or erroring until out of retries
+            logging.warning(f'Unable to fetch data, retrying in {COLD_START_RETRY}s: {e}')
+            time.sleep(COLD_START_RETRY)
+
+
 if __name__ == '__main__':
     # Set logging level
     if '--debug' in sys.argv:
@@ -42,8 +66,15 @@ if __name__ == '__main__':
                                            datefmt='%m/%d/%Y %I:%M:%S %p'))
     logger.addHandler(handler)
 
+    # Export metrics
+    args_ = args()
+    if args_.metrics_file:
+        registry.export(args_.metrics_file)
+    if args_.metrics_port:
+        registry.serve(args_.metrics_port)
+
     # Initialize the matrix
-    matrix = RGBMatrix(options=led_matrix_options(args()))
+    matrix = RGBMatrix(options=led_matrix_options(args_))
     canvas = Image.new('RGB', (matrix.width, matrix.height))
     draw = ImageDraw.Draw(canvas)
     matrix.SetImage(canvas)
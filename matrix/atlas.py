@@ -0,0 +1,184 @@
+import glob
+import json
+import logging
+import mmap
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from constants import LAYOUT_FILE, ATLAS_FILE, ATLAS_WIDTH, CIRCUIT_LOGO_PATH, TRACK_IMAGE_PATH, \
+    COUNTRY_FLAG_PATH, CONSTRUCTOR_LOGO_PATH, F1_LOGO, ERROR_IMAGE
+from utils import Color, read_json, decode_image
+from version import __version__
+
+FLAGS = COUNTRY_FLAG_PATH.format('*')
+CIRCUIT_LOGOS = CIRCUIT_LOGO_PATH.format('*')
+TRACKS = TRACK_IMAGE_PATH.format('*')
+CONSTRUCTOR_LOGOS = CONSTRUCTOR_LOGO_PATH.format('*')
+
+# Image slots of a layout: (Path to size in coords, Assets which can be shown in it)
+SLOTS = (
+    (('standings', 'drivers', 'flag', 'size'), (FLAGS,)),
+    (('last-gp', 'podium', '1st', 'flag', 'size'), (FLAGS,)),
+    (('last-gp', 'podium', '2nd', 'flag', 'size'), (FLAGS,)),
+    (('last-gp', 'podium', '3rd', 'flag', 'size'), (FLAGS,)),
+    (('last-gp', 'graphic', 'size'), (CIRCUIT_LOGOS, TRACKS, FLAGS)),  # Circuit logos fall back to flags
+    (('next-gp', 'logo', 'size'), (CIRCUIT_LOGOS, FLAGS)),
+    (('next-gp', 'track', 'size'), (TRACKS,)),
+    (('summary', 'constructor', 'logo', 'size'), (CONSTRUCTOR_LOGOS,)),
+    (('loading', 'image', 'size'), (F1_LOGO,)),
+    (('error', 'image', 'size'), (ERROR_IMAGE,)),
+)
+
+
+def sprite_key(path: str, size: Tuple[int, int]) -> str:
+    return f'{path}:{size[0]}x{size[1]}'
+
+
+class Atlas:
+    """
+    Pre-baked sprite atlas of a layout. Every asset is pre-cropped & resized to the exact size the layout needs,
+    packed into a single raw image file which is memory-mapped, and indexed by a manifest.
+
+    Arguments:
+        manifest (dict):            Atlas manifest
+        path (str):                 Path to the raw atlas image
+
+    Attributes:
+        sprites (dict):             Sprite key -> (x, y, width, height)
+        sources (set):              Paths of assets included in the atlas
+    """
+
+    def __init__(self, manifest: dict, path: str):
+        self.sprites = {key: tuple(box) for key, box in manifest['sprites'].items()}
+        self.sources = set(manifest['sources'])
+        with open(path, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.image = Image.frombuffer('RGBX', tuple(manifest['size']), self.buffer, 'raw', 'RGBX', 0, 1)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.sources
+
+    def get(self, path: str, size: Tuple[int, int], background: tuple = Color.BLACK) -> Optional[Image.Image]:
+        """
+        Get pre-baked sprite
+        @param path: Path to the asset
+        @param size: Size requested by the layout
+        @param background: Background color, sprites are baked on black
+        @return: Sprite image, or None if not in the atlas
+        """
+        box = self.sprites.get(sprite_key(path, size))
+        if box is None or tuple(background) != Color.BLACK:
+            return None
+        x, y, width, height = box
+        return self.image.crop((x, y, x + width, y + height)).convert('RGB')
+
+    @staticmethod
+    def load(width: int, height: int, path: str = ATLAS_FILE) -> Optional['Atlas']:
+        """
+        Load the layout's atlas, if it has been built for the current version
+        @param width: Layout width
+        @param height: Layout height
+        @param path: Atlas path template
+        @return: Atlas instance
+        """
+        path = path.format(width, height)
+        manifest_path = f'{path}.json'
+        if not os.path.isfile(manifest_path):
+            return None
+        with open(manifest_path, 'r') as file:
+            manifest = json.load(file)
+        if manifest.get('version') != __version__:
+            logging.warning(f'Sprite atlas for {width}x{height} is outdated. Run `python3 -m matrix.atlas`.')
+            return None
+        return Atlas(manifest, f'{path}.rgbx')
+
+
+def layout_assets(coords: dict) -> Dict[str, Tuple[str, Tuple[int, int]]]:
+    """
+    Get every asset & size a layout can render
+    @param coords: Layout coordinates dictionary
+    @return: Sprite key -> (path, size)
+    """
+    assets = {}
+    for keys, patterns in SLOTS:
+        size = coords
+        for key in keys:
+            size = size.get(key, {}) if isinstance(size, dict) else {}
+        if not size:
+            continue
+        size = tuple(size)
+        for pattern in patterns:
+            for path in sorted(glob.glob(pattern)):
+                assets[sprite_key(path, size)] = path, size
+    return assets
+
+
+def pack(sprites: Dict[str, Image.Image], width: int = ATLAS_WIDTH) -> Tuple[Image.Image, Dict[str, List[int]]]:
+    """
+    Pack sprites into a single image, on shelves of decreasing height
+    @param sprites: Sprite key -> image
+    @param width: Atlas width
+    @return: Atlas image, Sprite key -> [x, y, width, height]
+    """
+    boxes, x, y, shelf_height = {}, 0, 0, 0
+    for key, sprite in sorted(sprites.items(), key=lambda item: -item[1].height):
+        if x + sprite.width > width:  # New shelf
+            x, y, shelf_height = 0, y + shelf_height, 0
+        boxes[key] = [x, y, sprite.width, sprite.height]
+        x += sprite.width
+        shelf_height = max(shelf_height, sprite.height)
+
+    image = Image.new('RGB', (width, max(y + shelf_height, 1)), Color.BLACK)
+    for key, (x, y, _, _) in boxes.items():
+        image.paste(sprites[key], (x, y))
+    return image, boxes
+
+
+def build(width: int, height: int, path: str = ATLAS_FILE) -> str:
+    """
+    Build the sprite atlas of a layout
+    @param width: Layout width
+    @param height: Layout height
+    @param path: Atlas path template
+    @return: Path to the atlas manifest
+    """
+    assets = layout_assets(read_json(LAYOUT_FILE.format(width, height)))
+    sprites = {}
+    for key, (asset, size) in assets.items():
+        sprite = decode_image(asset, size)
+        if sprite is not None:
+            sprites[key] = sprite
+    image, boxes = pack(sprites)
+
+    path = path.format(width, height)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.rgbx', 'wb') as file:
+        file.write(image.convert('RGBX').tobytes())
+    with open(f'{path}.json', 'w') as file:
+        json.dump({'version': __version__,
+                   'size': list(image.size),
+                   'sources': sorted({assets[key][0] for key in sprites}),
+                   'sprites': boxes}, file)
+    logging.info(f'Built {width}x{height} sprite atlas: {len(boxes)} sprites, {image.width}x{image.height}')
+    return f'{path}.json'
+
+
+def build_all() -> List[str]:
+    """
+    Build the sprite atlas of every layout
+    @return: Paths to the atlas manifests
+    """
+    manifests = []
+    for layout in sorted(glob.glob(LAYOUT_FILE.format('*', '*'))):
+        match = re.search(r'w(\d+)h(\d+)\.json$', layout)
+        if match:
+            manifests.append(build(int(match.group(1)), int(match.group(2))))
+    return manifests
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    build_all()
@@ -2,7 +2,8 @@ from dataclasses import dataclass, field
 
 from PIL import ImageFont
 
-from utils import read_json, load_font
+from matrix.atlas import Atlas
+from utils import read_json, load_font, load_font_metrics, image_cache
 from constants import LAYOUT_FILE
 
 
@@ -14,9 +15,15 @@ class Layout:
     coords: dict = field(init=False)
     font: ImageFont = field(init=False)
     font_bold: ImageFont = field(init=False)
+    atlas: Atlas = field(init=False, repr=False)
 
     def __post_init__(self):
         self.coords = read_json(LAYOUT_FILE.format(self.width, self.height))
         self.font = load_font(self.coords['font']['regular'])
         bold = self.coords.get('font').get('bold', None)
         self.font_bold = load_font(bold) if bold else self.font
+        load_font_metrics(self.font)
+        load_font_metrics(self.font_bold)
+        self.atlas = Atlas.load(self.width, self.height)
+        if self.atlas is not None:
+            image_cache.atlas = self.atlas
@@ -0,0 +1,239 @@
+"""Instrumentation metrics, exported in Prometheus text format"""
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+from constants import METRICS_EXPORT_RATE
+
+# Histogram buckets, in seconds
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    escaped = []
+    for name, value in labels:
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{name}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+class Metric:
+    """
+    Base metric class, holding one value per label set
+
+    Arguments:
+        name (str):             Metric name
+        documentation (str):    Metric description
+    """
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.lock = threading.Lock()
+        self.values: Dict[Tuple[Tuple[str, str], ...], object] = {}
+
+    @staticmethod
+    def key(labels: dict) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def get(self, **labels):
+        return self.values.get(self.key(labels))
+
+    def samples(self):
+        for labels, value in sorted(self.values.items()):
+            yield self.name, labels, value
+
+    def expose(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type}']
+        with self.lock:
+            lines += [f'{name}{format_labels(labels)} {value:g}' for name, labels, value in self.samples()]
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing value"""
+    type = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Value which can go up and down"""
+    type = 'gauge'
+
+    def set(self, value: float, **labels):
+        with self.lock:
+            self.values[self.key(labels)] = value
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values over cumulative buckets
+
+    Arguments:
+        buckets (tuple):        Bucket upper bounds
+    """
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, buckets: tuple = TIME_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self.key(labels)
+        with self.lock:
+            counts, total, count = self.values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            counts = [c + 1 if value <= bound else c for c, bound in zip(counts, self.buckets)]
+            self.values[key] = counts, total + value, count + 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        for labels, (counts, total, count) in sorted(self.values.items()):
+            for bound, bucket_count in zip(self.buckets, counts):
+                yield f'{self.name}_bucket', labels + (('le', f'{bound:g}'),), bucket_count
+            yield f'{self.name}_bucket', labels + (('le', '+Inf'),), count
+            yield f'{self.name}_sum', labels, total
+            yield f'{self.name}_count', labels, count
+
+
+class Registry:
+    """
+    Collection of metrics, exported as a Prometheus text file and/or over HTTP
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self.register(Counter(name, documentation))
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self.register(Gauge(name, documentation))
+
+    def histogram(self, name: str, documentation: str, buckets: tuple = TIME_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, buckets))
+
+    def expose(self) -> str:
+        return '\n'.join(metric.expose() for metric in self.metrics.values()) + '\n'
+
+    def write(self, path: str):
+        """
+        Write metrics to a text file (e.g. for node_exporter's textfile collector)
+        @param path: Path to the metrics file
+        """
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as file:
+            file.write(self.expose())
+        os.replace(tmp_path, path)  # Atomic, scrapers never see a partial file
+
+    def export(self, path: str, interval: float = METRICS_EXPORT_RATE) -> threading.Thread:
+        """
+        Periodically write metrics to a text file in a background thread
+        @param path: Path to the metrics file
+        @param interval: Time in seconds between writes
+        @return: Exporter thread
+        """
+        def run():
+            while True:
+                try:
+                    self.write(path)
+                except OSError as e:
+                    logging.warning(f'Unable to write metrics to {path}: {e}')
+                time.sleep(interval)
+
+        thread = threading.Thread(target=run, name='MetricsExporter', daemon=True)
+        thread.start()
+        return thread
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Serve metrics over HTTP at /metrics in a background thread
+        @param port: Port to listen on
+        @param host: Address to bind to
+        @return: HTTP server
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') not in ('', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.expose().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name='MetricsServer', daemon=True).start()
+        return server
+
+
+def timed(histogram: Histogram, **labels):
+    """
+    Decorator observing a function's duration
+    @param histogram: Histogram to observe into
+    @param labels: Metric labels
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+registry = Registry()
+
+# Rendering
+RENDER_SECONDS = registry.histogram('f1_board_render_seconds', 'Time to play a board, including its delays')
+PREPARE_SECONDS = registry.histogram('f1_board_prepare_seconds', 'Time to draw the playlist of a board')
+SET_IMAGE_SECONDS = registry.histogram('f1_set_image_seconds', 'Time to push an image to the matrix')
+PIXELS_PUSHED = registry.counter('f1_pixels_pushed_total', 'Pixels pushed to the matrix')
+PIXELS_SKIPPED = registry.counter('f1_pixels_skipped_total', 'Unchanged pixels the frame diff avoided pushing')
+SLEEP_OVERSHOOT_SECONDS = registry.histogram('f1_sleep_overshoot_seconds', 'Time slept beyond the requested delay')
+SCROLL_FPS = registry.gauge('f1_scroll_fps', 'Frame rate achieved by the last scroll')
+SCROLL_TARGET_FPS = registry.gauge('f1_scroll_target_fps', 'Target frame rate of the last scroll')
+
+# Data
+HTTP_REQUEST_SECONDS = registry.histogram('f1_http_request_seconds', 'Time spent on the network per request')
+HTTP_REQUESTS = registry.counter('f1_http_requests_total', 'Requests made, by response status')
+JSON_DECODE_SECONDS = registry.histogram('f1_json_decode_seconds', 'Time to decode a JSON response')
+CACHE_HITS = registry.counter('f1_response_cache_hits_total', 'Responses served from cache, fresh or revalidated')
+PARSE_SECONDS = registry.histogram('f1_parse_seconds', 'Time to build a dataset from its response(s)')
+RATE_LIMIT_WAIT_SECONDS = registry.histogram('f1_rate_limit_wait_seconds', 'Time a request waited for a token')
+RATE_LIMIT_BUDGET = registry.gauge('f1_rate_limit_budget', 'Requests left in the hourly budget')
+REFRESH_SECONDS = registry.histogram('f1_refresh_seconds', 'Time to fetch & build data in a refresh cycle',
+                                     buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+REFRESH_OVERRUNS = registry.counter('f1_refresh_overruns_total', 'Datasets deferred as a refresh ran out of time')
+BREAKER_STATE = registry.gauge('f1_circuit_breaker_state', 'Circuit breaker state (0 closed, 1 half-open, 2 open)')
+BREAKER_TRIPS = registry.counter('f1_circuit_breaker_trips_total', 'Times a circuit breaker opened')
+DATA_AGE_SECONDS = registry.gauge('f1_data_age_seconds', 'Time since the displayed data was last refreshed')
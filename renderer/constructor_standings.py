@@ -1,6 +1,9 @@
-from PIL import ImageFont
+from typing import List
+
+from PIL import Image, ImageFont
 
 from data.standings import StandingsItem
+from renderer.playlist import Item, Scroll
 from renderer.renderer import Renderer
 from utils import Color, align_text, Position, get_text_size
 
@@ -29,13 +32,16 @@ class ConstructorStandings(Renderer):
         self.coords = self.layout.coords['standings']['constructors']
         self.text_y = self.coords['name']['y']
 
-    def render(self):
+    def playlist(self) -> List[Item]:
+        return [Scroll(self.frames(self.build, self.standings)[0])]
+
+    def build(self) -> List[Image.Image]:
         self.new_canvas(self.matrix.width, self.coords['row_height'] * (len(self.standings) + 1) + 1)
         self.render_header()
         for constructor in self.standings:
             self.render_row(constructor)
-        self.scroll_up(self.canvas)
         self.text_y = self.coords['name']['y']  # Reset
+        return [self.canvas]
 
     def render_header(self):
         x, y = align_text(get_text_size(self.draw, 'Constructors', self.layout.font_bold),
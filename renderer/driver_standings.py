@@ -1,6 +1,9 @@
-from PIL import ImageFont
+from typing import List
+
+from PIL import Image, ImageFont
 
 from data.standings import StandingsItem
+from renderer.playlist import Item, Scroll
 from renderer.renderer import Renderer
 from utils import Color, align_text, Position, load_image, get_text_size
 
@@ -33,13 +36,16 @@ class DriverStandings(Renderer):
         self.flag_y = self.coords['flag']['position']['y']
         self.driver_x = self.coords['driver']['x']
 
-    def render(self):
+    def playlist(self) -> List[Item]:
+        return [Scroll(self.frames(self.build, self.standings)[0])]
+
+    def build(self) -> List[Image.Image]:
         self.new_canvas(self.matrix.width, self.coords['row_height'] * (len(self.standings) + 1) + 1)
         self.render_header()
         for driver in self.standings:
             self.render_row(driver)
-        self.scroll_up(self.canvas)
         self.text_y, self.flag_y = self.coords['place']['position']['y'], self.coords['flag']['position']['y']  # Reset
+        return [self.canvas]
 
     def render_header(self):
         x, y = align_text(get_text_size(self.draw, 'Drivers', self.layout.font_bold),
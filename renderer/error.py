@@ -1,6 +1,7 @@
-import time
+from typing import List
 
 from constants import ERROR_IMAGE, SLIDE_DELAY
+from renderer.playlist import Item, Slide
 from renderer.renderer import Renderer
 from utils import Color, align_text, Position, load_image, align_image, get_text_size
 
@@ -21,14 +22,13 @@ class Error(Renderer):
         super().__init__(matrix, canvas, draw, layout)
         self.data = data
         self.coords = self.layout.coords['error']
-        self.msg = self.data.status
+        self.msg = self.data.status.value
 
-    def render(self):
-        self.clear()
+    def playlist(self) -> List[Item]:
+        self.new_canvas(self.matrix.width, self.matrix.height)  # Not the shared canvas, it may be drawn on meanwhile
         self.render_image()
         self.render_error_msg()
-        self.matrix.SetImage(self.canvas)
-        time.sleep(SLIDE_DELAY * 2)
+        return [Slide(self.canvas, SLIDE_DELAY * 2)]
 
     def render_error_msg(self):
         x, y = align_text(get_text_size(self.draw, self.msg, self.layout.font_bold),
@@ -0,0 +1,96 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+from typing import List, Optional
+
+from PIL import Image
+
+from version import __version__
+
+
+class FrameCache:
+    """
+    Cache of pre-rendered board frames. Frames are keyed by a hash of the board's input data and layout,
+    so a board is only re-rendered when its slice of the data changes.
+    Only the latest version of each board is kept.
+
+    Arguments:
+        directory (str):        Directory to persist frames to, if any
+
+    Attributes:
+        boards (dict):          Board name -> (key, frames)
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory
+        self.boards = {}
+
+    @staticmethod
+    def key(board: str, layout, *inputs) -> str:
+        """
+        Build cache key from board's input data & layout
+        @param board: Board name
+        @param layout: Layout instance
+        @param inputs: Data the board is rendered from
+        @return: Cache key
+        """
+        digest = hashlib.sha1()
+        digest.update(f'{__version__}:{layout.width}x{layout.height}'.encode())
+        digest.update(json.dumps(layout.coords, sort_keys=True).encode())
+        digest.update(repr(inputs).encode())
+        return f'{board}-{digest.hexdigest()}'
+
+    @staticmethod
+    def board(key: str) -> str:
+        return key.rsplit('-', 1)[0]
+
+    def get(self, key: str) -> Optional[List[Image.Image]]:
+        """
+        Get frames for key, from memory or disk
+        @param key: Cache key
+        @return: Frames, or None if not cached
+        """
+        cached = self.boards.get(self.board(key))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        frames = self.load(key)
+        if frames:
+            self.boards[self.board(key)] = key, frames
+            return frames
+        return None
+
+    def put(self, key: str, frames: List[Image.Image]) -> List[Image.Image]:
+        """
+        Store frames for key, replacing the board's previous version
+        @param key: Cache key
+        @param frames: Rendered frames
+        @return: Cached frames
+        """
+        frames = [frame.copy() for frame in frames]  # Detach from canvases still being drawn on
+        self.boards[self.board(key)] = key, frames
+        self.save(key, frames)
+        return frames
+
+    def load(self, key: str) -> List[Image.Image]:
+        frames = []
+        while self.directory:
+            path = os.path.join(self.directory, f'{key}.{len(frames)}.png')
+            if not os.path.isfile(path):
+                break
+            with Image.open(path) as frame:
+                frames.append(frame.convert('RGB'))
+        return frames
+
+    def save(self, key: str, frames: List[Image.Image]):
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for path in glob.glob(os.path.join(self.directory, f'{self.board(key)}-*.png')):
+                os.remove(path)  # Previous version
+            for i, frame in enumerate(frames):
+                frame.save(os.path.join(self.directory, f'{key}.{i}.png'))
+        except OSError as e:
+            logging.warning(f'Unable to persist frames for {key}: {e}')
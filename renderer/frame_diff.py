@@ -0,0 +1,94 @@
+from typing import List, Optional, Tuple
+
+from PIL import Image, ImageChops
+try:
+    import numpy as np
+except ModuleNotFoundError:  # Optional, changes are then pushed as a single rectangle
+    np = None
+
+from constants import DIRTY_RECT_LIMIT
+
+Rect = Tuple[int, int, int, int]  # (left, top, right, bottom)
+
+
+def dirty_rects(old: Image.Image, new: Image.Image, limit: int = DIRTY_RECT_LIMIT) -> List[Rect]:
+    """
+    Regions which differ between two frames. With NumPy, every band of changed rows gets its own rectangle,
+    otherwise (or beyond the limit) a single rectangle bounds all changes.
+    @param old: Frame on the matrix
+    @param new: Frame to display, the same size
+    @param limit: Maximum number of rectangles
+    @return: Dirty rectangles, empty if the frames are identical
+    """
+    if np is None:
+        bbox = ImageChops.difference(old, new).getbbox()
+        return [bbox] if bbox else []
+
+    changed = np.any(np.asarray(old) != np.asarray(new), axis=2)
+    rows = np.flatnonzero(changed.any(axis=1))
+    if rows.size == 0:
+        return []
+    bands = np.split(rows, np.flatnonzero(np.diff(rows) > 1) + 1)
+    if len(bands) > limit:
+        bands = [rows]
+    rects = []
+    for band in bands:
+        top, bottom = int(band[0]), int(band[-1]) + 1
+        columns = np.flatnonzero(changed[top:bottom].any(axis=0))
+        rects.append((int(columns[0]), top, int(columns[-1]) + 1, bottom))
+    return rects
+
+
+class FrameDiff:
+    """
+    Frame-diff layer between renderers and the matrix. It keeps track of the frame displayed on the matrix, so
+    identical frames aren't pushed again and changed frames only push their dirty rectangles.
+
+    Attributes:
+        matrix (rgbmatrix.RGBMatrix):   Matrix the frame is displayed on
+        frame (PIL.Image):              Frame displayed on the matrix, None if unknown
+        pushed (int):                   Pixels pushed to the matrix
+        skipped (int):                  Pixels unchanged, which weren't pushed
+    """
+
+    def __init__(self):
+        self.matrix = None
+        self.frame: Optional[Image.Image] = None
+        self.pushed = 0
+        self.skipped = 0
+
+    def invalidate(self):
+        """
+        Forget the displayed frame, e.g. after the matrix was drawn on directly
+        """
+        self.frame = None
+
+    def update(self, matrix, image: Image.Image, x: int = 0, y: int = 0) -> List[Tuple[Image.Image, int, int]]:
+        """
+        Determine what to push to the matrix to display an image
+        @param matrix: RGBMatrix instance
+        @param image: Image to display
+        @param x: Horizontal offset
+        @param y: Vertical offset
+        @return: Regions to push, as (image, x, y)
+        """
+        width, height = matrix.width, matrix.height
+        if matrix is not self.matrix:
+            self.matrix, self.frame = matrix, None
+        visible = max(min(x + image.width, width) - max(x, 0), 0) * max(min(y + image.height, height) - max(y, 0), 0)
+
+        if self.frame is None:
+            if x <= 0 and y <= 0 and image.width + x >= width and image.height + y >= height:  # Covers the matrix
+                self.frame = image.crop((-x, -y, width - x, height - y)).convert('RGB')
+            self.pushed += visible
+            return [(image, x, y)]
+
+        frame = self.frame.copy()
+        frame.paste(image, (x, y))
+        rects = dirty_rects(self.frame, frame)
+        self.frame = frame
+
+        pushed = sum((right - left) * (bottom - top) for left, top, right, bottom in rects)
+        self.pushed += pushed
+        self.skipped += visible - pushed
+        return [(frame.crop(rect), rect[0], rect[1]) for rect in rects]
@@ -1,9 +1,11 @@
-import time
+from typing import List
+
+from PIL import Image
 
-from constants import SLIDE_DELAY
 from data.driver import Driver
 from data.finishing_status import FinishingStatus
 from data.gp_result import DriverResult
+from renderer.playlist import Item, Marquee, Scroll, Slide
 from renderer.renderer import Renderer
 from utils import align_text, Position, Color, load_image, align_image, get_text_size
 
@@ -32,34 +34,36 @@ class LastGP(Renderer):
         self.text_y = self.coords['result']['position']['y']
         self.code_x = self.coords['code']['x']
 
-    def render(self):
-        if self.gp_result:
-            self.new_canvas(self.matrix.width, self.coords['row_height'] * len(self.gp_result.driver_results))
-
-            # GP Name & Track Logo/Layout
-            self.render_gp_name()
-            self.render_graphic()
-            self.matrix.SetImage(self.canvas)
-            time.sleep(SLIDE_DELAY)
-
-            self.clear()
+    def playlist(self) -> List[Item]:
+        if not self.gp_result:
+            return []
+        title, podium, results = self.frames(self.build, self.gp_result)
+        return [Marquee(title, self.title_strip(self.gp_result.gp.name)), Slide(podium), Scroll(results)]
 
-            # Podium
-            self.render_podiums(self.gp_result.driver_results[:3])
-            self.matrix.SetImage(self.canvas)
-            time.sleep(SLIDE_DELAY)
+    def build(self) -> List[Image.Image]:
+        # GP Name & Track Logo/Layout
+        self.new_canvas(self.matrix.width, self.matrix.height)
+        self.render_gp_name()
+        self.render_graphic()
+        title = self.canvas
 
-            self.clear()
-
-            # Complete results
-            for result in self.gp_result.driver_results:
-                self.render_row(result)
-            self.scroll_up(self.canvas)
+        # Podium
+        self.new_canvas(self.matrix.width, self.matrix.height)
+        self.render_podiums(self.gp_result.driver_results[:3])
+        podium = self.canvas
 
-            self.text_y = self.coords['result']['position']['y']  # Reset
+        # Complete results
+        self.new_canvas(self.matrix.width, self.coords['row_height'] * len(self.gp_result.driver_results))
+        for result in self.gp_result.driver_results:
+            self.render_row(result)
+        self.text_y = self.coords['result']['position']['y']  # Reset
+        return [title, podium, self.canvas]
 
-    # TODO: Name text can be too long to fit on canvas
     def render_gp_name(self):
+        strip = self.title_strip(self.gp_result.gp.name)
+        if strip is not None:  # Too long to fit, shown from its start & scrolled
+            self.canvas.paste(strip.crop((0, 0, self.matrix.width, strip.height)), (0, 0))
+            return
         x, y = align_text(get_text_size(self.draw, self.gp_result.gp.name, self.layout.font_bold),
                           self.matrix.width,
                           self.matrix.height,
@@ -1,4 +1,7 @@
+from typing import List
+
 from constants import F1_LOGO
+from renderer.playlist import Item, Slide
 from renderer.renderer import Renderer
 from utils import Color, align_text, Position, load_image, align_image, get_text_size
 from version import __version__
@@ -17,10 +20,10 @@ class Loading(Renderer):
         self.coords = self.layout.coords['loading']
         self.render()
 
-    def render(self):
+    def playlist(self) -> List[Item]:
         self.render_logo()
         self.render_version()
-        self.matrix.SetImage(self.canvas)
+        return [Slide(self.canvas, 0)]  # Stays on until the first board replaces it
 
     def render_version(self):
         x, y = align_text(get_text_size(self.draw, __version__, self.draw.getfont()),
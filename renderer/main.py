@@ -1,9 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+
+from api.refresher import Refresher
 from data.update_status import UpdateStatus
+from metrics import DATA_AGE_SECONDS, PREPARE_SECONDS, RENDER_SECONDS
 from renderer.constructor_standings import ConstructorStandings
 from renderer.driver_standings import DriverStandings
 from renderer.error import Error
 from renderer.last_gp import LastGP
 from renderer.next_gp import NextGP
+from renderer.playlist import Item
 from renderer.qualifying import Qualifying
 from renderer.renderer import Renderer
 from renderer.schedule import Schedule
@@ -13,18 +19,31 @@ class MainRenderer(Renderer):
     """
     Handle the rendering of different boards
     (Constructor & Driver Standings, Schedule, Last & Next GP, & Qualifying)
+    When data can't be refreshed, the boards keep showing the last good data, followed by the error board.
+    Boards are played in the order of BOARDS, each one's playlist prepared while the previous one is on screen.
 
     Arguments:
         data (api.Data):                    Data instance
 
     Attributes:
         status (data.UpdateStatus):         Update status
+        refresher (api.Refresher):          Background data refresher
+        rotation (Iterator[str]):           Names of the boards to play, in order
     """
 
+    BOARDS = ('constructor_standings', 'driver_standings', 'last_gp', 'schedule', 'next_gp', 'qualifying')
+
     def __init__(self, matrix, canvas, draw, layout, data):
         super().__init__(matrix, canvas, draw, layout)
         self.data = data
         self.status = self.data.status
+        self.init_boards()
+        self.rotation = self.boards()
+        self.refresher = Refresher(self.data)
+        self.refresher.start()
+        self.render()
+
+    def init_boards(self):
         self.constructor_standings = ConstructorStandings(self.matrix, self.canvas, self.draw, self.layout, self.data)
         self.driver_standings = DriverStandings(self.matrix, self.canvas, self.draw, self.layout, self.data)
         self.last_gp = LastGP(self.matrix, self.canvas, self.draw, self.layout, self.data)
@@ -32,19 +51,59 @@ class MainRenderer(Renderer):
         self.next_gp = NextGP(self.matrix, self.canvas, self.draw, self.layout, self.data)
         self.qualifying = Qualifying(self.matrix, self.canvas, self.draw, self.layout, self.data)
         self.error = Error(self.matrix, self.canvas, self.draw, self.layout, self.data)
-        self.render()
+        self.next_gp.prewarm()
+
+    def boards(self) -> Iterator[str]:
+        """
+        Rotate through the boards, followed by the error board while the data is stale
+        @return: Board names
+        """
+        while True:
+            yield from self.BOARDS
+            if self.status is not UpdateStatus.SUCCESS:
+                yield 'error'
+
+    def prepare(self, name: str) -> Tuple[str, List[Item]]:
+        """
+        Draw a board's playlist
+        @param name: Board attribute name
+        @return: Board name & playlist
+        """
+        renderer = getattr(self, name)  # Looked up on every turn, boards may be swapped in between
+        board = type(renderer).__name__
+        with PREPARE_SECONDS.time(board=board):
+            return board, renderer.playlist()
+
+    def playlist(self) -> List[Item]:
+        return self.prepare(next(self.rotation))[1]
 
     def render(self):
-        while self.status is UpdateStatus.SUCCESS:
+        with ThreadPoolExecutor(max_workers=1) as executor:
             try:
-                self.constructor_standings.render()
-                self.driver_standings.render()
-                self.last_gp.render()
-                self.schedule.render()
-                self.next_gp.render()
-                self.qualifying.render()
-                if self.data.should_update():
-                    self.data.update()
+                name = next(self.rotation)
+                upcoming = executor.submit(self.prepare, name)
+                while True:
+                    board, items = upcoming.result()  # Boards are only swapped while nothing is being drawn
+                    if self.swap_data():
+                        board, items = self.prepare(name)  # Drawn again from the new snapshot
+                    name = next(self.rotation)
+                    upcoming = executor.submit(self.prepare, name)  # Drawn while this board is on screen
+                    with RENDER_SECONDS.time(board=board):
+                        self.player.play(items, board)
+                    DATA_AGE_SECONDS.set(self.data.age)
             except KeyboardInterrupt as e:
+                self.refresher.stop()
                 raise SystemExit(' Exiting...') from e
-        self.error.render()
+
+    def swap_data(self) -> bool:
+        """
+        Swap in the refresher's latest data snapshot, if any, between boards
+        @return: True if a new snapshot was swapped in
+        """
+        data = self.refresher.latest()
+        if data is None:
+            return False
+        self.data = data
+        self.status = self.data.status
+        self.init_boards()
+        return True
@@ -1,14 +1,20 @@
-import time
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from constants import SLIDE_DELAY
+from PIL import Image, ImageDraw
+
+from constants import COUNTDOWN_INTERVAL, COUNTDOWN_WINDOW, SLIDE_DELAY
 from data.session_status import SessionStatus
+from renderer.playlist import Item, Marquee, Region, Slide, Ticks
 from renderer.renderer import Renderer
-from utils import Color, align_text, Position, align_image, load_image, get_text_size
+from utils import (Color, align_text, Position, align_image, load_image, get_text_size, image_cache, countdown,
+                   get_session_status)
 
 
 class NextGP(Renderer):
     """
-    Render next grand prix's information
+    Render next grand prix's information. In the week before a session, a countdown to its start ticks every
+    second, redrawing only the digits which changed.
 
     Arguments:
         data (api.Data):            Data instance
@@ -16,38 +22,55 @@ class NextGP(Renderer):
     Attributes:
         gp (data.GrandPrix):        Next GP's data
         coords (dict):              Coordinates dictionary
+        sprites (dict):             (Font, Character) -> Pre-rendered character, shared by all instances
     """
 
+    sprites = {}
+
     def __init__(self, matrix, canvas, draw, layout, data):
         super().__init__(matrix, canvas, draw, layout)
         self.data = data
         self.gp = self.data.next_gp
         self.coords = self.layout.coords['next-gp']
 
-    def render(self):
+    def playlist(self) -> List[Item]:
+        if not self.gp:
+            return []
+        # GP name & logo
+        self.new_canvas(self.matrix.width, self.matrix.height)
+        self.render_logo()
+        self.render_gp_name()
+        items = [Marquee(self.canvas, self.title_strip(self.gp.name))]
+
+        # Track layout & Countdown/Date/Time/Status
+        self.new_canvas(self.matrix.width, self.matrix.height)
+        self.render_track()
+        now = datetime.now().astimezone()
+        session = self.gp.next_session(now)
+        if session is not None and (session[1] - now).total_seconds() <= COUNTDOWN_WINDOW:
+            items.append(self.render_countdown(*session))
+            return items
+        if get_session_status(self.gp.dt, self.gp.duration) is SessionStatus.UPCOMING:
+            self.render_date()
+            self.render_time()
+        else:
+            self.render_status()
+        items.append(Slide(self.canvas))
+        return items
+
+    def prewarm(self):
+        """
+        Load the circuit's images ahead of the board being rendered
+        """
         if self.gp:
-            self.new_canvas(self.matrix.width, self.matrix.height)
-
-            # GP name & logo
-            self.render_logo()
-            self.render_gp_name()
-            self.matrix.SetImage(self.canvas)
-            time.sleep(SLIDE_DELAY)
-
-            self.clear()
-
-            # Track layout & Date/Time/Status
-            self.render_track()
-            if self.gp.status == SessionStatus.UPCOMING:
-                self.render_date()
-                self.render_time()
-            else:
-                self.render_status()
-            self.matrix.SetImage(self.canvas)
-            time.sleep(SLIDE_DELAY)
-
-    # TODO: Name text can be too long to fit on canvas
+            image_cache.prewarm([(self.gp.circuit.logo, tuple(self.coords['logo']['size'])),
+                                 (self.gp.circuit.track, tuple(self.coords['track']['size']))])
+
     def render_gp_name(self):
+        strip = self.title_strip(self.gp.name)
+        if strip is not None:  # Too long to fit, shown from its start & scrolled
+            self.canvas.paste(strip.crop((0, 0, self.matrix.width, strip.height)), (0, 0))
+            return
         x, y = align_text(get_text_size(self.draw, self.gp.name, self.layout.font_bold),
                           self.matrix.width,
                           self.matrix.height,
@@ -104,9 +127,95 @@ class NextGP(Renderer):
         self.draw.text((x, y), location, Color.WHITE)
 
     def render_status(self):
-        x, y = align_text(get_text_size(self.draw, self.gp.status.value, self.draw.getfont()),
+        status = get_session_status(self.gp.dt, self.gp.duration).value  # Live, rather than as of the last refresh
+        x, y = align_text(get_text_size(self.draw, status, self.draw.getfont()),
+                          self.matrix.width,
+                          self.matrix.height,
+                          Position.CENTER,
+                          Position.BOTTOM)
+        self.draw.text((x, y), status, Color.WHITE)
+
+    def render_countdown(self, session: str, start: datetime) -> Ticks:
+        """
+        Count down to a session's start for the duration of a slide. The digits are drawn as the countdown ticks,
+        after the first frame every tick only pushes the digits region.
+        @param session: Session name
+        @param start: Session's start
+        @return: Countdown item, played once
+        """
+        x, y = align_text(get_text_size(self.draw, session, self.draw.getfont()),
+                          self.matrix.width,
+                          self.matrix.height,
+                          Position.CENTER,
+                          Position.BOTTOM)
+        self.draw.text((x, y - self.font_height + 1), session, Color.WHITE)
+
+        canvas, shown = self.canvas, None
+
+        def tick() -> Optional[Region]:
+            nonlocal shown
+            text = countdown(start - datetime.now().astimezone())
+            left, top, right, bottom = self.render_digits(text, shown)
+            first, shown = shown is None, text
+            if first:
+                return canvas, 0, 0
+            return (canvas.crop((left, top, right, bottom)), left, top) if right > left else None
+
+        return Ticks(tick, COUNTDOWN_INTERVAL, round(SLIDE_DELAY / COUNTDOWN_INTERVAL))
+
+    def render_digits(self, text: str, shown: str = None) -> Tuple[int, int, int, int]:
+        """
+        Paste the countdown's characters which differ from the ones shown
+        @param text: Countdown text
+        @param shown: Countdown text shown, None if nothing is
+        @return: Redrawn region (left, top, right, bottom)
+        """
+        sprites = [self.sprite(char) for char in text]
+        x, y = self.digits_position(sum(sprite.width for sprite in sprites))
+        if shown is None or len(shown) != len(text):  # Layout changed, redraw the whole text
+            left, right = x, x + sum(sprite.width for sprite in sprites)
+            if shown is not None:  # Only the previous text is cleared, the track may share its rows
+                width = sum(self.sprite(char).width for char in shown)
+                shown_x = self.digits_position(width)[0]
+                self.draw.rectangle(((shown_x, y), (shown_x + width - 1, y + self.font_height - 1)), Color.BLACK)
+                left, right = min(left, shown_x), max(right, shown_x + width)
+            for sprite in sprites:
+                self.canvas.paste(sprite, (x, y))
+                x += sprite.width
+            return left, y, right, y + self.font_height
+
+        left, right = self.matrix.width, 0
+        for char, previous, sprite in zip(text, shown, sprites):
+            if char != previous:
+                self.canvas.paste(sprite, (x, y))
+                left, right = min(left, x), max(right, x + sprite.width)
+            x += sprite.width
+        return left, y, right, y + self.font_height
+
+    def digits_position(self, width: int) -> Tuple[int, int]:
+        """
+        Get the position of countdown text, centered along the bottom
+        @param width: Text width
+        @return: (x, y) coordinates
+        """
+        x, y = align_text((width, self.font_height),
                           self.matrix.width,
                           self.matrix.height,
                           Position.CENTER,
                           Position.BOTTOM)
-        self.draw.text((x, y), self.gp.status.value, Color.WHITE)
+        return x, y + 1
+
+    def sprite(self, char: str) -> Image.Image:
+        """
+        Get a character pre-rendered in the regular font
+        @param char: Character
+        @return: Character image
+        """
+        font = self.draw.getfont()
+        sprite = self.sprites.get((font, char))
+        if sprite is None:
+            width, _ = get_text_size(self.draw, char, font)
+            sprite = Image.new('RGB', (width, self.font_height))
+            ImageDraw.Draw(sprite).text((0, 0), char, Color.WHITE, font)
+            self.sprites[font, char] = sprite
+        return sprite
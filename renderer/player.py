@@ -0,0 +1,148 @@
+import logging
+import time
+from typing import List
+
+from PIL import Image
+
+from constants import DELAY, FAST_SCROLL, SLOW_SCROLL, SLIDE_DELAY, MARQUEE_SPEED, MARQUEE_PAUSE
+from metrics import (SET_IMAGE_SECONDS, SLEEP_OVERSHOOT_SECONDS, SCROLL_FPS, SCROLL_TARGET_FPS, PIXELS_PUSHED,
+                     PIXELS_SKIPPED)
+from renderer.frame_diff import FrameDiff
+from renderer.playlist import Item, Marquee, Scroll, Slide, Ticks
+from renderer.ticker import Ticker
+
+
+class Player:
+    """
+    Play boards' playlists on the matrix. The player owns all output & timing, so boards only draw their frames,
+    which can then be prepared while another board is on screen.
+
+    Arguments:
+        matrix (rgbmatrix.RGBMatrix):       RGBMatrix instance
+
+    Attributes:
+        board (str):                        Board being played, used as metrics label
+        scroll_speed (float):               Scroll speed
+        screen (FrameDiff):                 Frame displayed on the matrix, shared by all players
+        offscreen (dict):                   Matrix -> Offscreen canvas frames are drawn on before being swapped in,
+                                            shared by all players as the matrix never frees its canvases
+    """
+
+    screen = FrameDiff()
+    offscreen = {}
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.board = ''
+        self.scroll_speed: float = SLOW_SCROLL if self.matrix.height <= 32 else FAST_SCROLL
+
+    def play(self, items: List[Item], board: str = ''):
+        """
+        Display a playlist's items in order
+        @param items: Playlist
+        @param board: Board name
+        """
+        self.board = board
+        players = {Slide: self.slide, Scroll: self.scroll, Marquee: self.marquee, Ticks: self.ticks}
+        for item in items:
+            players[type(item)](item)
+
+    def slide(self, item: Slide):
+        self.show(item.image, item.hold)
+
+    def scroll(self, item: Scroll):
+        image = item.image
+        self.show(image, DELAY)
+
+        ticker = Ticker(self.scroll_speed)
+        width, height = self.matrix.width, self.matrix.height
+        for pos in range(1, image.height - height + 1):
+            viewport = image.crop((0, pos, width, pos + height))  # Only transfer the visible rows
+            ticker.wait()
+            self.swap(viewport)
+        self.scrolled(ticker)
+        self.hold(DELAY)
+
+    def marquee(self, item: Marquee):
+        """
+        Show an image, scrolling its strip across the top once. Frames are windows into the pre-rendered strip, so
+        nothing is drawn while scrolling. The image is held for its duration, extended if the strip takes longer.
+        @param item: Marquee item
+        """
+        self.push(item.image)
+        strip = item.strip
+        if strip is None:
+            self.hold(item.hold)
+            return
+
+        self.hold(MARQUEE_PAUSE)
+        ticker = Ticker(MARQUEE_SPEED)
+        period = strip.width - self.matrix.width
+        for pos in range(1, period + 1):
+            ticker.wait()
+            self.push(strip.crop((pos, 0, pos + self.matrix.width, strip.height)))
+        self.scrolled(ticker)
+        self.hold(max(item.hold - MARQUEE_PAUSE - period * MARQUEE_SPEED, MARQUEE_SPEED))
+
+    def ticks(self, item: Ticks):
+        ticker = Ticker(item.interval)
+        for _ in range(item.count):
+            ticker.wait()
+            region = item.tick()
+            if region is not None:
+                self.push(*region)
+        ticker.wait()  # Hold the last tick
+
+    def push(self, image: Image, x: int = 0, y: int = 0):
+        """
+        Push image to the matrix, only the regions which differ from the displayed frame
+        @param image: Image to display
+        @param x: Horizontal offset
+        @param y: Vertical offset
+        """
+        pushed, skipped = self.screen.pushed, self.screen.skipped
+        regions = self.screen.update(self.matrix, image, x, y)
+        PIXELS_PUSHED.inc(self.screen.pushed - pushed, board=self.board)
+        PIXELS_SKIPPED.inc(self.screen.skipped - skipped, board=self.board)
+        if regions:
+            with SET_IMAGE_SECONDS.time(board=self.board):
+                for region, region_x, region_y in regions:
+                    self.matrix.SetImage(region, region_x, region_y)
+
+    def hold(self, delay: float):
+        """
+        Keep the current frame on the matrix
+        @param delay: Time in seconds
+        """
+        start = time.monotonic()
+        time.sleep(delay)
+        SLEEP_OVERSHOOT_SECONDS.observe(max(0.0, time.monotonic() - start - delay), board=self.board)
+
+    def show(self, image: Image, delay: float = SLIDE_DELAY):
+        self.push(image)
+        if delay > 0:
+            self.hold(delay)
+
+    def swap(self, image: Image):
+        """
+        Draw image on the offscreen canvas and swap it in on the next vertical sync
+        @param image: Image to display, the size of the matrix
+        """
+        offscreen = self.offscreen.get(self.matrix)
+        if offscreen is None:
+            offscreen = self.matrix.CreateFrameCanvas()
+        self.screen.invalidate()  # Canvases swapped, the next push is a full frame
+        with SET_IMAGE_SECONDS.time(board=self.board):
+            offscreen.SetImage(image)
+            self.offscreen[self.matrix] = self.matrix.SwapOnVSync(offscreen)
+
+    def scrolled(self, ticker: Ticker):
+        """
+        Report the frame rate achieved by a scroll
+        @param ticker: Scroll's frame clock
+        """
+        if ticker.frames:
+            logging.debug(f'{self.board} scrolled {ticker.frames} frames at '
+                          f'{ticker.achieved_fps:.2f}/{ticker.target_fps:.2f} fps ({ticker.dropped} resyncs)')
+            SCROLL_FPS.set(ticker.achieved_fps, board=self.board)
+            SCROLL_TARGET_FPS.set(ticker.target_fps, board=self.board)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, Union
+
+from PIL import Image
+
+from constants import SLIDE_DELAY
+
+Region = Tuple[Image.Image, int, int]  # (image, x, y)
+
+
+@dataclass(frozen=True)
+class Slide:
+    """Image the size of the matrix, shown for a hold duration"""
+    image: Image.Image
+    hold: float = SLIDE_DELAY
+
+
+@dataclass(frozen=True)
+class Scroll:
+    """Image taller than the matrix, shown from its top then scrolled up to its bottom"""
+    image: Image.Image
+
+
+@dataclass(frozen=True)
+class Marquee:
+    """Image whose title strip scrolls horizontally across its top once, None if the title fits"""
+    image: Image.Image
+    strip: Optional[Image.Image]
+    hold: float = SLIDE_DELAY
+
+
+@dataclass(frozen=True)
+class Ticks:
+    """Regions drawn on a clock, e.g. a countdown. Each tick returns the region to push, None if unchanged."""
+    tick: Callable[[], Optional[Region]]
+    interval: float
+    count: int
+
+
+Item = Union[Slide, Scroll, Marquee, Ticks]
@@ -1,8 +1,9 @@
-import time
 from typing import List
 
-from constants import SLIDE_DELAY
+from PIL import Image
+
 from data.qualifying import QualifyingResultItem
+from renderer.playlist import Item, Scroll, Slide
 from renderer.renderer import Renderer
 from utils import Color, align_text, Position, get_text_size
 
@@ -35,25 +36,41 @@ class Qualifying(Renderer):
         self.text_y = self.coords['grid']['odd']['result']['position']['y']
         self.code_x = self.coords['grid']['odd']['code']['x']
 
-    def render(self):
-        if self.data.next_gp:
-            if self.qualifying.grid:
-                rh = self.coords['row']['height']
-                height = ((rh * (len(self.qualifying.grid) // 2)) + (rh // 2)) + self.coords['header']['height']
+    def playlist(self) -> List[Item]:
+        if not self.data.next_gp:
+            return []
+        frames = self.frames(self.build, self.qualifying, self.sprint)
+        if not self.qualifying.grid:
+            return [Slide(frames[0])]
+        items = [Scroll(frames[0])]
+        if self.sprint:
+            items.append(Scroll(frames[1]) if self.sprint.grid else Slide(frames[1]))
+        return items
+
+    def build(self) -> List[Image.Image]:
+        frames = []
+        if self.qualifying.grid:
+            rh = self.coords['row']['height']
+            height = ((rh * (len(self.qualifying.grid) // 2)) + (rh // 2)) + self.coords['header']['height']
+            self.new_canvas(self.matrix.width, height)
+            self.render_header('Qualifying')
+            self.render_grid(self.qualifying.grid)
+            frames.append(self.canvas)
+
+            if self.sprint:
                 self.new_canvas(self.matrix.width, height)
-                self.render_header('Qualifying')
-                self.render_grid(self.qualifying.grid)
-
-                if self.sprint:
-                    self.new_canvas(self.matrix.width, height)
-                    self.render_header('Sprint')
-                    if self.sprint.grid:
-                        self.render_grid(self.sprint.grid)
-                    else:
-                        self.render_status(self.sprint.status.value)
-            else:
-                self.render_header('Qualifying')
-                self.render_status(self.qualifying.status.value)
+                self.render_header('Sprint')
+                if self.sprint.grid:
+                    self.render_grid(self.sprint.grid)
+                else:
+                    self.render_status(self.sprint.status.value)
+                frames.append(self.canvas)
+        else:
+            self.new_canvas(self.matrix.width, self.matrix.height)
+            self.render_header('Qualifying')
+            self.render_status(self.qualifying.status.value)
+            frames.append(self.canvas)
+        return frames
 
     def render_header(self, header: str):
         x, y = align_text(get_text_size(self.draw, header, self.layout.font_bold),
@@ -72,8 +89,6 @@ class Qualifying(Renderer):
                           self.matrix.height)
         y += (self.font_height // 2)
         self.draw.text((x, y), status, Color.WHITE, self.layout.font_bold)
-        self.matrix.SetImage(self.canvas)
-        time.sleep(SLIDE_DELAY)
 
     def render_row(self, item: QualifyingResultItem):
         parity = 'even' if item.position % 2 == 0 else 'odd'
@@ -105,5 +120,4 @@ class Qualifying(Renderer):
     def render_grid(self, grid: list):
         for item in grid:
             self.render_row(item)
-        self.scroll_up(self.canvas)
         self.text_y = self.coords['grid']['odd']['result']['position']['y']  # Reset
@@ -1,5 +1,5 @@
-import time
 from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
 
 from PIL import Image, ImageDraw
 try:
@@ -8,13 +8,16 @@ except ModuleNotFoundError: # used for testing
     from RGBMatrixEmulator import RGBMatrix
 
 from matrix.layout import Layout
-from constants import DELAY, FAST_SCROLL, SLOW_SCROLL
+from constants import MARQUEE_GAP
+from renderer.frame_cache import FrameCache
+from renderer.player import Player
+from renderer.playlist import Item
 from utils import Color, get_text_size
 
 
 class Renderer(ABC):
     """
-    Base Renderer abstract class
+    Base Renderer abstract class. Boards draw their frames into a playlist, which a player then displays.
 
     Arguments:
         matrix (rgbmatrix.RGBMatrix):       RGBMatrix instance
@@ -25,9 +28,15 @@ class Renderer(ABC):
     Attributes:
         font_width (int):                   Font's character width
         font_height (int):                  Font's character height
-        scroll_speed (float):                Scroll speed
+        player (Player):                    Player displaying the board's playlist when rendered on its own
+        frame_cache (FrameCache):           Pre-rendered frames, shared by all renderers. In memory, unless main.py
+                                            persists them on startup
+        strips (dict):                      Pre-rendered marquee strips, shared by all renderers
     """
 
+    frame_cache = FrameCache()
+    strips = {}
+
     def __init__(self, matrix, canvas, draw, layout):
         self.matrix: RGBMatrix = matrix
         self.canvas: Image = canvas
@@ -35,28 +44,55 @@ class Renderer(ABC):
         self.layout: Layout = layout
         self.draw.font = self.layout.font
         self.font_width, self.font_height = get_text_size(self.draw, ' ', self.draw.getfont())
-        self.scroll_speed: float = SLOW_SCROLL if self.matrix.height <= 32 else FAST_SCROLL
+        self.player = Player(self.matrix)
 
     @abstractmethod
+    def playlist(self) -> List[Item]:
+        """
+        Draw the board's frames, without displaying anything
+        @return: Items to play, empty if there is nothing to show
+        """
+
     def render(self):
-        pass
+        self.player.play(self.playlist(), type(self).__name__)
 
     def clear(self):
         self.draw.rectangle(((0, 0), (self.matrix.width, self.matrix.height)), fill=Color.BLACK)
 
     def new_canvas(self, width: int, height: int):
-        self.clear()
         self.canvas = Image.new('RGB', (width, height if height >= self.matrix.height else self.matrix.height))
         self.draw = ImageDraw.Draw(self.canvas)
         self.draw.font = self.layout.font
 
-    def scroll_up(self, image: Image):
-        self.matrix.SetImage(self.canvas)
-        time.sleep(DELAY)
+    def frames(self, build: Callable[[], List[Image.Image]], *inputs) -> List[Image.Image]:
+        """
+        Get the board's frames from the frame cache, building them only if the input data changed
+        @param build: Function rendering the board's frames
+        @param inputs: Data the board is rendered from
+        @return: Rendered frames
+        """
+        key = FrameCache.key(type(self).__name__, self.layout, *inputs)
+        frames = self.frame_cache.get(key)
+        if frames is None:
+            frames = self.frame_cache.put(key, build())
+        return frames
 
-        pos, bottom = 0, -(image.height - self.matrix.height)
-        while pos != bottom:
-            self.matrix.SetImage(self.canvas, 0, pos)
-            pos -= 1
-            time.sleep(self.scroll_speed)
-        time.sleep(DELAY)
+    def title_strip(self, title: str) -> Optional[Image.Image]:
+        """
+        Get the marquee strip of a title too long to fit on the matrix, i.e. its red band across the top
+        @param title: Title text
+        @return: Strip, or None if the title fits
+        """
+        width = get_text_size(self.draw, title, self.layout.font_bold)[0]
+        if width <= self.matrix.width:
+            return None
+        key = (title, self.layout.width, self.layout.height)
+        strip = self.strips.get(key)
+        if strip is None:
+            period = width + MARQUEE_GAP
+            strip = Image.new('RGB', (period + self.matrix.width, self.font_height + 1), Color.RED)
+            draw = ImageDraw.Draw(strip)
+            for x in range(1, strip.width, period):  # Start repeated at the end, so it loops seamlessly
+                draw.text((x, 1), title, Color.WHITE, self.layout.font_bold)
+            self.strips[key] = strip
+        return strip
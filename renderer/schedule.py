@@ -1,4 +1,9 @@
+from typing import List
+
+from PIL import Image
+
 from data.grand_prix import GrandPrix
+from renderer.playlist import Item, Scroll
 from renderer.renderer import Renderer
 from utils import Color, align_text, Position, get_text_size
 
@@ -27,14 +32,18 @@ class Schedule(Renderer):
         self.country_x = self.coords['country']['x']
         self.text_y = self.coords['round']['position']['y']
 
-    def render(self):
-        if self.schedule:
-            self.new_canvas(self.matrix.width, self.coords['row_height'] * (len(self.schedule) + 1) + 1)
-            self.render_header()
-            for gp in self.schedule:
-                self.render_row(gp)
-            self.scroll_up(self.canvas)
-            self.text_y = self.coords['round']['position']['y']  # Reset
+    def playlist(self) -> List[Item]:
+        if not self.schedule:
+            return []
+        return [Scroll(self.frames(self.build, self.schedule)[0])]
+
+    def build(self) -> List[Image.Image]:
+        self.new_canvas(self.matrix.width, self.coords['row_height'] * (len(self.schedule) + 1) + 1)
+        self.render_header()
+        for gp in self.schedule:
+            self.render_row(gp)
+        self.text_y = self.coords['round']['position']['y']  # Reset
+        return [self.canvas]
 
     def render_header(self):
         x, y = align_text(get_text_size(self.draw, 'Schedule', self.layout.font_bold),
@@ -0,0 +1,50 @@
+import time
+
+
+class Ticker:
+    """
+    Frame clock scheduling frames against a monotonic deadline, so render time doesn't add up to the frame interval.
+    If a frame runs later than a full interval, the schedule is reset rather than rushing to catch up.
+
+    Arguments:
+        interval (float):       Target time in seconds between frames
+
+    Attributes:
+        frames (int):           Frames ticked
+        dropped (int):          Times the schedule was reset after running late
+        started (float):        Monotonic time of the first frame
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.frames = 0
+        self.dropped = 0
+        self.started = None
+        self.deadline = None
+
+    def wait(self):
+        """
+        Sleep until the next frame is due. The first frame is due immediately.
+        """
+        now = time.monotonic()
+        if self.started is None:
+            self.started = self.deadline = now
+        else:
+            self.deadline += self.interval
+            if now > self.deadline + self.interval:  # Running late, resync
+                self.deadline = now
+                self.dropped += 1
+            elif now < self.deadline:
+                time.sleep(self.deadline - now)
+        self.frames += 1
+
+    @property
+    def target_fps(self) -> float:
+        return 1 / self.interval if self.interval else 0.0
+
+    @property
+    def achieved_fps(self) -> float:
+        if self.started is None or self.frames < 2:
+            return 0.0
+        elapsed = time.monotonic() - self.started
+        return (self.frames - 1) / elapsed if elapsed else 0.0
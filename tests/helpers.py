@@ -0,0 +1,64 @@
+"""
+Helpers rendering boards without a matrix, against the recorded API responses in tests/fixtures/ergast. Shared by the
+tests & the benchmark.
+"""
+import tempfile
+
+from PIL import Image, ImageDraw
+
+from api.cache import ResponseCache
+from api.client import Client
+from api.data import Data
+from api.transport import ReplayTransport
+from matrix.layout import Layout
+from renderer.constructor_standings import ConstructorStandings
+from renderer.driver_standings import DriverStandings
+from renderer.error import Error
+from renderer.last_gp import LastGP
+from renderer.loading import Loading
+from renderer.next_gp import NextGP
+from renderer.qualifying import Qualifying
+from renderer.renderer import Renderer
+from renderer.schedule import Schedule
+
+BOARDS = (ConstructorStandings, DriverStandings, LastGP, Schedule, NextGP, Qualifying, Loading, Error)
+
+
+class HeadlessMatrix:
+    """
+    Stand-in for RGBMatrix which only counts the frames pushed to it
+
+    Attributes:
+        pushes (int):       Frames pushed
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.pushes = 0
+
+    def SetImage(self, image, x=0, y=0, unsafe=True):
+        self.pushes += 1
+
+    def Clear(self):
+        pass
+
+    def CreateFrameCanvas(self):
+        return HeadlessMatrix(self.width, self.height)
+
+    def SwapOnVSync(self, canvas, framerate_fraction=1):
+        self.pushes += 1
+        return canvas
+
+
+def create(board: type, matrix: HeadlessMatrix, layout: Layout, data: Data) -> Renderer:
+    canvas = Image.new('RGB', (matrix.width, matrix.height))
+    draw = ImageDraw.Draw(canvas)
+    if board is Loading:
+        return board(matrix, canvas, draw, layout)
+    return board(matrix, canvas, draw, layout, data)
+
+
+def load(latency: float = 0) -> Data:
+    with tempfile.TemporaryDirectory() as cache_dir:  # Cold response cache
+        return Data(client=Client(ResponseCache(cache_dir), transport=ReplayTransport(latency=latency)))
@@ -0,0 +1,32 @@
+import os
+
+from PIL import Image
+
+from matrix.atlas import Atlas, build, pack, layout_assets
+from utils import read_json, decode_image
+
+
+class TestAtlas:
+    def test_layout_assets(self):
+        assets = layout_assets(read_json('matrix/coords/w64h32.json'))
+        assert ('assets/img/flags/Spain.jpg', (14, 7)) in assets.values()
+        assert ('assets/img/error.png', (10, 10)) in assets.values()
+
+    def test_pack(self):
+        sprites = {str(i): Image.new('RGB', (40, 10 + i)) for i in range(5)}
+        image, boxes = pack(sprites, width=100)
+        assert image.width == 100
+        assert all(x + w <= 100 and y + h <= image.height for x, y, w, h in boxes.values())
+        assert boxes['4'][:2] == [0, 0]  # Tallest first
+
+    def test_load(self, tmp_path):
+        assert Atlas.load(64, 32, os.path.join(str(tmp_path), 'w{}h{}')) is None
+
+    def test_build(self, tmp_path):
+        path = os.path.join(str(tmp_path), 'w{}h{}')
+        build(64, 32, path)
+        atlas = Atlas.load(64, 32, path)
+        sprite = atlas.get('assets/img/flags/Spain.jpg', (14, 7))
+        assert 'assets/img/flags/Spain.jpg' in atlas
+        assert sprite.tobytes() == decode_image('assets/img/flags/Spain.jpg', (14, 7)).tobytes()
+        assert atlas.get('assets/img/flags/Spain.jpg', (20, 10)) is None
@@ -0,0 +1,8 @@
+import benchmark
+
+
+class TestBenchmark:
+    def test_run(self):
+        results = benchmark.run(1, layouts=((64, 32),))
+        assert [result['board'] for result in results] == [board.__name__ for board in benchmark.BOARDS]
+        assert all(result['frames'] > 0 and result['peak_kib'] > 0 for result in results)
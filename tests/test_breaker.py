@@ -0,0 +1,53 @@
+from unittest import mock
+
+from api.breaker import BreakerState, CircuitBreaker
+
+
+class TestCircuitBreaker:
+    def setup_method(self):
+        self.breaker = CircuitBreaker('next', threshold=2, cooldown=60, max_cooldown=100)
+
+    def test_failed(self):
+        self.breaker.failed()
+        assert self.breaker.state is BreakerState.CLOSED
+        self.breaker.failed()
+        assert self.breaker.state is BreakerState.OPEN
+        assert self.breaker.allow() is False
+
+    def test_allow(self):
+        self.breaker.failed()
+        self.breaker.failed()
+        with mock.patch('time.monotonic', return_value=self.breaker.opened_at + 60):
+            assert self.breaker.allow() is True  # Half-open probe
+            assert self.breaker.allow() is False  # Probe in flight
+        assert self.breaker.state is BreakerState.HALF_OPEN
+
+    def test_allow_2(self):
+        self.breaker.failed()
+        self.breaker.failed()
+        with mock.patch('time.monotonic', return_value=self.breaker.opened_at + 60):
+            self.breaker.allow()
+        self.breaker.failed()  # Failed probe
+        assert self.breaker.state is BreakerState.OPEN
+        with mock.patch('time.monotonic', return_value=self.breaker.opened_at + 60):
+            assert self.breaker.allow() is False  # Cooldown doubled, up to the limit
+        with mock.patch('time.monotonic', return_value=self.breaker.opened_at + 100):
+            assert self.breaker.allow() is True
+
+    def test_succeeded(self):
+        self.breaker.failed()
+        self.breaker.failed()
+        with mock.patch('time.monotonic', return_value=self.breaker.opened_at + 60):
+            self.breaker.allow()
+        self.breaker.succeeded()
+        assert self.breaker.state is BreakerState.CLOSED
+        assert (self.breaker.failures, self.breaker.trips) == (0, 0)
+
+    def test_cancelled(self):
+        self.breaker.failed()
+        self.breaker.failed()
+        with mock.patch('time.monotonic', return_value=self.breaker.opened_at + 60):
+            self.breaker.allow()
+            self.breaker.cancelled()  # Probe given up
+            assert self.breaker.allow() is True
+        assert self.breaker.trips == 1
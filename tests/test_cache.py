@@ -0,0 +1,53 @@
+import os
+
+from api.cache import ResponseCache
+
+
+class TestResponseCache:
+    def setup_method(self):
+        self.url = 'https://api.jolpi.ca/ergast/f1/current/constructors'
+
+    def test_get(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        assert cache.get(self.url) is None
+
+    def test_put(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        cache.put(self.url, '{"MRData": {}}', etag='"abc"')
+        entry = cache.get(self.url)
+        assert entry.json() == {'MRData': {}}
+        assert entry.etag == '"abc"'
+
+    def test_touch(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        entry = cache.put(self.url, '{}')
+        entry.fetched -= 60
+        assert cache.touch(entry).age < 60
+
+    def test_put_2(self, tmp_path):
+        (tmp_path / 'file').write_text('')
+        cache = ResponseCache(str(tmp_path / 'file' / 'cache'))  # Directory can't be created
+        assert cache.put(self.url, '{}').json() == {}  # Served without being cached
+        assert cache.get(self.url) is None
+
+    def test_put_3(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / 'cache'))
+        assert not os.path.exists(cache.directory)  # Created on the first write
+        cache.put(self.url, '{}')
+        assert cache.get(self.url).json() == {}
+
+    def test_unreadable_entry(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        with open(cache.path(self.url), 'w') as file:
+            file.write('{invalid')
+        assert cache.get(self.url) is None
+        assert not os.path.isfile(cache.path(self.url))
+
+    def test_evict(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), max_size=300)
+        cache.put(f'{self.url}/1', 'a' * 100)
+        os.utime(cache.path(f'{self.url}/1'), (0, 0))  # Least recently used
+        cache.put(f'{self.url}/2', 'b' * 100)
+        cache.put(f'{self.url}/3', 'c' * 100)
+        assert cache.get(f'{self.url}/1') is None
+        assert cache.get(f'{self.url}/3') is not None
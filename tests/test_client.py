@@ -0,0 +1,104 @@
+import time
+
+import pytest
+import requests
+
+from api.breaker import BreakerState, CircuitOpenError
+
+from api.cache import ResponseCache
+from api.client import Client, DeadlineExceeded, lane
+from api.limiter import Lane, RateLimiter
+
+
+class FakeSession:
+    """Session stand-in returning the given status codes in order"""
+
+    def __init__(self, *status_codes):
+        self.status_codes = list(status_codes)
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        response = requests.Response()
+        response.status_code = self.status_codes[self.calls]
+        response.url = url
+        response._content = b'{"MRData": {"total": "0"}}'
+        self.calls += 1
+        return response
+
+
+class TestClient:
+    def setup_method(self):
+        self.url = 'https://api.jolpi.ca/ergast/f1/current/next'
+
+    def test_lane(self):
+        assert lane('https://api.jolpi.ca/ergast/f1/2024/last/results?limit=1') is Lane.RESULTS
+        assert lane('https://api.jolpi.ca/ergast/f1/2024/') is Lane.BACKGROUND
+
+    def test_delay(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), backoff=1)
+        assert 0 <= client.delay(2) <= 4
+
+    def test_delay_2(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)))
+        assert client.delay(0, '3') == 3
+
+    def test_get(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), backoff=0)
+        client.session = FakeSession(503, 429, 200)
+        assert client.get(self.url).status_code == 200
+        assert client.session.calls == 3
+
+    def test_get_2(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), retries=1, backoff=0)
+        client.session = FakeSession(503, 503, 200)
+        assert client.get(self.url).status_code == 503
+        assert self.url in client.timings
+
+    def test_get_json(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)))
+        client.session = FakeSession(200)
+        client.get_json(self.url, ttl=60)
+        assert client.get_json(self.url, ttl=60) == {'MRData': {'total': '0'}}
+        assert client.session.calls == 1
+
+    def test_get_3(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), retries=0)
+        client.session = FakeSession(503, 503, 503, 200)
+        for _ in range(3):
+            client.get(self.url)
+        with pytest.raises(CircuitOpenError):
+            client.get(self.url)
+        assert client.session.calls == 3  # Failed fast
+        assert client.breakers['next'].state is BreakerState.OPEN
+
+    def test_get_4(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), retries=0)
+        client.session = FakeSession(503, 200)
+        client.get(self.url)
+        client.get(self.url)
+        assert client.breakers['next'].failures == 0
+
+    def test_get_5(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)))
+        client.session = FakeSession(200)
+        with pytest.raises(DeadlineExceeded):
+            client.get(self.url, deadline=time.monotonic())
+        assert client.session.calls == 0
+
+    def test_get_6(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)))
+        client.session = FakeSession(503, 200)
+        client.delay = lambda attempt, retry_after=None: 5
+        with pytest.raises(DeadlineExceeded):
+            client.get(self.url, deadline=time.monotonic() + 1)  # Not retried past the deadline
+        assert client.session.calls == 1
+
+    def test_get_7(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), limiter=RateLimiter(burst=1))
+        client.session = FakeSession(200, 200, 200, 200)
+        client.get(self.url)
+        for _ in range(3):
+            with pytest.raises(DeadlineExceeded):
+                client.get(self.url, deadline=time.monotonic() + 0.3)  # Rate limited past the deadline
+        assert client.session.calls == 1
+        assert client.breakers['next'].state is BreakerState.CLOSED and client.breakers['next'].failures == 0
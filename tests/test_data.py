@@ -1,19 +1,157 @@
+import pickle
 import time
 
 import pytest
+import requests
 
+from api.breaker import CircuitOpenError
+from api.cache import ResponseCache
+from api.client import Client, DeadlineExceeded
 from api.data import Data
-from constants import UPDATE_RATE
+from api.transport import Fault, ReplayTransport
+from data.update_status import UpdateStatus
+
+
+class TimedTransport(ReplayTransport):
+    """Replay transport recording when each request was in flight"""
+
+    def __init__(self, latency: float):
+        super().__init__(latency=latency)
+        self.timings = {}
+
+    def send(self, request: requests.PreparedRequest, timeout=None, **kwargs) -> requests.Response:
+        start = time.monotonic()
+        response = super().send(request, timeout, **kwargs)
+        self.timings[request.url.split('/current/')[1].split('?')[0] or 'schedule'] = start, time.monotonic()
+        return response
 
 
 class TestData:
-    def setup_method(self):
-        self.data = Data()
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.snapshot = str(tmp_path / 'data.pickle')
+        self.transport = ReplayTransport()
+        self.data = Data(client=Client(ResponseCache(str(tmp_path)), transport=self.transport))
+
+    def test_data(self):
+        assert len(self.data.constructors) == 10
+        assert self.data.driver_standings.items[0].item.code == 'VER'
+        assert self.data.last_gp.gp.round == 20
+        assert self.data.next_gp.round == 21
+        assert len(self.data.next_gp.qualifying.grid) == 20
+        assert len(self.transport.requests) == 7  # Every endpoint fetched once
+
+    def test_data_2(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path / 'cold')), transport=ReplayTransport())
+        get_json = client.get_json
+
+        def expiring(url, *args):
+            if '/next/qualifying' in url:
+                raise DeadlineExceeded('Refresh time budget exhausted')
+            return get_json(url, *args)
+
+        client.get_json = expiring
+        data = Data(client=client)  # Booted without the qualifying grid
+        assert data.deferred == {'sessions'}
+        assert data.next_gp.qualifying.grid is None
+        assert data.driver_standings.items[0].item.code == 'VER'
+
+    def test_prefetch(self, tmp_path):
+        transport = TimedTransport(latency=0.1)
+        Data(client=Client(ResponseCache(str(tmp_path / 'cold')), transport=transport))
+        timings = transport.timings  # Season, then independent endpoints, then sessions: 3 round trips, not 7
+        independent = ('constructors', 'driverStandings', 'last/results', 'schedule')
+        assert max(timings[name][0] for name in independent) < min(timings[name][1] for name in independent)
+        assert all(timings['constructorStandings'][1] <= timings[name][0] for name in independent)  # Season first
+        for session in ('next/qualifying', 'next/sprint'):  # After the schedule they are looked up in
+            assert timings[session][0] >= max(timings[name][1] for name in independent)
+
+    def test_update(self):
+        self.transport.requests.clear()
+        last_gp, standings = self.data.last_gp, self.data.driver_standings
+        self.data.update()
+        assert all(url.endswith('?limit=1') for url in self.transport.requests)  # Only probed
+        assert self.data.last_gp is last_gp
+        assert self.data.driver_standings is standings
+        assert self.data.next_gp.round == 21
+
+    def test_update_2(self):
+        self.data.signatures['last_gp'] = None  # New race results
+        last_gp, standings = self.data.last_gp, self.data.driver_standings
+        self.data.update()
+        assert self.data.last_gp is not last_gp
+        assert self.data.driver_standings.items[1:] == standings.items[1:]  # Not rebuilt, only champion re-evaluated
+        assert len(self.data.schedule) == 4
+
+    def test_invalidated(self):
+        assert self.data.invalidated(set()) == set()
+        assert self.data.invalidated({'last_gp'}) == {'last_gp', 'schedule', 'champions'}
+        assert self.data.invalidated({'standings'}) == {'standings', 'champions'}
+
+    def test_load_snapshot(self):
+        assert self.data.save_snapshot(self.snapshot) is True
+        self.transport.requests.clear()
+        data = Data.load_snapshot(self.snapshot, self.data.client)
+        assert data == self.data
+        assert data.restored is True
+        assert data.signatures == self.data.signatures
+        assert data.drivers['max_verstappen'] is self.data.drivers['max_verstappen']  # Re-interned
+        assert self.transport.requests == []  # Rendered without any request
+
+    def test_load_snapshot_2(self):
+        data = Data.load_snapshot(self.snapshot, self.data.client)
+        assert data is None  # No snapshot yet
+
+    def test_load_snapshot_3(self, caplog):
+        with open(self.snapshot, 'wb') as file:
+            file.write(b'corrupt')
+        assert Data.load_snapshot(self.snapshot, self.data.client) is None
+        assert 'Unable to load data snapshot' in caplog.text
+
+    def test_load_snapshot_4(self):
+        with open(self.snapshot, 'wb') as file:
+            pickle.dump(('0.0.0', {}), file)
+        assert Data.load_snapshot(self.snapshot, self.data.client) is None  # Saved by another version
+
+    def test_load_snapshot_5(self):
+        self.data.save_snapshot(self.snapshot)
+        data = Data.load_snapshot(self.snapshot, self.data.client).refreshed()
+        assert data.restored is False
+        assert all(url.endswith('?limit=1') for url in self.transport.requests[7:])  # Revalidated by probes only
+
+    def test_degraded(self):
+        data = self.data.degraded(UpdateStatus.NETWORK_ERROR)
+        assert data.driver_standings is self.data.driver_standings  # Last good data kept
+        assert data.age >= 0
+        assert self.data.status is UpdateStatus.SUCCESS
+
+    def test_same(self):
+        assert self.data.same(self.data.refreshed())  # Nothing changed upstream
+        assert not self.data.same(self.data.degraded(UpdateStatus.NETWORK_ERROR))
+
+    def test_refreshed(self):
+        self.data.client.retries = 0
+        self.transport.faults['*'] = [Fault.CONNECTION_ERROR] * 6
+        for _ in range(3):
+            with pytest.raises(requests.ConnectionError):
+                self.data.refreshed()
+        self.transport.requests.clear()
+        with pytest.raises(CircuitOpenError):
+            self.data.refreshed()
+        assert self.transport.requests == []  # Upstream no longer hammered
+
+    def test_refreshed_2(self):
+        get_json = self.data.client.get_json
 
-    @pytest.mark.slow
-    def test_should_update(self):
-        time.sleep(UPDATE_RATE)
-        assert self.data.should_update() is True
+        def expiring(url, *args):
+            if 'last/results?limit=100' in url:
+                raise DeadlineExceeded('Refresh time budget exhausted')
+            return get_json(url, *args)
 
-    def test_should_update_2(self):
-        assert self.data.should_update() is False
+        self.data.client.get_json = expiring
+        self.data.signatures['last_gp'] = self.data.signatures['standings'] = None  # New race results
+        data = self.data.refreshed()
+        assert data.deferred == {'last_gp'}
+        assert data.last_gp is self.data.last_gp
+        assert data.driver_standings is not self.data.driver_standings  # Fetched in time, committed
+        assert data.signatures['last_gp'] is None  # Detected as changed again on the next refresh
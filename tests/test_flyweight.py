@@ -0,0 +1,41 @@
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from data.circuit import Circuit
+from data.constructor import Constructor
+from data.driver import Driver
+from data.standings import StandingsItem
+
+
+class TestFlyweight:
+    def setup_method(self):
+        self.constructor = Constructor.get('mclaren', 'McLaren', 'British')
+        self.driver = Driver.get('norris', 'Lando', 'Norris', 'NOR', 4, 'British', self.constructor)
+
+    def test_get(self):
+        assert Constructor.get('mclaren', 'McLaren', 'British') is self.constructor
+        assert Circuit.get('monza', 'Autodromo Nazionale di Monza', 'Monza', 'Italy') is \
+            Circuit.get('monza', 'Autodromo Nazionale di Monza', 'Monza', 'Italy')
+
+    def test_get_2(self):
+        driver = Driver.get('norris', 'Lando', 'Norris', 'NOR', 1, 'British', self.constructor)
+        assert driver is not self.driver  # Different arguments, different entity
+
+    def test_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            self.driver.code = 'LAN'
+
+    def test_slots(self):
+        assert not hasattr(self.driver, '__dict__')
+        assert not hasattr(StandingsItem(self.driver, 1, 25.0), '__dict__')
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(self.driver)) is self.driver
+
+    def test_pickle_2(self):
+        item = StandingsItem(self.driver, 1, 25.0, True)
+        assert pickle.loads(pickle.dumps(item)) == item
+        assert copy.copy(item) == item
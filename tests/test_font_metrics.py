@@ -0,0 +1,39 @@
+import glob
+
+import pytest
+from PIL import Image, ImageDraw
+
+import utils
+
+FONTS = sorted(glob.glob('assets/fonts/*.pil'))
+TEXT = ['', ' ', 'C', 'VER', 'Drivers', 'Constructors', 'Qualifying', 'Sprint', 'Schedule', 'Upcoming',
+        'In Progress', '437', '12.5', '1:40:55.800', '+1:03.302', '+1 Lap', 'DNF', 'Red Bull', 'Aston Martin',
+        'São Paulo GP', 'Hülkenberg', 'Pérez', 'Sun, Nov 03', '18:30', '0.1.5',
+        ''.join(chr(code) for code in range(32, 256))]
+
+
+@pytest.mark.parametrize('path', FONTS)
+class TestFontMetrics:
+    def setup_method(self):
+        self.draw = ImageDraw.Draw(Image.new('RGB', (64, 32)))
+
+    @pytest.mark.parametrize('text', TEXT)
+    def test_size(self, path, text):
+        font = utils.load_font(path)
+        bbox = self.draw.textbbox((0, 0), text, font)
+        assert utils.FontMetrics(font).size(text) == (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+    @pytest.mark.parametrize('code', range(32, 256))
+    def test_size_2(self, path, code):
+        font = utils.load_font(path)
+        bbox = self.draw.textbbox((0, 0), chr(code), font)
+        assert utils.FontMetrics(font).size(chr(code)) == (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+    def test_size_3(self, path):
+        assert utils.FontMetrics(utils.load_font(path)).size('Ő') is None
+
+    def test_get_text_size(self, path):
+        font = utils.load_font(path)
+        utils.load_font_metrics(font)
+        bbox = self.draw.textbbox((0, 0), 'VER\nNOR', font)
+        assert utils.get_text_size(self.draw, 'VER\nNOR', font) == (bbox[2] - bbox[0], bbox[3] - bbox[1])
@@ -0,0 +1,38 @@
+from PIL import Image
+
+from matrix.layout import Layout
+from renderer.frame_cache import FrameCache
+
+
+class TestFrameCache:
+    def setup_method(self):
+        self.layout = Layout(64, 32)
+        self.frames = [Image.new('RGB', (64, 32), (255, 0, 0))]
+
+    def test_key(self):
+        assert FrameCache.key('Schedule', self.layout, [1, 2]) == FrameCache.key('Schedule', self.layout, [1, 2])
+
+    def test_key_2(self):
+        assert FrameCache.key('Schedule', self.layout, [1, 2]) != FrameCache.key('Schedule', self.layout, [1, 3])
+
+    def test_key_3(self):
+        assert FrameCache.key('Schedule', self.layout, [1]) != FrameCache.key('Schedule', Layout(128, 64), [1])
+
+    def test_get(self):
+        cache = FrameCache()
+        key = FrameCache.key('Schedule', self.layout, [1])
+        cache.put(key, self.frames)
+        self.frames[0].paste((0, 0, 0), (0, 0, 64, 32))  # Canvas drawn on after caching
+        assert cache.get(key)[0].getpixel((0, 0)) == (255, 0, 0)
+
+    def test_get_2(self):
+        cache = FrameCache()
+        cache.put(FrameCache.key('Schedule', self.layout, [1]), self.frames)
+        cache.put(FrameCache.key('Schedule', self.layout, [2]), self.frames)
+        assert cache.get(FrameCache.key('Schedule', self.layout, [1])) is None
+
+    def test_persist(self, tmp_path):
+        key = FrameCache.key('Schedule', self.layout, [1])
+        FrameCache(str(tmp_path)).put(key, self.frames * 2)
+        frames = FrameCache(str(tmp_path)).get(key)
+        assert [frame.size for frame in frames] == [(64, 32), (64, 32)]
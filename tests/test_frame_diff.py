@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from PIL import Image, ImageDraw
+
+from renderer import frame_diff
+from renderer.frame_diff import FrameDiff, dirty_rects
+
+
+class TestFrameDiff:
+    def setup_method(self):
+        self.matrix = SimpleNamespace(width=64, height=32)
+        self.screen = FrameDiff()
+        self.frame = Image.new('RGB', (64, 32))
+
+    def changed(self, *rects) -> Image.Image:
+        frame = self.frame.copy()
+        draw = ImageDraw.Draw(frame)
+        for rect in rects:
+            draw.rectangle(rect, fill=(255, 0, 0))
+        return frame
+
+    def test_dirty_rects(self):
+        assert dirty_rects(self.frame, self.frame.copy()) == []
+        assert dirty_rects(self.frame, self.changed((2, 1, 5, 3), (10, 20, 12, 20))) == [(2, 1, 6, 4), (10, 20, 13, 21)]
+
+    def test_dirty_rects_2(self, monkeypatch):
+        monkeypatch.setattr(frame_diff, 'np', None)  # Without NumPy
+        assert dirty_rects(self.frame, self.changed((2, 1, 5, 3), (10, 20, 12, 20))) == [(2, 1, 13, 21)]
+
+    def test_dirty_rects_3(self):
+        rects = dirty_rects(self.frame, self.changed(*[(0, y, 0, y) for y in range(0, 32, 2)]), limit=4)
+        assert rects == [(0, 0, 1, 31)]  # Beyond the limit, a single rectangle
+
+    def test_update(self):
+        assert self.screen.update(self.matrix, self.frame) == [(self.frame, 0, 0)]  # Unknown screen, full frame
+        assert self.screen.update(self.matrix, self.frame.copy()) == []  # Identical, skipped
+        assert (self.screen.pushed, self.screen.skipped) == (2048, 2048)
+
+    def test_update_2(self):
+        self.screen.update(self.matrix, self.frame)
+        [(region, x, y)] = self.screen.update(self.matrix, self.changed((2, 1, 5, 3)))
+        assert (region.size, x, y) == ((4, 3), 2, 1)  # Dirty rectangle only
+        assert self.screen.skipped == 2048 - 12
+
+    def test_update_3(self):
+        self.screen.update(self.matrix, self.frame)
+        self.screen.invalidate()
+        assert len(self.screen.update(self.matrix, self.frame)) == 1
+        self.screen.update(SimpleNamespace(width=64, height=32), self.frame)
+        assert self.screen.skipped == 0  # Another matrix, full frames
+
+    def test_update_4(self):
+        image = Image.new('RGB', (64, 100))  # Tall canvas, only its top is visible
+        self.screen.update(self.matrix, image)
+        assert self.screen.frame.size == (64, 32)
+        assert self.screen.update(self.matrix, self.frame) == []
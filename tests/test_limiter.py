@@ -0,0 +1,58 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from api.limiter import DeadlineExceeded, Lane, RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    def test_wait(self):
+        bucket = TokenBucket(capacity=2, rate=4)
+        bucket.take()
+        bucket.take()
+        assert bucket.wait(bucket.updated) == 0.25
+        assert bucket.wait(bucket.updated + 1) == 0  # Refilled, up to capacity
+        assert bucket.tokens == 2
+
+
+class TestRateLimiter:
+    def test_acquire(self):
+        limiter = RateLimiter(burst=10, hourly=3600)
+        with mock.patch.object(limiter.condition, 'wait', side_effect=AssertionError('Waited')):
+            for _ in range(10):
+                limiter.acquire()  # Within the burst, never waits
+        assert limiter.acquire() >= 0.05  # Burst exhausted
+
+    def test_acquire_2(self):
+        limiter = RateLimiter(burst=10, hourly=36)  # 1 request per 100s once the budget is spent
+        for _ in range(10):
+            limiter.acquire()
+        assert limiter.budget < 27
+
+    def test_acquire_3(self):
+        limiter = RateLimiter(burst=10, hourly=3600)
+        for _ in range(10):
+            limiter.acquire()
+        order = []
+
+        def request(lane: Lane):
+            limiter.acquire(lane)
+            order.append(lane)
+
+        threads = [threading.Thread(target=request, args=(lane,)) for lane in (Lane.BACKGROUND, Lane.RESULTS)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+        assert order == [Lane.RESULTS, Lane.BACKGROUND]  # Results served first
+
+    def test_acquire_4(self):
+        limiter = RateLimiter(burst=1, hourly=3600)
+        limiter.acquire()
+        with mock.patch.object(limiter.condition, 'wait', side_effect=AssertionError('Waited')), \
+                pytest.raises(DeadlineExceeded):
+            limiter.acquire(deadline=time.monotonic() + 0.3)  # Next token in 1s, not waited for
+        assert not limiter.waiting and limiter.burst.tokens < 1
@@ -0,0 +1,14 @@
+from unittest import mock
+
+import requests
+
+import main
+
+
+class TestMain:
+    def test_cold_start(self):
+        data = object()
+        errors = [requests.HTTPError('503 Server Error'), requests.ConnectionError('Network unreachable')]
+        with mock.patch('main.Data', side_effect=[*errors, data]), mock.patch('time.sleep') as sleep:
+            assert main.cold_start() is data  # Retried, rather than exiting at boot
+        assert sleep.call_count == 2
@@ -0,0 +1,84 @@
+import urllib.request
+
+from api.client import endpoint
+from metrics import Counter, Gauge, Histogram, Registry, format_labels, timed
+
+
+class TestMetrics:
+    def test_counter(self):
+        counter = Counter('requests_total', 'Requests')
+        counter.inc(endpoint='next')
+        counter.inc(2, endpoint='next')
+        assert counter.get(endpoint='next') == 3
+        assert counter.get(endpoint='last') is None
+
+    def test_gauge(self):
+        gauge = Gauge('fps', 'Frame rate')
+        gauge.set(20, board='Schedule')
+        gauge.set(18.5, board='Schedule')
+        assert gauge.get(board='Schedule') == 18.5
+
+    def test_histogram(self):
+        histogram = Histogram('seconds', 'Duration', buckets=(0.1, 1))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+        assert list(histogram.samples()) == [('seconds_bucket', (('le', '0.1'),), 1),
+                                             ('seconds_bucket', (('le', '1'),), 2),
+                                             ('seconds_bucket', (('le', '+Inf'),), 3),
+                                             ('seconds_sum', (), 5.55),
+                                             ('seconds_count', (), 3)]
+
+    def test_timed(self):
+        histogram = Histogram('seconds', 'Duration')
+
+        @timed(histogram, dataset='schedule')
+        def parse():
+            return 'parsed'
+
+        assert parse() == 'parsed'
+        assert histogram.get(dataset='schedule')[2] == 1
+
+    def test_format_labels(self):
+        assert format_labels(()) == ''
+        assert format_labels((('board', 'LastGP'), ('le', '0.1'))) == '{board="LastGP",le="0.1"}'
+        assert format_labels((('name', 'a"b\\c'),)) == '{name="a\\"b\\\\c"}'
+
+
+class TestRegistry:
+    def test_expose(self):
+        registry = Registry()
+        registry.counter('f1_requests_total', 'Requests').inc(endpoint='next', status='200')
+        registry.gauge('f1_fps', 'Frame rate').set(19.8, board='Schedule')
+        assert registry.expose() == ('# HELP f1_requests_total Requests\n'
+                                     '# TYPE f1_requests_total counter\n'
+                                     'f1_requests_total{endpoint="next",status="200"} 1\n'
+                                     '# HELP f1_fps Frame rate\n'
+                                     '# TYPE f1_fps gauge\n'
+                                     'f1_fps{board="Schedule"} 19.8\n')
+
+    def test_write(self, tmp_path):
+        registry = Registry()
+        registry.counter('f1_requests_total', 'Requests').inc()
+        path = tmp_path / 'f1.prom'
+        registry.write(str(path))
+        assert path.read_text() == registry.expose()
+
+    def test_serve(self):
+        registry = Registry()
+        registry.gauge('f1_fps', 'Frame rate').set(20)
+        server = registry.serve(0)
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{server.server_port}/metrics') as response:
+                assert response.read().decode() == registry.expose()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestEndpoint:
+    def test_endpoint(self):
+        assert endpoint('https://api.jolpi.ca/ergast/f1/current/next/qualifying') == 'next/qualifying'
+        assert endpoint('https://api.jolpi.ca/ergast/f1/2024/driverStandings') == 'driverStandings'
+        assert endpoint('https://api.jolpi.ca/ergast/f1/2024') == 'schedule'
+        assert endpoint('https://api.jolpi.ca/ergast/f1/current/last/results?limit=1') == 'last/results'
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+from PIL import ImageChops
+
+from matrix.layout import Layout
+from renderer.frame_diff import FrameDiff
+from renderer.next_gp import NextGP
+from renderer.playlist import Marquee, Slide, Ticks
+from tests.helpers import HeadlessMatrix, create, load
+from utils import Color, Position, align_text, get_text_size
+
+
+class TestNextGP:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.data = load()
+        self.gp = self.data.next_gp
+        self.matrix = HeadlessMatrix(64, 32)
+        self.pushes = []
+        self.matrix.SetImage = lambda image, x=0, y=0, unsafe=True: self.pushes.append((image.size, x, y))
+        self.renderer = create(NextGP, self.matrix, Layout(64, 32), self.data)
+        self.player = self.renderer.player
+        self.player.screen = FrameDiff()
+
+    def test_next_session(self):
+        assert self.gp.next_session(self.gp.sprint.dt - timedelta(hours=1)) == ('Sprint', self.gp.sprint.dt)
+        assert self.gp.next_session(self.gp.qualifying.dt - timedelta(hours=1)) == ('Qualifying',
+                                                                                    self.gp.qualifying.dt)
+        assert self.gp.next_session(self.gp.dt - timedelta(hours=1)) == ('Race', self.gp.dt)
+        assert self.gp.next_session(self.gp.dt) is None
+
+    def test_render_digits(self):
+        text = '2d 04:13:07'
+        self.renderer.new_canvas(64, 32)
+        self.renderer.render_digits(text)
+        sprites = self.renderer.canvas.copy()
+
+        self.renderer.new_canvas(64, 32)
+        x, y = align_text(get_text_size(self.renderer.draw, text, self.renderer.draw.getfont()), 64, 32,
+                          Position.CENTER, Position.BOTTOM)
+        self.renderer.draw.text((x, y + 1), text, Color.WHITE)
+        assert ImageChops.difference(sprites, self.renderer.canvas).getbbox() is None  # Same as drawn text
+
+    def test_render_digits_2(self):
+        self.renderer.new_canvas(64, 32)
+        self.renderer.render_digits('2d 04:13:07')
+        left, top, right, bottom = self.renderer.render_digits('2d 04:13:06', '2d 04:13:07')
+        assert right - left == 4  # Last digit only
+
+    def test_render_countdown(self):
+        start = datetime(2026, 1, 1).astimezone()
+        clock = iter([start - timedelta(days=2, seconds=5 - tick) for tick in range(10)])
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return next(clock)
+
+        self.renderer.new_canvas(64, 32)
+        with mock.patch('time.sleep'), mock.patch('renderer.next_gp.datetime', Clock), \
+                mock.patch.object(self.player, 'push', wraps=self.player.push) as push:
+            self.player.play([self.renderer.render_countdown('Race', start)])
+        assert push.call_count == 8  # Full frame, then a tick every second
+        assert self.pushes[0] == ((64, 32), 0, 0)
+        assert all(width * height <= 39 * 6 for (width, height), _, _ in self.pushes[1:])  # Digits only
+
+    def test_title_strip(self):
+        assert self.renderer.title_strip(self.gp.name) is None  # Fits
+        strip = self.renderer.title_strip('70th Anniversary GP')
+        period = strip.width - 64
+        assert ImageChops.difference(strip.crop((0, 0, 64, strip.height)),
+                                     strip.crop((period, 0, period + 64, strip.height))).getbbox() is None  # Loops
+
+    def test_marquee(self):
+        self.gp.name = '70th Anniversary GP'
+        strip = self.renderer.title_strip(self.gp.name)
+        with mock.patch('time.sleep'), mock.patch.object(self.player, 'push', wraps=self.player.push) as push:
+            self.player.play([Marquee(self.renderer.canvas, strip)])
+        assert push.call_count == 1 + strip.width - 64  # Image, then a window per pixel
+        assert all(call.args[0].size == (64, strip.height) for call in push.call_args_list[1:])
+
+    def test_playlist(self):
+        start = self.gp.dt - timedelta(days=1)
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return start
+
+        with mock.patch('renderer.next_gp.datetime', Clock):
+            title, countdown = self.renderer.playlist()
+        assert isinstance(title, Marquee) and title.strip is None
+        assert isinstance(countdown, Ticks) and not self.pushes  # Nothing displayed until played
+
+        with mock.patch('renderer.next_gp.datetime', Clock), mock.patch('renderer.next_gp.COUNTDOWN_WINDOW', 0):
+            assert isinstance(self.renderer.playlist()[1], Slide)
+
+    def test_render_digits_3(self):
+        self.renderer.new_canvas(64, 32)
+        self.renderer.canvas.paste((255, 0, 0), (0, 0, 64, 32))  # Track drawn across the digits rows
+        shown = self.renderer.render_digits('2d 04:13:07')
+        region = self.renderer.render_digits('23:59:59', '2d 04:13:07')
+        assert region == shown  # Previous text's box, bounding the shorter text
+        assert self.renderer.canvas.getpixel((0, region[1])) == (255, 0, 0)  # Outside the text, kept
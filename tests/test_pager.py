@@ -0,0 +1,56 @@
+from urllib.parse import parse_qs, urlsplit
+
+from api.pager import merge, paged, paginate
+
+
+class FakeEndpoint:
+    """Paginated results endpoint, counting results as records like the API does"""
+
+    def __init__(self, races: int, results: int):
+        self.rows = [(race, result) for race in range(1, races + 1) for result in range(1, results + 1)]
+        self.urls = []
+
+    def __call__(self, url: str) -> dict:
+        self.urls.append(url)
+        query = parse_qs(urlsplit(url).query)
+        offset, limit = int(query['offset'][0]), int(query['limit'][0])
+        races = []
+        for race, result in self.rows[offset:offset + limit]:
+            if not races or races[-1]['round'] != str(race):
+                races.append({'round': str(race), 'Results': []})
+            races[-1]['Results'].append({'position': str(result)})
+        return {'MRData': {'limit': str(limit), 'offset': str(offset), 'total': str(len(self.rows)),
+                           'RaceTable': {'season': '2024', 'Races': races}}}
+
+
+class TestPager:
+    def setup_method(self):
+        self.url = 'https://api.jolpi.ca/ergast/f1/2024/results'
+
+    def test_paged(self):
+        assert paged(self.url, 100) == f'{self.url}?limit=100&offset=0'
+        assert paged(f'{self.url}?format=json', 100, 200) == f'{self.url}?format=json&limit=100&offset=200'
+
+    def test_merge(self):
+        records = [{'round': '1', 'Results': [1, 2]}]
+        merge(records, [{'round': '1', 'Results': [3]}, {'round': '2', 'Results': [1]}])
+        assert records == [{'round': '1', 'Results': [1, 2, 3]}, {'round': '2', 'Results': [1]}]
+
+    def test_paginate(self):
+        fetch = FakeEndpoint(races=24, results=20)
+        response = paginate(fetch, self.url, page_size=100)
+        races = response['MRData']['RaceTable']['Races']
+        assert len(fetch.urls) == 5
+        assert [len(race['Results']) for race in races] == [20] * 24  # Races split across pages merged
+        assert response['MRData']['limit'] == '480'
+
+    def test_paginate_2(self):
+        fetch = FakeEndpoint(races=1, results=20)
+        paginate(fetch, self.url, page_size=100)
+        assert fetch.urls == [f'{self.url}?limit=100&offset=0']  # Single page
+
+    def test_paginate_3(self):
+        fetch = FakeEndpoint(races=1, results=20)
+        url = f'{self.url}?limit=1&offset=0'
+        assert len(paginate(fetch, url)['MRData']['RaceTable']['Races']) == 1
+        assert fetch.urls == [url]  # Explicit limit fetched as is
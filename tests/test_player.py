@@ -0,0 +1,88 @@
+from unittest import mock
+
+import pytest
+from PIL import Image, ImageDraw
+
+from data.update_status import UpdateStatus
+from matrix.layout import Layout
+from renderer.frame_diff import FrameDiff
+from renderer.main import MainRenderer
+from renderer.player import Player
+from renderer.playlist import Scroll, Slide, Ticks
+from tests.helpers import BOARDS, HeadlessMatrix, create, load
+
+
+class TestPlayer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.matrix = HeadlessMatrix(64, 32)
+        self.player = Player(self.matrix)
+        self.player.screen = FrameDiff()
+
+    def test_play(self):
+        tall = Image.new('RGB', (64, 40), (255, 0, 0))
+        with mock.patch('time.sleep') as sleep:
+            self.player.play([Slide(Image.new('RGB', (64, 32)), 5), Scroll(tall)], 'Test')
+        assert self.matrix.pushes == 2 + 8  # Slide, scroll's first frame, then a swap per row
+        assert sleep.call_args_list[0] == mock.call(5)
+
+    def test_play_2(self):
+        with mock.patch('time.sleep') as sleep:
+            self.player.play([Slide(Image.new('RGB', (64, 32)), 0)])
+        assert self.matrix.pushes == 1
+        sleep.assert_not_called()  # Left on screen
+
+    def test_play_3(self):
+        regions = iter([(Image.new('RGB', (64, 32)), 0, 0), None, (Image.new('RGB', (4, 6), (255, 255, 255)), 8, 8)])
+        with mock.patch('time.sleep'), mock.patch.object(self.player, 'push', wraps=self.player.push) as push:
+            self.player.play([Ticks(lambda: next(regions), 1.0, 3)])
+        assert push.call_count == 2  # Unchanged tick skipped
+
+    def test_playlist(self):
+        data = load()
+        with mock.patch('time.sleep'):
+            for board in BOARDS:
+                renderer = create(board, self.matrix, Layout(64, 32), data)
+                pushes = self.matrix.pushes
+                assert renderer.playlist()
+                assert self.matrix.pushes == pushes  # Drawn without being displayed
+
+    def test_rotation(self):
+        main = MainRenderer.__new__(MainRenderer)  # Without starting the refresher & render loop
+        main.status = UpdateStatus.SUCCESS
+        rotation = main.boards()
+        assert [next(rotation) for _ in MainRenderer.BOARDS] == list(MainRenderer.BOARDS)
+        main.status = UpdateStatus.NETWORK_ERROR  # Stale data, shown after the rotation
+        assert next(rotation) == 'error'
+        main.status = UpdateStatus.SUCCESS
+        assert [next(rotation) for _ in MainRenderer.BOARDS] + [next(rotation)] == [*MainRenderer.BOARDS,
+                                                                                    MainRenderer.BOARDS[0]]
+
+    def test_render(self):
+        data = load()
+        fresh = data.degraded(UpdateStatus.SUCCESS)
+        played = []
+
+        def prepare(main, name):
+            return name, [main.data]  # Marks the snapshot the playlist was drawn from
+
+        def play(items, board=''):
+            played.append((board, items[0]))
+            if len(played) == 3:
+                raise KeyboardInterrupt
+
+        canvas = Image.new('RGB', (64, 32))
+        with mock.patch('renderer.main.Refresher') as refresher, \
+                mock.patch.object(MainRenderer, 'prepare', autospec=True, side_effect=prepare), \
+                mock.patch.object(Player, 'play', side_effect=play), pytest.raises(SystemExit):
+            refresher.return_value.latest.side_effect = [None, fresh, None]
+            MainRenderer(self.matrix, canvas, ImageDraw.Draw(canvas), Layout(64, 32), data)
+        assert played == [('constructor_standings', data), ('driver_standings', fresh), ('last_gp', fresh)]
+
+    def test_swap(self):
+        tall = Image.new('RGB', (64, 40))
+        with mock.patch('time.sleep'), mock.patch.object(self.matrix, 'CreateFrameCanvas',
+                                                         wraps=self.matrix.CreateFrameCanvas) as create_canvas:
+            for _ in range(3):  # Boards are rebuilt along with their player on every new snapshot
+                Player(self.matrix).play([Scroll(tall)])
+        assert create_canvas.call_count == 1  # Never freed by the matrix, created once
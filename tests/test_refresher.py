@@ -0,0 +1,107 @@
+import requests
+
+from api.refresher import Refresher
+from data.update_status import UpdateStatus
+
+
+class FakeData:
+    """Data stand-in counting refreshes"""
+
+    def __init__(self, version: int = 0, fail: Exception = None, changes: bool = True):
+        self.version = version
+        self.fail = fail
+        self.changes = changes
+        self.status = UpdateStatus.SUCCESS
+        self.deferred = set()
+        self.age = 0
+        self.schedule = []
+        self.last_gp = None
+        self.next_gp = None
+        self.restored = False
+        self.saved = None
+        self.last_updated = None
+        self.signatures = {}
+
+    def refreshed(self) -> 'FakeData':
+        if self.fail:
+            raise self.fail
+        return FakeData(self.version + 1 if self.changes else self.version, changes=self.changes)
+
+    def same(self, other: 'FakeData') -> bool:
+        return self.version == other.version and self.status is other.status
+
+    def degraded(self, status: UpdateStatus) -> 'FakeData':
+        data = FakeData(self.version, self.fail)
+        data.status = status
+        return data
+
+    def save_snapshot(self, path: str) -> bool:
+        self.saved = path
+        return True
+
+
+class TestRefresher:
+    def test_latest(self):
+        refresher = Refresher(FakeData())
+        assert refresher.latest() is None
+
+    def test_refresh(self):
+        data = FakeData()
+        refresher = Refresher(data)
+        assert refresher.refresh() is True
+        assert data.version == 0  # Current snapshot left untouched
+        assert refresher.latest().version == 1
+        assert refresher.latest() is None  # Only handed over once
+
+    def test_refresh_2(self, caplog):
+        refresher = Refresher(FakeData(fail=requests.ConnectionError('Network unreachable')))
+        assert refresher.refresh() is False
+        data = refresher.latest()
+        assert (data.version, data.status) == (0, UpdateStatus.NETWORK_ERROR)  # Last good data, flagged as stale
+        assert 'Unable to refresh data' in caplog.text
+
+    def test_refresh_3(self):
+        refresher = Refresher(FakeData(fail=requests.ConnectionError('Network unreachable')))
+        refresher.refresh()
+        assert refresher.scheduler.last_poll is not None
+        assert refresher.scheduler.failures == 1
+
+    def test_refresh_5(self):
+        refresher = Refresher(FakeData(fail=KeyError('MRData')))
+        refresher.refresh()
+        assert refresher.latest().status is UpdateStatus.API_ERROR
+        refresher.refresh()
+        assert refresher.latest() is None  # Status unchanged, nothing new to hand over
+
+    def test_refresh_4(self):
+        refresher = Refresher(FakeData(), snapshot='data.pickle')
+        refresher.refresh()
+        assert refresher.latest_data.saved == 'data.pickle'  # Persisted for the next boot
+
+    def test_refresh_6(self):
+        snapshot = FakeData(1)
+        snapshot.deferred = {'last_gp'}
+        refresher = Refresher(FakeData())
+        refresher.latest_data.refreshed = lambda: snapshot
+        refresher.refresh()
+        assert refresher.scheduler.failures == 1  # Deferred datasets fetched soon
+
+    def test_run(self):
+        data = FakeData()
+        data.restored = True
+        refresher = Refresher(data)
+        refresher.stop()
+        refresher.run()
+        assert refresher.latest_data.version == 1  # Restored snapshot revalidated on start
+
+    def test_init(self):
+        data = FakeData()
+        data.deferred = {'sessions'}  # Booted past the time budget
+        assert Refresher(data).scheduler.failures == 1
+
+    def test_refresh_7(self):
+        data = FakeData(changes=False)
+        refresher = Refresher(data, snapshot=None)
+        assert refresher.refresh() is True
+        assert refresher.latest() is None  # Nothing new to display, boards aren't rebuilt
+        assert refresher.latest_data is data
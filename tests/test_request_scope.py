@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.request_scope import RequestScope
+
+
+class TestRequestScope:
+    def setup_method(self):
+        self.scope = RequestScope()
+        self.calls = 0
+
+    def fetch(self) -> dict:
+        self.calls += 1
+        return {'MRData': {}}
+
+    def test_get(self):
+        self.scope.get('url', self.fetch)
+        assert self.scope.get('url', self.fetch) == {'MRData': {}}
+        assert (self.calls, self.scope.fetched, self.scope.saved) == (1, 1, 1)
+
+    def test_get_2(self):
+        release = threading.Event()
+
+        def slow_fetch():
+            release.wait(1)
+            return self.fetch()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self.scope.get, 'url', slow_fetch) for _ in range(4)]
+            release.set()
+        assert all(future.result() == {'MRData': {}} for future in futures)
+        assert self.calls == 1
+
+    def test_get_3(self):
+        def failing_fetch():
+            raise ConnectionError
+
+        with pytest.raises(ConnectionError):
+            self.scope.get('url', failing_fetch)
+        self.scope.get('url', self.fetch)
+        assert self.calls == 1
+
+    def test_clear(self):
+        self.scope.get('url', self.fetch)
+        self.scope.get('url', self.fetch)
+        self.scope.clear()
+        self.scope.get('url', self.fetch)
+        assert (self.calls, self.scope.total_fetched, self.scope.total_saved) == (2, 1, 1)
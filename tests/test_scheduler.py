@@ -0,0 +1,71 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from api.cache import ResponseCache
+from api.client import Client
+from api.data import Data
+from api.scheduler import Scheduler, timeline
+from api.transport import ReplayTransport
+
+
+class TestScheduler:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data = Data(client=Client(ResponseCache(str(tmp_path)), transport=ReplayTransport()))
+        self.scheduler = Scheduler(interval=120, max_interval=600, window=3600, idle=86400)
+        self.scheduler.update(self.data)
+        self.race = self.scheduler.sessions[0]
+
+    def test_timeline(self):
+        sessions = timeline(self.data)
+        assert [(session.name, session.round) for session in sessions[:4]] == [('Sprint', 21), ('Qualifying', 21),
+                                                                               ('Race', 21), ('Qualifying', 22)]
+
+    def test_update(self):
+        assert (self.race.name, self.race.round) == ('Race', 21)  # Sprint & qualifying results published
+
+    def test_update_2(self):
+        self.scheduler.attempts = 3
+        data = SimpleNamespace(schedule=self.data.schedule[1:],
+                               last_gp=SimpleNamespace(gp=SimpleNamespace(round=21)),
+                               next_gp=self.data.schedule[1])
+        self.scheduler.update(data)
+        assert self.race not in self.scheduler.sessions
+        assert self.scheduler.attempts == 0
+
+    def test_delay(self):
+        assert self.scheduler.delay(self.race.start) == self.race.duration + 120  # Sleeps through the session
+
+    def test_delay_2(self):
+        next_session = self.scheduler.sessions[1]
+        now = next_session.end - timedelta(days=3)
+        assert self.scheduler.delay(now) == 86400  # Idle refresh
+
+    def test_delay_3(self):
+        assert self.scheduler.delay(self.race.end + timedelta(seconds=60)) == 60
+
+    def test_delay_4(self):
+        now = self.race.end + timedelta(seconds=120)
+        delays = []
+        for _ in range(4):
+            self.scheduler.polled(now)
+            delays.append(self.scheduler.delay(now))
+            now += timedelta(seconds=delays[-1])
+        assert delays == [240, 480, 600, 600]  # Exponential backoff, up to the limit
+
+    def test_delay_5(self):
+        now = self.race.end + timedelta(seconds=3600)  # Results no longer awaited
+        assert self.scheduler.awaited(now) == []
+        assert self.scheduler.delay(now) == 86400
+
+    def test_delay_6(self):
+        now = self.race.end + timedelta(seconds=3600)
+        delays = []
+        for _ in range(6):
+            self.scheduler.failed()
+            delays.append(self.scheduler.delay(now))
+        assert delays == [120, 240, 480, 600, 600, 600]  # Failed refreshes retried with backoff
+        self.scheduler.update(self.data)
+        assert self.scheduler.delay(now) == 86400
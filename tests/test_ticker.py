@@ -0,0 +1,49 @@
+from unittest import mock
+
+import pytest
+
+from renderer.ticker import Ticker
+
+
+class FakeClock:
+    """Monotonic clock only advanced by sleeps"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float):
+        self.now += delay
+
+
+class TestTicker:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.clock = FakeClock()
+        with mock.patch('time.monotonic', self.clock.monotonic), mock.patch('time.sleep', self.clock.sleep):
+            yield
+
+    def test_wait(self):
+        ticker = Ticker(0.02)
+        start = self.clock.now
+        for _ in range(6):
+            ticker.wait()
+            self.clock.sleep(0.01)  # Render time is absorbed by the interval
+        assert self.clock.now - start == pytest.approx(0.11)
+
+    def test_wait_2(self):
+        ticker = Ticker(0.01)
+        ticker.wait()
+        self.clock.sleep(0.05)  # Stalled frame
+        ticker.wait()
+        assert ticker.dropped == 1
+
+    def test_fps(self):
+        ticker = Ticker(0.01)
+        assert ticker.target_fps == 100
+        assert ticker.achieved_fps == 0
+        for _ in range(5):
+            ticker.wait()
+        assert ticker.achieved_fps == pytest.approx(100)
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+import requests
+
+from api.cache import ResponseCache
+from api.client import Client
+from api.transport import Fault, ReplayTransport
+
+
+class TestReplayTransport:
+    def setup_method(self):
+        self.url = 'https://api.jolpi.ca/ergast/f1/current/next/qualifying'
+
+    def client(self, tmp_path, **kwargs) -> Client:
+        return Client(ResponseCache(str(tmp_path)), backoff=0, transport=ReplayTransport(**kwargs))
+
+    def test_get_json(self, tmp_path):
+        client = self.client(tmp_path)
+        response = client.get_json(self.url)
+        assert response['MRData']['RaceTable']['Races'][0]['Circuit']['circuitId'] == 'interlagos'
+
+    def test_get_json_2(self, tmp_path):
+        client = self.client(tmp_path)
+        client.get_json(self.url)
+        client.get_json(self.url)  # Stale, revalidated with ETag
+        assert client.get(self.url, {'If-None-Match': client.cache.get(self.url).etag}).status_code == 304
+
+    def test_get(self, tmp_path):
+        client = self.client(tmp_path)
+        assert client.get('https://api.jolpi.ca/ergast/f1/current/unknown').status_code == 404
+
+    def test_latency(self, tmp_path):
+        client = self.client(tmp_path, latency=0.05)
+        start = time.monotonic()
+        client.get(self.url)
+        assert time.monotonic() - start >= 0.05
+
+    def test_rate_limit(self, tmp_path):
+        client = self.client(tmp_path, faults={'next/qualifying': [429, 503]})
+        assert client.get(self.url).status_code == 200
+        assert len(client.session.get_adapter(self.url).requests) == 3
+
+    def test_errors(self, tmp_path):
+        client = self.client(tmp_path, faults={'*': [500] * 4})
+        with pytest.raises(requests.HTTPError):
+            client.get_json(self.url)
+
+    def test_timeout(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), retries=1, backoff=0,
+                        transport=ReplayTransport(faults={'*': [Fault.TIMEOUT, Fault.CONNECTION_ERROR]}))
+        with pytest.raises(requests.ConnectionError):
+            client.get(self.url)
+
+    def test_timeout_2(self, tmp_path):
+        client = Client(ResponseCache(str(tmp_path)), retries=0, transport=ReplayTransport(latency=0.05))
+        with pytest.raises(requests.ReadTimeout):
+            client.get(self.url, timeout=(0.01, 0.01))
+
+    def test_truncated(self, tmp_path):
+        client = self.client(tmp_path, faults={'next/qualifying': [Fault.TRUNCATED]})
+        with pytest.raises(ValueError):
+            client.get_json(self.url)
+        assert client.cache.get(self.url) is None  # Truncated payload not cached
+        assert client.get_json(self.url)['MRData']['total'] == '20'
@@ -83,3 +83,33 @@ class TestUtils:
         time = datetime.now().astimezone(tz=None) - timedelta(hours=3)
         result = utils.get_session_status(time)
         assert result == SessionStatus.FINISHED
+
+    def test_get_session_status_4(self):
+        time = datetime.now().astimezone(tz=None) - timedelta(hours=1)
+        result = utils.get_session_status(time, duration=30 * 60)
+        assert result == SessionStatus.FINISHED
+
+    def test_countdown(self):
+        assert utils.countdown(timedelta(days=2, hours=4, minutes=13, seconds=7)) == '2d 04:13:07'
+
+    def test_countdown_2(self):
+        assert utils.countdown(timedelta(minutes=5, seconds=0.5)) == '00:05:00'
+
+    def test_countdown_3(self):
+        assert utils.countdown(timedelta(seconds=-3)) == '00:00:00'
+
+    def test_image_cache(self):
+        cache = utils.ImageCache(max_size=1)
+        cache.put(('a.png', (15, 15), utils.Color.BLACK), Image.new('RGB', (15, 15)))
+        cache.put(('b.png', (15, 15), utils.Color.BLACK), Image.new('RGB', (15, 15)))
+        assert cache.get(('a.png', (15, 15), utils.Color.BLACK)) is None
+        assert cache.stats() == {'size': 1, 'hits': 0, 'misses': 1, 'evictions': 1}
+
+    def test_load_image_cached(self):
+        utils.image_cache.clear()
+        image = utils.load_image('assets/img/error.png', (15, 15))
+        assert utils.load_image('assets/img/error.png', (15, 15)) is image
+
+    def test_load_image_cached_2(self):
+        image = utils.load_image('assets/img/error.png', (15, 15))
+        assert utils.load_image('assets/img/error.png', (10, 10)) is not image
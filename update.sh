@@ -20,10 +20,16 @@ function installDependencies() {
   sudo pip3 install -r requirements.txt
 }
 
+function buildAtlas() {
+  printf "\nBuilding sprite atlas...\n"
+  python3 -m matrix.atlas
+}
+
 function main() {
   clean
   updateRepository
   installDependencies
+  buildAtlas
 
   chmod +x install.sh update.sh
 
@@ -3,9 +3,12 @@ import argparse
 import json
 import logging
 import os
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
 
 from PIL import Image, ImageFont, BdfFontFile
 try:
@@ -13,7 +16,7 @@ try:
 except ModuleNotFoundError:  # used for testing
     from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions
 
-from constants import FONTS_DIR, LIB_FONTS_DIR
+from constants import FONTS_DIR, LIB_FONTS_DIR, IMAGE_CACHE_SIZE, RACE_DURATION
 from data.session_status import SessionStatus
 
 
@@ -111,11 +114,104 @@ def convert_font(filename: str) -> str:
         return name
 
 
+class ImageCache:
+    """
+    Bounded LRU cache of decoded & resized images, keyed by (path, size, background)
+
+    Arguments:
+        max_size (int):         Maximum number of images held
+
+    Attributes:
+        atlas (matrix.Atlas):   Pre-baked sprites of the layout in use, looked up before decoding
+        hits (int):             Lookups served from cache
+        misses (int):           Lookups requiring the image to be loaded
+        evictions (int):        Images evicted to stay within max_size
+    """
+
+    def __init__(self, max_size: int = IMAGE_CACHE_SIZE):
+        self.max_size = max_size
+        self.atlas = None
+        self.images = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    def get(self, key: tuple) -> Optional[Image.Image]:
+        with self.lock:
+            image = self.images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self.images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: tuple, image: Image.Image):
+        with self.lock:
+            self.images[key] = image
+            self.images.move_to_end(key)
+            while len(self.images) > self.max_size:
+                self.images.popitem(last=False)
+                self.evictions += 1
+
+    def prewarm(self, assets: Iterable[Tuple[str, Tuple[int, int]]], background: tuple = Color.BLACK):
+        """
+        Load images ahead of time, e.g. the next GP's circuit assets
+        @param assets: (path, size) pairs
+        @param background: Background color for PNG images
+        """
+        for filename, size in assets:
+            if filename:
+                load_image(filename, size, background)
+
+    def stats(self) -> dict:
+        return {'size': len(self.images), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def clear(self):
+        with self.lock:
+            self.images.clear()
+
+
+image_cache = ImageCache()
+
+
 def load_image(filename: str,
                size: Tuple[int, int],
                background: tuple = Color.BLACK) -> Image:
     """
-    Open Image file from given path
+    Open Image file from given path. Images are cached, and must not be modified by the caller.
+    @param filename: Path to the image file
+    @param size: Maximum width and height of the image
+    @param background: Background color for PNG images
+    @return: Image file
+    """
+    key = filename, tuple(size), tuple(background)
+    image = image_cache.get(key)
+    if image is None:
+        if image_cache.atlas is not None:
+            image = image_cache.atlas.get(filename, size, background)
+        if image is None:
+            image = decode_image(filename, size, background)
+        if image is not None:
+            image_cache.put(key, image)
+    return image
+
+
+def asset_exists(filename: str) -> bool:
+    """
+    Determine if an asset exists, from the sprite atlas index if available
+    @param filename: Path to the asset
+    @return: bool value
+    """
+    if image_cache.atlas is not None and filename in image_cache.atlas:
+        return True
+    return os.path.isfile(filename)
+
+
+def decode_image(filename: str,
+                 size: Tuple[int, int],
+                 background: tuple = Color.BLACK) -> Image:
+    """
+    Decode & resize Image file from given path
     @param filename: Path to the image file
     @param size: Maximum width and height of the image
     @param background: Background color for PNG images
@@ -137,6 +233,49 @@ def load_image(filename: str,
     logging.error(f"Couldn't find image {filename}")
 
 
+class FontMetrics:
+    """
+    Glyph advance table of a bitmap font, to measure text arithmetically instead of through PIL
+
+    Arguments:
+        font (PIL.ImageFont):       Bitmap font
+
+    Attributes:
+        advances (dict):            Character -> advance width
+        height (int):               Line height
+    """
+
+    def __init__(self, font: ImageFont.ImageFont):
+        self.advances = {chr(code): font.getbbox(chr(code))[2] for code in range(32, 256)}
+        self.height = font.getbbox(' ')[3]
+
+    def size(self, text: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the width and height of a single line of text
+        @param text: Text to get the size of
+        @return: text size (width, height), or None if text has characters without a glyph
+        """
+        width = 0
+        for char in text:
+            advance = self.advances.get(char)
+            if advance is None:
+                return None
+            width += advance
+        return width, self.height
+
+
+font_metrics = weakref.WeakKeyDictionary()  # ImageFont -> FontMetrics
+
+
+def load_font_metrics(font: ImageFont.ImageFont):
+    """
+    Build the glyph advance table of a bitmap font, used by get_text_size
+    @param font: Bitmap font
+    """
+    if isinstance(font, ImageFont.ImageFont) and font not in font_metrics:
+        font_metrics[font] = FontMetrics(font)
+
+
 def get_text_size(draw, text, font) -> Tuple[int, int]:
     """
     Get the width and height of a string of text given a font
@@ -145,6 +284,11 @@ def get_text_size(draw, text, font) -> Tuple[int, int]:
     @param font: Font to use to draw text
     @return: text size (width, height)
     """
+    metrics = font_metrics.get(font) if font is not None else None
+    if metrics is not None:
+        size = metrics.size(text)
+        if size is not None:
+            return size
     text_bbox = draw.textbbox((0, 0), text, font)
     return text_bbox[2] - text_bbox[0], text_bbox[3] - text_bbox[1]
 
@@ -218,24 +362,11 @@ def convert_time(date: str, time: str) -> datetime:
     @param time: GP's time (UTC)
     @return: GP's date & time (user's local timezone)
     """
-    dt = datetime.strptime(f'{date} {time}'.replace('Z', ''), '%Y-%m-%d %H:%M:%S')
+    dt = datetime.fromisoformat(f"{date}T{time.rstrip('Z')}")
     dt = dt.replace(tzinfo=timezone.utc).astimezone(tz=None)  # Convert to local timezone
     return dt
 
 
-def race_weekend(date: datetime) -> bool:
-    """
-    Determine if today is race weekend (i.e. Practice, Qualifying, or Race day).
-    @param date: GP's date
-    @return: race_weekend: bool
-    """
-    today = datetime.today()
-    if today.weekday() > 3:  # is weekend
-        gp_day = date.date().day
-        return gp_day - 2 <= today.day <= gp_day
-    return False
-
-
 def is_wdc_champion(races: list, standings) -> bool:
     """
     Determine if there's a champion for the World Driver's Championship
@@ -264,14 +395,15 @@ def is_wcc_champion(races: list, standings) -> bool:
     return standings.items[1].points + max_remaining_pts < standings.items[0].points
 
 
-def get_session_status(start_time: datetime) -> SessionStatus:
+def get_session_status(start_time: datetime, duration: float = RACE_DURATION) -> SessionStatus:
     """
     Roughly determine the session's current status. Does not account for delays.
     @param start_time: GP's start date & time
+    @param duration: Session's expected duration in seconds
     @return: status: GP's status
     """
     now = datetime.now().astimezone(tz=None)
-    end_time = start_time + timedelta(hours=2)
+    end_time = start_time + timedelta(seconds=duration)
     if now < start_time:
         return SessionStatus.UPCOMING
     elif start_time < now <= end_time:
@@ -280,6 +412,20 @@ def get_session_status(start_time: datetime) -> SessionStatus:
         return SessionStatus.FINISHED
 
 
+def countdown(delta: timedelta) -> str:
+    """
+    Format the time left until a session, e.g. 2d 04:13:07
+    @param delta: Time left
+    @return: Countdown text
+    """
+    seconds = max(int(delta.total_seconds()), 0)
+    days, seconds = divmod(seconds, 24 * 60 * 60)
+    hours, seconds = divmod(seconds, 60 * 60)
+    minutes, seconds = divmod(seconds, 60)
+    text = f'{hours:02}:{minutes:02}:{seconds:02}'
+    return f'{days}d {text}' if days else text
+
+
 def args() -> argparse.Namespace:
     """
     CLI argument parser to configure matrix.
@@ -397,6 +543,14 @@ def args() -> argparse.Namespace:
                         help='Switch if your matrix has led colors swapped. (Default: RGB)',
                         type=str,
                         default='RGB')
+    parser.add_argument('--metrics-file',
+                        action='store',
+                        help='Periodically write metrics to this file, in Prometheus text format.',
+                        type=str)
+    parser.add_argument('--metrics-port',
+                        action='store',
+                        help='Serve metrics over HTTP on this port, at /metrics.',
+                        type=int)
 
     return parser.parse_args()
 